@@ -9,11 +9,15 @@ __version__ = "1.0.0"
 __author__ = "Christian Britton"
 __license__ = "MIT"
 
+from typing import TYPE_CHECKING, Any
+
 from loggem.analyzer.log_analyzer import LogAnalyzer
 from loggem.core.models import Anomaly, LogEntry, Severity
 from loggem.detector.anomaly_detector import AnomalyDetector
 from loggem.detector.model_manager import ModelManager
-from loggem.parsers.factory import LogParserFactory
+
+if TYPE_CHECKING:
+    from loggem.parsers.factory import LogParserFactory
 
 __all__ = [
     "LogEntry",
@@ -24,3 +28,13 @@ __all__ = [
     "ModelManager",
     "LogAnalyzer",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the parser factory (and with it every parser) on first use."""
+    if name == "LogParserFactory":
+        from loggem.parsers.factory import LogParserFactory
+
+        globals()[name] = LogParserFactory
+        return LogParserFactory
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -36,10 +36,15 @@ class ModelConfig(BaseSettings):
         default=Path("./models"),
         description="Directory to cache models (HuggingFace only)",
     )
-    quantization: Literal["int8", "fp16", "fp32"] = Field(
+    quantization: Literal["int8", "nf4", "int4", "fp8", "fp16", "fp32"] = Field(
         default="int8",
         description="Model quantization level (HuggingFace only)",
     )
+    llm_int8_threshold: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Outlier threshold for int8 quantization; 0 keeps all math in int8",
+    )
     max_length: int = Field(
         default=2048,
         ge=128,
@@ -60,12 +65,25 @@ class ModelConfig(BaseSettings):
         default=None,
         description="Organization ID (OpenAI only)",
     )
+    batch_api: bool = Field(
+        default=False,
+        description="Submit batched prompts through the Batch API (OpenAI only)",
+    )
 
     # Advanced settings
     trust_remote_code: bool = Field(
         default=False,
         description="Whether to trust remote code in models (HuggingFace only)",
     )
+    compile: bool = Field(
+        default=False,
+        description="Compile the model with torch.compile (HuggingFace only)",
+    )
+    cache_size: int = Field(
+        default=4096,
+        ge=0,
+        description="Maximum number of cached responses to identical prompts (0 disables)",
+    )
 
 
 class DetectionConfig(BaseSettings):
@@ -197,6 +215,11 @@ class Settings(BaseSettings):
         le=32,
         description="Maximum worker threads",
     )
+    parallel_parse_min_size: int = Field(
+        default=64 * 1024 * 1024,  # 64 MB
+        ge=0,
+        description="Parse files at least this large (bytes) across worker processes; 0 disables",
+    )
 
     @field_validator("data_dir", "temp_dir")
     @classmethod
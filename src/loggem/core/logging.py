@@ -4,16 +4,133 @@ Structured logging configuration for LogGem.
 Uses structlog for structured, machine-readable logs with human-friendly output.
 """
 
+import atexit
+import io
+import json
 import logging
+import os
+import queue
 import sys
+import threading
+import time
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 import structlog
 from structlog.types import Processor
 
 from loggem.core.config import get_settings
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps_bytes(obj: Any, **kwargs: Any) -> bytes:
+    """
+    Serialize a log event to JSON bytes, using orjson when installed.
+
+    Keyword arguments are those of json.dumps, with ``default`` defaulting
+    to str. orjson only supports ``default``, so calls passing other options,
+    and events orjson rejects (such as integers wider than 64 bits), are
+    serialized with json.dumps instead.
+    """
+    default = kwargs.setdefault("default", str)
+    if ORJSON_AVAILABLE and len(kwargs) == 1:
+        try:
+            return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(obj, **kwargs).encode()
+
+
+def _dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log event to a JSON string, like _dumps_bytes()."""
+    return _dumps_bytes(obj, **kwargs).decode()
+
+
+class _SwappableSink:
+    """
+    Buffered binary log file whose underlying file can be replaced.
+
+    structlog loggers cached on first use keep the file object they were
+    created with, so reconfiguring swaps (and closes) the file behind this
+    sink instead of opening another writer next to it.
+
+    structlog flushes its file after every event, so flush() is a no-op;
+    buffered events reach the file at most ``FLUSH_INTERVAL`` seconds later,
+    when the file is replaced or closed, and at interpreter exit.
+    """
+
+    BUFFER_SIZE = 1 << 16
+    FLUSH_INTERVAL = 1.0
+
+    def __init__(self) -> None:
+        self._file: Optional[io.BufferedWriter] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._flusher: Optional[threading.Thread] = None
+        self._stop_flusher = threading.Event()
+
+    def open(self, path: Path) -> None:
+        """Start writing to ``path``, flushing and closing any previous file."""
+        new_file = io.BufferedWriter(io.FileIO(path, "ab"), buffer_size=self.BUFFER_SIZE)
+        with self._lock:
+            old_file, self._file = self._file, new_file
+            self._dirty = False
+            if old_file is not None:
+                old_file.close()
+            if self._flusher is None:
+                self._stop_flusher = threading.Event()
+                self._flusher = threading.Thread(
+                    target=self._flush_periodically,
+                    args=(self._stop_flusher,),
+                    name="loggem-log-flush",
+                    daemon=True,
+                )
+                self._flusher.start()
+
+    def write(self, data: bytes) -> int:
+        """Write rendered log lines to the current file's buffer."""
+        with self._lock:
+            if self._file is None:
+                raise ValueError("log sink is not open")
+            self._dirty = True
+            return self._file.write(data)
+
+    def flush(self) -> None:
+        """Ignore structlog's per-event flush; see sync()."""
+
+    def sync(self) -> None:
+        """Write buffered events to the current file, if any."""
+        with self._lock:
+            if self._file is not None and self._dirty:
+                self._file.flush()
+                self._dirty = False
+
+    def close(self) -> None:
+        """Flush and close the current file and stop the periodic flush."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._stop_flusher.set()
+            self._flusher = None
+
+    def _flush_periodically(self, stop: threading.Event) -> None:
+        """Sync the buffer every ``FLUSH_INTERVAL`` seconds until ``stop`` is set."""
+        while not stop.wait(self.FLUSH_INTERVAL):
+            self.sync()
+
+
+# Target of setup_logging_bytes(), shared across reconfigurations
+_BYTES_SINK = _SwappableSink()
+atexit.register(_BYTES_SINK.sync)
+
 
 def setup_logging(log_file: Optional[Path] = None, level: str = "INFO") -> None:
     """
@@ -57,7 +174,7 @@ def setup_logging(log_file: Optional[Path] = None, level: str = "INFO") -> None:
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
         logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=structlog.make_filtering_bound_logger(getattr(logging, level.upper())),
         cache_logger_on_first_use=True,
     )
 
@@ -83,7 +200,7 @@ def setup_logging(log_file: Optional[Path] = None, level: str = "INFO") -> None:
                 foreign_pre_chain=shared_processors,
                 processors=[
                     structlog.stdlib.ProcessorFormatter.remove_processors_meta,
-                    structlog.processors.JSONRenderer(),
+                    structlog.processors.JSONRenderer(serializer=_dumps, default=str),
                 ],
             )
         )
@@ -102,6 +219,36 @@ def setup_logging(log_file: Optional[Path] = None, level: str = "INFO") -> None:
     logging.getLogger("urllib3").setLevel(logging.WARNING)
 
 
+def setup_logging_bytes(log_file: Path, level: str = "INFO") -> None:
+    """
+    Configure structlog to write JSON lines straight to a file.
+
+    Bypasses stdlib logging entirely: events are rendered to bytes and written
+    to a buffered binary file, which avoids handler locks on hot ingest paths.
+    There is no console output in this mode.
+
+    Args:
+        log_file: File path for logging output
+        level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+    """
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    _BYTES_SINK.open(log_file)
+
+    structlog.configure(
+        processors=[
+            structlog.contextvars.merge_contextvars,
+            structlog.processors.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.StackInfoRenderer(),
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(serializer=_dumps_bytes, default=str),
+        ],
+        logger_factory=structlog.BytesLoggerFactory(_BYTES_SINK),
+        wrapper_class=structlog.make_filtering_bound_logger(getattr(logging, level.upper())),
+        cache_logger_on_first_use=True,
+    )
+
+
 def get_logger(name: str) -> Any:
     """
     Get a logger instance for the given name.
@@ -115,13 +262,24 @@ def get_logger(name: str) -> Any:
     return structlog.get_logger(name)
 
 
+# Queued audit item: an event tuple, a flush request, or the stop sentinel
+_AuditRecord = Union[tuple[str, str, str, dict[str, Any]], threading.Event, None]
+
+
 class AuditLogger:
     """
     Audit logger for security-relevant events.
 
     Provides a separate audit trail for compliance and security analysis.
+    Events are queued by the caller and written by a background thread in
+    batches, so detection throughput is not coupled to disk latency.
     """
 
+    QUEUE_SIZE = 10_000
+    BATCH_SIZE = 256
+    BUFFER_SIZE = 1 << 16
+    FLUSH_INTERVAL = 1.0
+
     def __init__(self, audit_file: Optional[Path] = None) -> None:
         """
         Initialize audit logger.
@@ -131,6 +289,7 @@ class AuditLogger:
         """
         settings = get_settings()
         self.enabled = settings.security.enable_audit_log
+        self.dropped = 0
 
         if not self.enabled:
             return
@@ -139,26 +298,137 @@ class AuditLogger:
             audit_file = settings.data_dir / "audit.log"
 
         audit_file.parent.mkdir(parents=True, exist_ok=True)
+        self.audit_file = audit_file
+
+        # Background writer draining a bounded queue
+        self._queue: queue.Queue[_AuditRecord] = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self._thread = threading.Thread(target=self._drain, name="loggem-audit", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _drain(self) -> None:
+        """Run the writer, releasing every flush() waiter if it dies."""
+        batch: list[_AuditRecord] = []
+        try:
+            self._write_batches(batch)
+        finally:
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            for record in batch:
+                if isinstance(record, threading.Event):
+                    record.set()
+
+    def _write_batches(self, batch: list[_AuditRecord]) -> None:
+        """
+        Write queued events to the audit file.
 
-        # Create separate audit logger
-        self.logger = logging.getLogger("loggem.audit")
-        self.logger.setLevel(logging.INFO)
-        self.logger.propagate = False
-
-        # File handler for audit logs
-        handler = logging.FileHandler(str(audit_file))
-        handler.setFormatter(
-            logging.Formatter(
-                '{"timestamp": "%(asctime)s", "level": "%(levelname)s", '
-                '"event": "%(message)s", "extra": %(extra)s}'
-            )
-        )
-        self.logger.addHandler(handler)
+        Output goes through a large write buffer that is flushed and fsynced
+        at most once per ``FLUSH_INTERVAL`` while events keep arriving, when
+        the queue goes idle, or when a caller explicitly asks for a flush.
+
+        Args:
+            batch: Filled with the records of the batch in progress
+        """
+        with open(self.audit_file, "ab", buffering=self.BUFFER_SIZE) as f:
+            dirty = False
+            last_flush = time.monotonic()
+            running = True
+            while running:
+                try:
+                    batch[:] = [self._queue.get(timeout=self.FLUSH_INTERVAL)]
+                except queue.Empty:
+                    if dirty:
+                        f.flush()
+                        os.fsync(f.fileno())
+                        dirty = False
+                        last_flush = time.monotonic()
+                    continue
+
+                while len(batch) < self.BATCH_SIZE:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                lines = []
+                waiters = []
+                for record in batch:
+                    if record is None:
+                        running = False
+                    elif isinstance(record, threading.Event):
+                        waiters.append(record)
+                    else:
+                        timestamp, severity, event, extra = record
+                        lines.append(
+                            _dumps_bytes(
+                                {
+                                    "timestamp": timestamp,
+                                    "level": severity,
+                                    "event": event,
+                                    "extra": extra,
+                                }
+                            )
+                        )
+
+                if lines:
+                    lines.append(b"")
+                    f.write(b"\n".join(lines))
+                    dirty = True
+
+                now = time.monotonic()
+                if dirty and (waiters or not running or now - last_flush >= self.FLUSH_INTERVAL):
+                    f.flush()
+                    os.fsync(f.fileno())
+                    dirty = False
+                    last_flush = now
+
+                for waiter in waiters:
+                    waiter.set()
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _put_control(self, record: _AuditRecord) -> bool:
+        """
+        Queue a control record for the writer, waiting while the queue is full.
+
+        Returns:
+            False if the writer thread exited before the record was queued
+        """
+        while self._thread.is_alive():
+            try:
+                self._queue.put(record, timeout=self.FLUSH_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def flush(self) -> None:
+        """Block until all queued events have been written and synced to disk."""
+        if not self.enabled:
+            return
+        done = threading.Event()
+        if not self._put_control(done):
+            return
+        while not done.wait(self.FLUSH_INTERVAL):
+            if not self._thread.is_alive():
+                return
+
+    def close(self) -> None:
+        """Flush pending events and stop the background writer."""
+        if not self.enabled or not self._put_control(None):
+            return
+        while self._thread.is_alive():
+            self._thread.join(self.FLUSH_INTERVAL)
 
     def log_event(self, event: str, severity: str = "INFO", **kwargs: Any) -> None:
         """
         Log an audit event.
 
+        Events are dropped (and counted in ``dropped``) if the queue is full.
+
         Args:
             event: Event description
             severity: Severity level
@@ -167,11 +437,11 @@ class AuditLogger:
         if not self.enabled:
             return
 
-        import json
-
-        extra_json = json.dumps(kwargs)
-        log_method = getattr(self.logger, severity.lower(), self.logger.info)
-        log_method(event, extra={"extra": extra_json})
+        timestamp = datetime.now(timezone.utc).isoformat()
+        try:
+            self._queue.put_nowait((timestamp, severity.upper(), event, kwargs))
+        except queue.Full:
+            self.dropped += 1
 
     def log_file_access(self, file_path: Path, operation: str, user: Optional[str] = None) -> None:
         """Log file access for audit purposes."""
@@ -8,13 +8,27 @@ for representing log entries, anomalies, and related metadata.
 from __future__ import annotations
 
 import hashlib
+import os
+import random
 from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+# Non-cryptographic generator for record IDs. IDs identify entries and
+# anomalies within a run; they are not secrets, so they do not need a
+# getrandom() syscall per log line.
+_id_rng = random.Random()  # noqa: S311
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_id_rng.seed)
+
+
+def _new_id() -> UUID:
+    """Generate a random (version 4) UUID without reading OS entropy."""
+    return UUID(int=_id_rng.getrandbits(128), version=4)
+
 
 class Severity(str, Enum):
     """Severity levels for anomalies."""
@@ -24,14 +38,32 @@ class Severity(str, Enum):
     HIGH = "high"
     CRITICAL = "critical"
 
-    def __lt__(self, other: Severity) -> bool:
+    # All four comparisons are defined explicitly: str already provides them,
+    # so functools.total_ordering would not replace the alphabetical ones.
+    def __lt__(self, other: Severity) -> bool:  # type: ignore[override]
+        """Allow severity comparison."""
+        return _SEVERITY_RANK[self] < _SEVERITY_RANK[other]
+
+    def __le__(self, other: Severity) -> bool:  # type: ignore[override]
+        """Allow severity comparison."""
+        return _SEVERITY_RANK[self] <= _SEVERITY_RANK[other]
+
+    def __gt__(self, other: Severity) -> bool:  # type: ignore[override]
         """Allow severity comparison."""
-        order = [self.LOW, self.MEDIUM, self.HIGH, self.CRITICAL]
-        return order.index(self) < order.index(other)
+        return _SEVERITY_RANK[self] > _SEVERITY_RANK[other]
 
-    def __le__(self, other: Severity) -> bool:
+    def __ge__(self, other: Severity) -> bool:  # type: ignore[override]
         """Allow severity comparison."""
-        return self == other or self < other
+        return _SEVERITY_RANK[self] >= _SEVERITY_RANK[other]
+
+
+# Precomputed ordering used by Severity comparisons
+_SEVERITY_RANK = {
+    Severity.LOW: 0,
+    Severity.MEDIUM: 1,
+    Severity.HIGH: 2,
+    Severity.CRITICAL: 3,
+}
 
 
 class AnomalyType(str, Enum):
@@ -49,6 +81,13 @@ class AnomalyType(str, Enum):
     UNKNOWN = "unknown"
 
 
+# Levels LogEntry keeps; anything else is normalized to INFO. Values are the
+# shared canonical strings, so entries do not each hold a copy of their level.
+_VALID_LEVELS = {
+    level: level for level in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL", "NOTICE", "ALERT")
+}
+
+
 class LogEntry(BaseModel):
     """
     Represents a single log entry from any source.
@@ -69,9 +108,9 @@ class LogEntry(BaseModel):
         raw: Original raw log line
     """
 
-    model_config = ConfigDict(frozen=False, validate_assignment=True)
+    model_config = ConfigDict(frozen=True)
 
-    id: UUID = Field(default_factory=uuid4, description="Unique identifier")
+    id: UUID = Field(default_factory=_new_id, description="Unique identifier")
     timestamp: datetime = Field(description="Log entry timestamp")
     source: str = Field(description="Source of the log entry")
     message: str = Field(description="Log message content")
@@ -88,6 +127,9 @@ class LogEntry(BaseModel):
         """Sanitize string inputs to prevent injection attacks."""
         if not isinstance(v, str):
             raise ValueError("Must be a string")
+        # Most lines have nothing to remove; skip the per-character rebuild for them
+        if v.isprintable():
+            return v[:10000]
         # Remove null bytes and control characters (except newlines/tabs)
         sanitized = "".join(char for char in v if char.isprintable() or char in "\n\t")
         return sanitized[:10000]  # Limit length to prevent memory issues
@@ -96,31 +138,34 @@ class LogEntry(BaseModel):
     @classmethod
     def validate_level(cls, v: str) -> str:
         """Validate and normalize log level."""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL", "NOTICE", "ALERT"]
-        normalized = v.upper()
-        if normalized not in valid_levels:
-            return "INFO"  # Default to INFO for unknown levels
-        return normalized
+        # Default to INFO for unknown levels
+        return _VALID_LEVELS.get(v) or _VALID_LEVELS.get(v.upper(), "INFO")
+
+    def _content_hasher(self) -> hashlib.blake2b:
+        """Build a BLAKE2b-160 hasher over the deduplication-relevant fields."""
+        h = hashlib.blake2b(digest_size=20)
+        h.update(self.timestamp.isoformat().encode())
+        h.update(b"|")
+        h.update(self.source.encode())
+        h.update(b"|")
+        h.update(self.message.encode())
+        h.update(b"|")
+        h.update((self.host or "").encode())
+        h.update(b"|")
+        h.update((self.user or "").encode())
+        return h
 
     def get_hash(self) -> str:
         """Generate a hash of the log entry for deduplication."""
-        content = f"{self.timestamp}{self.source}{self.message}{self.host}{self.user}"
-        return hashlib.sha256(content.encode()).hexdigest()
+        return self._content_hasher().hexdigest()
+
+    def get_hash_bytes(self) -> bytes:
+        """Generate a compact 20-byte digest for use as a deduplication key."""
+        return self._content_hasher().digest()
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return {
-            "id": str(self.id),
-            "timestamp": self.timestamp.isoformat(),
-            "source": self.source,
-            "message": self.message,
-            "level": self.level,
-            "host": self.host,
-            "user": self.user,
-            "process": self.process,
-            "metadata": self.metadata,
-            "raw": self.raw,
-        }
+        return self.model_dump(mode="json")
 
 
 class Anomaly(BaseModel):
@@ -141,9 +186,9 @@ class Anomaly(BaseModel):
         metadata: Additional detection metadata
     """
 
-    model_config = ConfigDict(frozen=False)
+    model_config = ConfigDict(frozen=True)
 
-    id: UUID = Field(default_factory=uuid4, description="Unique identifier")
+    id: UUID = Field(default_factory=_new_id, description="Unique identifier")
     log_entry_id: UUID = Field(description="Associated log entry ID")
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Detection time")
     severity: Severity = Field(description="Severity level")
@@ -163,19 +208,7 @@ class Anomaly(BaseModel):
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return {
-            "id": str(self.id),
-            "log_entry_id": str(self.log_entry_id),
-            "timestamp": self.timestamp.isoformat(),
-            "severity": self.severity.value,
-            "anomaly_type": self.anomaly_type.value,
-            "description": self.description,
-            "confidence": self.confidence,
-            "context": self.context,
-            "indicators": self.indicators,
-            "recommendation": self.recommendation,
-            "metadata": self.metadata,
-        }
+        return self.model_dump(mode="json")
 
 
 class AnalysisResult(BaseModel):
@@ -191,7 +224,7 @@ class AnalysisResult(BaseModel):
         timestamp: When the analysis was completed
     """
 
-    model_config = ConfigDict(frozen=False)
+    model_config = ConfigDict(frozen=True)
 
     total_entries: int = Field(ge=0, description="Total entries analyzed")
     anomalies: list[Anomaly] = Field(default_factory=list, description="Detected anomalies")
@@ -210,11 +243,4 @@ class AnalysisResult(BaseModel):
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return {
-            "total_entries": self.total_entries,
-            "anomalies": [a.to_dict() for a in self.anomalies],
-            "patterns": self.patterns,
-            "statistics": self.statistics,
-            "duration": self.duration,
-            "timestamp": self.timestamp.isoformat(),
-        }
+        return self.model_dump(mode="json")
@@ -6,8 +6,12 @@ Uses Gemma 3 (or other LLMs) to identify suspicious patterns and anomalies.
 
 from __future__ import annotations
 
+import itertools
 import json
 import re
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from loggem.core.config import get_settings
@@ -16,7 +20,49 @@ from loggem.core.models import Anomaly, AnomalyType, LogEntry, Severity
 from loggem.detector.model_manager import ModelManager
 
 logger = get_logger(__name__)
-audit_logger = get_audit_logger()
+
+# Maximum number of previous entries shown to the model as context
+_MAX_PROMPT_CONTEXT = 10
+
+# Lower temperature for more consistent analysis
+_ANALYSIS_TEMPERATURE = 0.3
+
+# Enum values accepted from model responses
+_SEVERITY_VALUES = frozenset(s.value for s in Severity)
+_ANOMALY_TYPE_VALUES = frozenset(t.value for t in AnomalyType)
+
+# Metadata keys worth showing to the model
+_PROMPT_METADATA_KEYS = frozenset({"status", "method", "path", "event_type", "command"})
+
+
+def _render_prompt_template(key: int) -> str:
+    """Build the %-format prompt template for a host/user/process/metadata bitmask."""
+    lines = ["%s\n\n%sAnalyze this log entry:\nTimestamp: %s\nSource: %s\nLevel: %s\n"]
+    if key & 8:
+        lines.append("Host: %s\n")
+    if key & 4:
+        lines.append("User: %s\n")
+    if key & 2:
+        lines.append("Process: %s\n")
+    lines.append("Message: %s\n\n")
+    if key & 1:
+        lines.append("Metadata: %s\n\n")
+    lines.append("Response (JSON only):")
+    return "".join(lines)
+
+
+# One template per combination of optional fields, indexed by bitmask
+_PROMPT_TEMPLATES = tuple(_render_prompt_template(key) for key in range(16))
+
+
+def _format_context_line(entry: LogEntry) -> str:
+    """Format a log entry as a single prompt context line."""
+    return f"[{entry.timestamp.isoformat()}] {entry.level}: {entry.message}\n"
+
+
+def _format_context_block(lines: Iterable[str]) -> str:
+    """Wrap formatted context lines in the prompt's context section."""
+    return "Context (previous log entries):\n" + "".join(lines) + "\n"
 
 
 class AnomalyDetector:
@@ -98,33 +144,85 @@ Respond ONLY with the JSON object, no additional text."""
             Anomaly if detected, None otherwise
         """
         self._ensure_model_loaded()
+        return self._analyze(entry, self._build_prompt(entry, context))
 
-        # Build prompt with context
-        prompt = self._build_prompt(entry, context)
+    def _analyze(self, entry: LogEntry, prompt: str) -> Optional[Anomaly]:
+        """
+        Run the model on a prepared prompt and apply the confidence threshold.
+
+        Args:
+            entry: Log entry being analyzed
+            prompt: Fully rendered prompt for the entry
 
-        # Get AI response
+        Returns:
+            Anomaly if detected, None otherwise
+        """
         try:
+            # The prompt is fully determined by the entry and its context, so
+            # repeated lines reuse the first analysis instead of resampling
             response = self.model_manager.generate_response(
                 prompt,
-                temperature=0.3,  # Lower temperature for more consistent analysis
+                temperature=_ANALYSIS_TEMPERATURE,
+                cache=True,
             )
+            return self._evaluate(entry, response)
+
+        except Exception as e:
+            logger.error("detection_failed", entry_id=str(entry.id), error=str(e))
 
-            # Parse response
-            anomaly = self._parse_response(response, entry)
+        return None
+
+    def _analyze_window(self, window: list[tuple[LogEntry, str]]) -> list[Anomaly]:
+        """
+        Run the model on a window of prepared prompts in one batched call.
 
-            # Apply confidence threshold
-            if anomaly and anomaly.confidence >= self.min_confidence:
-                logger.info(
-                    "anomaly_detected",
-                    entry_id=str(entry.id),
-                    severity=anomaly.severity.value,
-                    confidence=anomaly.confidence,
-                )
-                return anomaly
+        Args:
+            window: Log entries with their rendered prompts
 
+        Returns:
+            Anomalies detected in the window, in entry order
+        """
+        try:
+            responses = self.model_manager.generate_responses(
+                [prompt for _, prompt in window],
+                temperature=_ANALYSIS_TEMPERATURE,
+                cache=True,
+            )
         except Exception as e:
-            logger.error("detection_failed", entry_id=str(entry.id), error=str(e))
+            logger.error("detection_failed", entries=len(window), error=str(e))
+            return []
+
+        anomalies = []
+        for (entry, _), response in zip(window, responses):
+            try:
+                anomaly = self._evaluate(entry, response)
+            except Exception as e:
+                logger.error("detection_failed", entry_id=str(entry.id), error=str(e))
+                continue
+            if anomaly:
+                anomalies.append(anomaly)
+        return anomalies
+
+    def _evaluate(self, entry: LogEntry, response: str) -> Optional[Anomaly]:
+        """
+        Parse a model response and apply the confidence threshold.
+
+        Args:
+            entry: Log entry being analyzed
+            response: Model response for the entry
 
+        Returns:
+            Anomaly if detected with enough confidence, None otherwise
+        """
+        anomaly = self._parse_response(response, entry)
+        if anomaly and anomaly.confidence >= self.min_confidence:
+            logger.info(
+                "anomaly_detected",
+                entry_id=str(entry.id),
+                severity=anomaly.severity.value,
+                confidence=anomaly.confidence,
+            )
+            return anomaly
         return None
 
     def detect_batch(self, entries: list[LogEntry], use_context: bool = True) -> list[Anomaly]:
@@ -140,20 +238,22 @@ Respond ONLY with the JSON object, no additional text."""
         """
         self._ensure_model_loaded()
 
-        anomalies = []
-        context_window = self.settings.detection.context_window
+        anomalies: list[Anomaly] = []
 
-        for i, entry in enumerate(entries):
-            # Get context from previous entries
-            context = None
-            if use_context and i > 0:
-                start_idx = max(0, i - context_window)
-                context = entries[start_idx:i]
+        # Prompts go to the model a window of batch_size at a time, so local
+        # models run batched inference and API providers fan out requests.
+        # The next window is built on a worker thread while the model runs on
+        # the current one, hiding prompt construction behind inference.
+        prompts = self._iter_prompts(entries, use_context)
+        batch_size = self.settings.detection.batch_size
+        windows = iter(lambda: list(itertools.islice(prompts, batch_size)), [])
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="loggem-prompt") as pool:
+            pending = pool.submit(next, windows, None)
+            while (window := pending.result()) is not None:
+                pending = pool.submit(next, windows, None)
+                anomalies.extend(self._analyze_window(window))
 
-            # Detect anomaly
-            anomaly = self.detect(entry, context)
-            if anomaly:
-                anomalies.append(anomaly)
+        max_severity = max((anomaly.severity for anomaly in anomalies), default=None)
 
         logger.info(
             "batch_detection_complete",
@@ -162,9 +262,8 @@ Respond ONLY with the JSON object, no additional text."""
         )
 
         # Log to audit trail
-        if anomalies:
-            max_severity = max(a.severity for a in anomalies)
-            audit_logger.log_anomaly_detection(
+        if max_severity is not None:
+            get_audit_logger().log_anomaly_detection(
                 anomaly_count=len(anomalies),
                 severity=max_severity.value,
                 source=entries[0].source if entries else "unknown",
@@ -172,6 +271,31 @@ Respond ONLY with the JSON object, no additional text."""
 
         return anomalies
 
+    def _iter_prompts(
+        self, entries: list[LogEntry], use_context: bool
+    ) -> Iterator[tuple[LogEntry, str]]:
+        """
+        Yield each entry of a batch with its rendered prompt.
+
+        Args:
+            entries: List of log entries to analyze
+            use_context: Whether to use previous entries as context
+
+        Yields:
+            Tuples of (entry, prompt)
+        """
+        context_window = self.settings.detection.context_window
+
+        # Sliding window of already formatted context lines, so each entry is
+        # rendered once no matter how many prompts it appears in
+        window: deque[str] = deque(maxlen=min(context_window, _MAX_PROMPT_CONTEXT))
+
+        for entry in entries:
+            context_block = _format_context_block(window) if window else ""
+            if use_context:
+                window.append(_format_context_line(entry))
+            yield entry, self._render_prompt(entry, context_block)
+
     def _build_prompt(self, entry: LogEntry, context: Optional[list[LogEntry]] = None) -> str:
         """
         Build prompt for the model.
@@ -183,43 +307,54 @@ Respond ONLY with the JSON object, no additional text."""
         Returns:
             Formatted prompt string
         """
-        prompt_parts = [self.SYSTEM_PROMPT, "\n\n"]
-
-        # Add context if available
+        context_block = ""
         if context:
-            prompt_parts.append("Context (previous log entries):\n")
-            for ctx_entry in context[-10:]:  # Last 10 entries
-                prompt_parts.append(
-                    f"[{ctx_entry.timestamp.isoformat()}] {ctx_entry.level}: {ctx_entry.message}\n"
-                )
-            prompt_parts.append("\n")
-
-        # Add the entry to analyze
-        prompt_parts.append("Analyze this log entry:\n")
-        prompt_parts.append(f"Timestamp: {entry.timestamp.isoformat()}\n")
-        prompt_parts.append(f"Source: {entry.source}\n")
-        prompt_parts.append(f"Level: {entry.level}\n")
-        if entry.host:
-            prompt_parts.append(f"Host: {entry.host}\n")
-        if entry.user:
-            prompt_parts.append(f"User: {entry.user}\n")
-        if entry.process:
-            prompt_parts.append(f"Process: {entry.process}\n")
-        prompt_parts.append(f"Message: {entry.message}\n\n")
+            context_block = _format_context_block(
+                _format_context_line(c) for c in context[-_MAX_PROMPT_CONTEXT:]
+            )
+        return self._render_prompt(entry, context_block)
+
+    def _render_prompt(self, entry: LogEntry, context_block: str) -> str:
+        """
+        Render the prompt for an entry around a pre-formatted context block.
+
+        Args:
+            entry: Log entry to analyze
+            context_block: Formatted context section, or an empty string
 
-        # Add metadata if relevant
+        Returns:
+            Formatted prompt string
+        """
+        relevant_metadata = None
         if entry.metadata:
             relevant_metadata = {
-                k: v
-                for k, v in entry.metadata.items()
-                if k in ["status", "method", "path", "event_type", "command"]
+                k: v for k, v in entry.metadata.items() if k in _PROMPT_METADATA_KEYS
             }
-            if relevant_metadata:
-                prompt_parts.append(f"Metadata: {json.dumps(relevant_metadata)}\n\n")
 
-        prompt_parts.append("Response (JSON only):")
+        # Optional fields, in template order; the bitmask selects the template
+        values = [
+            self.SYSTEM_PROMPT,
+            context_block,
+            entry.timestamp.isoformat(),
+            entry.source,
+            entry.level,
+        ]
+        key = 0
+        if entry.host:
+            values.append(entry.host)
+            key |= 8
+        if entry.user:
+            values.append(entry.user)
+            key |= 4
+        if entry.process:
+            values.append(entry.process)
+            key |= 2
+        values.append(entry.message)
+        if relevant_metadata:
+            values.append(json.dumps(relevant_metadata))
+            key |= 1
 
-        return "".join(prompt_parts)
+        return _PROMPT_TEMPLATES[key] % tuple(values)
 
     def _parse_response(self, response: str, entry: LogEntry) -> Optional[Anomaly]:
         """
@@ -250,28 +385,13 @@ Respond ONLY with the JSON object, no additional text."""
             severity_str = data.get("severity", "low").lower()
             anomaly_type_str = data.get("anomaly_type", "unknown").lower()
 
-            # Map to enums
-            severity_map = {
-                "low": Severity.LOW,
-                "medium": Severity.MEDIUM,
-                "high": Severity.HIGH,
-                "critical": Severity.CRITICAL,
-            }
-            severity = severity_map.get(severity_str, Severity.LOW)
-
-            anomaly_type_map = {
-                "brute_force": AnomalyType.BRUTE_FORCE,
-                "privilege_escalation": AnomalyType.PRIVILEGE_ESCALATION,
-                "unusual_access": AnomalyType.UNUSUAL_ACCESS,
-                "data_exfiltration": AnomalyType.DATA_EXFILTRATION,
-                "misconfiguration": AnomalyType.MISCONFIGURATION,
-                "suspicious_activity": AnomalyType.SUSPICIOUS_ACTIVITY,
-                "authentication_failure": AnomalyType.AUTHENTICATION_FAILURE,
-                "rate_limit_exceeded": AnomalyType.RATE_LIMIT_EXCEEDED,
-                "malformed_request": AnomalyType.MALFORMED_REQUEST,
-                "unknown": AnomalyType.UNKNOWN,
-            }
-            anomaly_type = anomaly_type_map.get(anomaly_type_str, AnomalyType.UNKNOWN)
+            # Map to enums, falling back for values the model made up
+            severity = Severity(severity_str) if severity_str in _SEVERITY_VALUES else Severity.LOW
+
+            if anomaly_type_str in _ANOMALY_TYPE_VALUES:
+                anomaly_type = AnomalyType(anomaly_type_str)
+            else:
+                anomaly_type = AnomalyType.UNKNOWN
 
             # Adjust confidence based on sensitivity
             adjusted_confidence = confidence * (0.5 + self.sensitivity * 0.5)
@@ -6,6 +6,11 @@ Supports multiple LLM providers: HuggingFace, OpenAI, Anthropic, Ollama, and cus
 
 from __future__ import annotations
 
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Optional
 
 from loggem.core.config import get_settings
@@ -13,7 +18,17 @@ from loggem.core.logging import get_audit_logger, get_logger
 from loggem.detector.llm_provider import LLMProvider, create_provider
 
 logger = get_logger(__name__)
-audit_logger = get_audit_logger()
+
+_ProviderKey = tuple[str, tuple[tuple[str, str], ...]]
+
+# Initialized providers shared by every ModelManager in the process, with the
+# number of managers currently holding each one
+_PROVIDER_CACHE: dict[_ProviderKey, tuple[LLMProvider, int]] = {}
+_PROVIDER_CACHE_LOCK = threading.Lock()
+
+# Retries for rate-limited (429) and server-side (5xx) API failures
+_RETRY_ATTEMPTS = 4
+_RETRY_BASE_DELAY = 0.5
 
 
 class ModelManager:
@@ -48,6 +63,20 @@ class ModelManager:
 
         # Create provider instance
         self.provider: Optional[LLMProvider] = None
+        self._provider_key: Optional[_ProviderKey] = None
+
+        # LRU cache of responses to identical requests. Managers (and their
+        # shared providers) may be used from several threads, so every
+        # lookup, insert and eviction holds the lock.
+        self.cache_size = self.settings.model.cache_size
+        self._response_cache: OrderedDict[bytes, str] = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+
+        # Thread pool for concurrent API requests, sized once by
+        # settings.max_workers, created on first use and shut down by
+        # unload_model(). Concurrent generate_responses() calls share it.
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
 
         logger.info(
             "model_manager_initialized",
@@ -68,7 +97,9 @@ class ModelManager:
                     "device": self.settings.model.device,
                     "cache_dir": str(self.settings.model.cache_dir),
                     "quantization": self.settings.model.quantization,
+                    "llm_int8_threshold": self.settings.model.llm_int8_threshold,
                     "trust_remote_code": self.settings.model.trust_remote_code,
+                    "compile": self.settings.model.compile,
                 }
             )
         elif self.provider_type in ("openai", "anthropic"):
@@ -80,8 +111,10 @@ class ModelManager:
             )
             if self.settings.model.base_url:
                 config["base_url"] = self.settings.model.base_url
-            if self.provider_type == "openai" and self.settings.model.organization:
-                config["organization"] = self.settings.model.organization
+            if self.provider_type == "openai":
+                if self.settings.model.organization:
+                    config["organization"] = self.settings.model.organization
+                config["batch_api"] = self.settings.model.batch_api
         elif self.provider_type == "ollama":
             config.update(
                 {
@@ -110,29 +143,72 @@ class ModelManager:
             logger.info("provider_already_initialized")
             return
 
-        logger.info("initializing_provider", provider=self.provider_type)
-
-        try:
-            # Create and initialize provider
-            self.provider = create_provider(self.provider_type, self.provider_config)
-            self.provider.initialize()
-
-            logger.info("provider_initialized_successfully")
-            audit_logger.log_model_load(
-                self.provider_config.get("model_name")
-                or self.provider_config.get("model", "unknown"),
-                self.provider_type,
-            )
-
-        except Exception as e:
-            logger.error("provider_initialization_failed", error=str(e))
-            raise RuntimeError(f"Failed to initialize {self.provider_type} provider: {e}") from e
+        key = _provider_cache_key(self.provider_type, self.provider_config)
+
+        # Hold the lock while loading so concurrent managers for the same
+        # model wait for one load instead of each loading their own copy
+        with _PROVIDER_CACHE_LOCK:
+            cached = _PROVIDER_CACHE.get(key)
+            if cached is not None:
+                provider, refs = cached
+                _PROVIDER_CACHE[key] = (provider, refs + 1)
+                self.provider = provider
+                self._provider_key = key
+                logger.info("provider_reused", provider=self.provider_type, refs=refs + 1)
+                return
+
+            logger.info("initializing_provider", provider=self.provider_type)
+
+            try:
+                # Create and initialize provider
+                self.provider = create_provider(self.provider_type, self.provider_config)
+                self.provider.initialize()
+
+                logger.info("provider_initialized_successfully")
+                get_audit_logger().log_model_load(
+                    self.provider_config.get("model_name")
+                    or self.provider_config.get("model", "unknown"),
+                    self.provider_type,
+                )
+
+            except Exception as e:
+                logger.error("provider_initialization_failed", error=str(e))
+                raise RuntimeError(
+                    f"Failed to initialize {self.provider_type} provider: {e}"
+                ) from e
+
+            _PROVIDER_CACHE[key] = (self.provider, 1)
+            self._provider_key = key
 
     def unload_model(self) -> None:
-        """Unload the model to free memory."""
+        """
+        Unload the model to free memory.
+
+        A provider shared with other managers is only cleaned up once the
+        last of them unloads it.
+        """
         if self.provider is not None:
-            self.provider.cleanup()
+            key = self._provider_key
+            release = True
+            with _PROVIDER_CACHE_LOCK:
+                cached = _PROVIDER_CACHE.get(key) if key is not None else None
+                if key is not None and cached is not None and cached[0] is self.provider:
+                    refs = cached[1] - 1
+                    if refs > 0:
+                        _PROVIDER_CACHE[key] = (self.provider, refs)
+                        release = False
+                    else:
+                        del _PROVIDER_CACHE[key]
+            if release:
+                self.provider.cleanup()
             self.provider = None
+            self._provider_key = None
+        with self._response_cache_lock:
+            self._response_cache.clear()
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
 
         logger.info("provider_unloaded")
 
@@ -142,6 +218,7 @@ class ModelManager:
         max_tokens: Optional[int] = None,
         temperature: float = 0.7,
         top_p: float = 0.9,
+        cache: Optional[bool] = None,
     ) -> str:
         """
         Generate a response from the LLM.
@@ -151,6 +228,8 @@ class ModelManager:
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature (higher = more random)
             top_p: Nucleus sampling parameter
+            cache: Reuse responses for identical requests (default: only when
+                temperature is 0, i.e. when generation is deterministic)
 
         Returns:
             Generated text response
@@ -164,6 +243,14 @@ class ModelManager:
         if max_tokens is None:
             max_tokens = 512
 
+        cache_key = None
+        if self._use_cache(cache, temperature):
+            cache_key = _response_cache_key(prompt, max_tokens, temperature, top_p)
+            cached = self._cached_response(cache_key)
+            if cached is not None:
+                logger.debug("response_cache_hit")
+                return cached
+
         logger.debug("generating_response", prompt_length=len(prompt))
 
         try:
@@ -175,12 +262,158 @@ class ModelManager:
             )
 
             logger.debug("response_generated", response_length=len(response))
+            if cache_key is not None:
+                self._cache_response(cache_key, response)
             return response
 
         except Exception as e:
             logger.error("generation_failed", error=str(e))
             raise RuntimeError(f"Failed to generate response: {e}") from e
 
+    def generate_responses(
+        self,
+        prompts: list[str],
+        max_tokens: Optional[int] = None,
+        temperature: float = 0.7,
+        top_p: float = 0.9,
+        max_concurrency: Optional[int] = None,
+        cache: Optional[bool] = None,
+    ) -> list[str]:
+        """
+        Generate one response per prompt in as few model calls as possible.
+
+        Local providers process the prompts that miss the response cache with
+        batched inference.
+        Network-bound providers handle each prompt as a separate
+        ``generate_response`` call on this manager's thread pool, with at most
+        ``max_concurrency`` of this call's requests in flight at once; those
+        calls use the response cache and retry rate-limited and server errors
+        with exponential backoff.
+
+        Args:
+            prompts: Input prompts
+            max_tokens: Maximum tokens to generate per prompt
+            temperature: Sampling temperature (higher = more random)
+            top_p: Nucleus sampling parameter
+            max_concurrency: Maximum in-flight requests for network-bound providers
+                (default and upper bound: the pool size, ``settings.max_workers``)
+            cache: Reuse responses for identical requests, as in generate_response()
+
+        Returns:
+            Generated text responses, in the same order as ``prompts``
+
+        Raises:
+            RuntimeError: If provider is not initialized or a request fails
+        """
+        if self.provider is None or not self.provider.is_initialized:
+            raise RuntimeError("Provider not initialized. Call load_model() first.")
+
+        if max_tokens is None:
+            max_tokens = 512
+
+        logger.debug("generating_responses", batch_size=len(prompts))
+
+        if self.provider.concurrent_requests:
+            executor = self._request_executor()
+            # Bound this call's requests without resizing the shared pool;
+            # a slot is taken before submitting and freed when a request ends
+            slots = threading.BoundedSemaphore(max_concurrency or self.settings.max_workers)
+            futures: list[Future[str]] = []
+            for prompt in prompts:
+                slots.acquire()
+                try:
+                    future = executor.submit(
+                        self._generate_with_backoff, prompt, max_tokens, temperature, top_p, cache
+                    )
+                except BaseException:
+                    slots.release()
+                    raise
+                future.add_done_callback(lambda _future: slots.release())
+                futures.append(future)
+            responses = [future.result() for future in futures]
+        else:
+            keys: list[Optional[bytes]] = [None] * len(prompts)
+            if self._use_cache(cache, temperature):
+                keys = [_response_cache_key(p, max_tokens, temperature, top_p) for p in prompts]
+            hits = [self._cached_response(key) if key is not None else None for key in keys]
+            misses = [prompt for prompt, hit in zip(prompts, hits) if hit is None]
+            generated: list[str] = []
+            if misses:
+                try:
+                    generated = self.provider.generate_batch(
+                        prompts=misses,
+                        max_tokens=max_tokens,
+                        temperature=temperature,
+                        top_p=top_p,
+                    )
+                except Exception as e:
+                    logger.error("generation_failed", error=str(e))
+                    raise RuntimeError(f"Failed to generate responses: {e}") from e
+
+            # Merge cache hits and fresh responses back into prompt order
+            fresh = iter(generated)
+            responses = []
+            for key, hit in zip(keys, hits):
+                if hit is None:
+                    hit = next(fresh)
+                    if key is not None:
+                        self._cache_response(key, hit)
+                responses.append(hit)
+
+        logger.debug("responses_generated", batch_size=len(responses))
+        return responses
+
+    def _use_cache(self, cache: Optional[bool], temperature: float) -> bool:
+        """Resolve a request's ``cache`` flag, which defaults to deterministic requests only."""
+        if cache is None:
+            cache = temperature == 0
+        return cache and self.cache_size > 0
+
+    def _cached_response(self, key: bytes) -> Optional[str]:
+        """Look up a cached response, marking it as recently used."""
+        with self._response_cache_lock:
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                self._response_cache.move_to_end(key)
+            return cached
+
+    def _cache_response(self, key: bytes, response: str) -> None:
+        """Store a response, evicting the least recently used one when full."""
+        with self._response_cache_lock:
+            self._response_cache[key] = response
+            if len(self._response_cache) > self.cache_size:
+                self._response_cache.popitem(last=False)
+
+    def _request_executor(self) -> ThreadPoolExecutor:
+        """Return this manager's API request pool, creating it on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.settings.max_workers, thread_name_prefix="loggem-api"
+                )
+            return self._executor
+
+    def _generate_with_backoff(
+        self,
+        prompt: str,
+        max_tokens: Optional[int],
+        temperature: float,
+        top_p: float,
+        cache: Optional[bool] = None,
+    ) -> str:
+        """Call generate_response, retrying 429 and 5xx failures with backoff."""
+        attempt = 0
+        while True:
+            try:
+                return self.generate_response(prompt, max_tokens, temperature, top_p, cache)
+            except RuntimeError as e:
+                attempt += 1
+                if attempt >= _RETRY_ATTEMPTS or not _is_retryable(e.__cause__):
+                    raise
+                delay = _RETRY_BASE_DELAY * 2 ** (attempt - 1)
+                logger.warning("retrying_generation", attempt=attempt, delay=delay)
+                time.sleep(delay)
+
     def is_loaded(self) -> bool:
         """Check if provider is initialized."""
         return self.provider is not None and self.provider.is_initialized
@@ -194,3 +427,31 @@ class ModelManager:
             }
 
         return self.provider.get_info()
+
+
+def reset_provider_cache() -> None:
+    """Forget all shared providers without cleaning them up. Useful for testing."""
+    with _PROVIDER_CACHE_LOCK:
+        _PROVIDER_CACHE.clear()
+
+
+def _is_retryable(error: Optional[BaseException]) -> bool:
+    """Check whether a provider error is a rate limit or server-side failure."""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        # requests.HTTPError carries the status on its response
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return isinstance(status, int) and (status == 429 or status >= 500)
+
+
+def _provider_cache_key(provider_type: str, provider_config: dict[str, Any]) -> _ProviderKey:
+    """Build a hashable key identifying a provider type and configuration."""
+    return provider_type, tuple(sorted((k, str(v)) for k, v in provider_config.items()))
+
+
+def _response_cache_key(prompt: str, max_tokens: int, temperature: float, top_p: float) -> bytes:
+    """Build a compact cache key from a prompt and its sampling parameters."""
+    # repr() takes any int, unlike a fixed-width struct field
+    h = hashlib.blake2b(repr((temperature, top_p, max_tokens)).encode(), digest_size=16)
+    h.update(prompt.encode())
+    return h.digest()
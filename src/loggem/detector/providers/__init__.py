@@ -0,0 +1,6 @@
+"""
+LLM provider implementations.
+
+Each provider lives in its own module so that only the selected backend is
+imported; see ``loggem.detector.llm_provider.PROVIDERS``.
+"""
@@ -0,0 +1,87 @@
+"""
+Anthropic Claude API provider.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from loggem.core.logging import get_logger
+from loggem.detector.llm_provider import LLMProvider
+
+logger = get_logger(__name__)
+
+
+class AnthropicProvider(LLMProvider):
+    """Anthropic Claude API provider."""
+
+    concurrent_requests = True
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        """
+        Initialize Anthropic provider.
+
+        Config keys:
+            - api_key: Anthropic API key (required, or set ANTHROPIC_API_KEY env var)
+            - model: Model name (default: claude-3-haiku-20240307)
+        """
+        super().__init__(config)
+        self.api_key = config.get("api_key")
+        self.model = config.get("model", "claude-3-haiku-20240307")
+        self.client: Optional[Any] = None
+
+    def initialize(self) -> None:
+        """Initialize Anthropic client."""
+        if self.is_initialized:
+            return
+
+        try:
+            from anthropic import Anthropic
+        except ImportError:
+            raise ImportError(
+                "Anthropic provider requires 'anthropic' package. "
+                "Install with: pip install anthropic"
+            )
+
+        logger.info("initializing_anthropic_provider", model=self.model)
+
+        self.client = Anthropic(api_key=self.api_key)
+        self.is_initialized = True
+        logger.info("anthropic_provider_initialized")
+
+    def generate(
+        self,
+        prompt: str,
+        max_tokens: int = 512,
+        temperature: float = 0.7,
+        top_p: float = 0.9,
+        **kwargs: Any,
+    ) -> str:
+        """Generate response using Anthropic API."""
+        if not self.is_initialized:
+            raise RuntimeError("Provider not initialized. Call initialize() first.")
+
+        response = self.client.messages.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=top_p,
+            messages=[{"role": "user", "content": prompt}],
+            **kwargs,
+        )
+
+        return response.content[0].text
+
+    def cleanup(self) -> None:
+        """Cleanup Anthropic resources."""
+        self.client = None
+        self.is_initialized = False
+        logger.info("anthropic_provider_cleaned_up")
+
+    def get_info(self) -> dict[str, Any]:
+        """Get Anthropic provider info."""
+        return {
+            "provider": "anthropic",
+            "model": self.model,
+            "initialized": self.is_initialized,
+        }
@@ -0,0 +1,546 @@
+"""
+HuggingFace Transformers provider for local models.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+from collections.abc import Iterator
+from typing import Any, Optional
+
+from loggem.core.logging import get_logger
+from loggem.detector.llm_provider import LLMProvider
+
+logger = get_logger(__name__)
+
+
+def _length_buckets(
+    lengths: list[int], batch_size: int, max_spread: float = 0.1
+) -> list[list[int]]:
+    """
+    Group sequence indices into batches of similar length.
+
+    Indices are sorted by length and a new bucket is started when the current
+    one is full or the next sequence is more than ``max_spread`` longer than
+    the shortest sequence in the bucket, which keeps padding per batch small.
+
+    Args:
+        lengths: Sequence lengths, indexed like the original inputs
+        batch_size: Maximum number of sequences per bucket
+        max_spread: Maximum relative length spread within a bucket
+
+    Returns:
+        Buckets of indices into ``lengths``
+    """
+    buckets: list[list[int]] = []
+    bucket: list[int] = []
+    shortest = 0
+    for index in sorted(range(len(lengths)), key=lengths.__getitem__):
+        length = lengths[index]
+        if bucket and (len(bucket) >= batch_size or length > shortest * (1 + max_spread)):
+            buckets.append(bucket)
+            bucket = []
+        if not bucket:
+            shortest = length
+        bucket.append(index)
+    if bucket:
+        buckets.append(bucket)
+    return buckets
+
+
+@functools.cache
+def _resolve_device(device: str) -> str:
+    """
+    Resolve the "auto" device to the best available backend.
+
+    Cached so repeated model loads do not re-probe the CUDA runtime.
+
+    Args:
+        device: Requested device (auto, cpu, cuda, mps)
+
+    Returns:
+        Concrete device name
+    """
+    if device != "auto":
+        return device
+
+    import torch
+
+    if torch.cuda.is_available():
+        return "cuda"
+    if hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
+        return "mps"
+    return "cpu"
+
+
+def _supports_static_cache(model: Any) -> bool:
+    """
+    Check whether a loaded model can generate with a static KV cache.
+
+    Transformers marks such architectures with ``_supports_static_cache``
+    (``_can_compile_fullgraph`` in newer releases).
+
+    Args:
+        model: Loaded causal LM
+
+    Returns:
+        True if ``cache_implementation="static"`` is supported
+    """
+    return bool(
+        getattr(model, "_supports_static_cache", False)
+        or getattr(model, "_can_compile_fullgraph", False)
+    )
+
+
+@functools.cache
+def _build_bnb_config(quantization: str, llm_int8_threshold: float) -> Any:
+    """
+    Build the BitsAndBytes quantization config for an int8 or 4-bit load.
+
+    Args:
+        quantization: "int8" or "nf4"
+        llm_int8_threshold: Outlier threshold for int8 quantization
+
+    Returns:
+        BitsAndBytesConfig instance
+    """
+    import torch
+    from transformers import BitsAndBytesConfig
+
+    if quantization == "int8":
+        # 0.0 keeps every activation on the int8 path; larger values route
+        # outlier features through fp16 for accuracy at a speed cost
+        return BitsAndBytesConfig(load_in_8bit=True, llm_int8_threshold=llm_int8_threshold)
+
+    # 4-bit NormalFloat weights with fp16 compute: half the weight bandwidth
+    # of int8 at a small accuracy cost
+    return BitsAndBytesConfig(
+        load_in_4bit=True,
+        bnb_4bit_quant_type="nf4",
+        bnb_4bit_compute_dtype=torch.float16,
+        bnb_4bit_use_double_quant=True,
+    )
+
+
+class HuggingFaceProvider(LLMProvider):
+    """HuggingFace Transformers provider for local models."""
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        """
+        Initialize HuggingFace provider.
+
+        Config keys:
+            - model_name: HuggingFace model name (required)
+            - device: Device to run on (auto, cpu, cuda, mps)
+            - quantization: Quantization level (int8, nf4, int4, fp8, fp16, fp32);
+              nf4/int4 load 4-bit NormalFloat weights and require CUDA; fp8
+              requires an Ada/Hopper GPU and falls back to fp16 elsewhere
+            - llm_int8_threshold: Outlier threshold for int8 quantization (default: 0.0)
+            - cache_dir: Directory to cache models
+            - trust_remote_code: Whether to trust remote code (default: False)
+            - batch_size: Maximum prompts per forward pass in generate_batch (default: 8)
+            - attn_impl: Attention implementation (sdpa, flash_attention_2, eager;
+              default: sdpa, falls back to eager if unsupported)
+            - compile: Compile the model with torch.compile (default: False)
+            - compile_mode: torch.compile mode (default: reduce-overhead)
+            - compile_backend: torch.compile backend (default: inductor)
+            - static_cache: Use a static KV cache for single-prompt generation on
+              CUDA when compile is set (default: True; without compile it only
+              adds preallocation cost, and it is disabled at initialize() if the
+              model or device does not support it)
+            - empty_cache_on_cleanup: Release cached CUDA memory to the driver in
+              cleanup() (default: False)
+        """
+        super().__init__(config)
+        self.model_name = config.get("model_name")
+        if not self.model_name:
+            raise ValueError("model_name is required for HuggingFace provider")
+
+        self.device = config.get("device", "auto")
+        self.quantization = config.get("quantization", "int8")
+        self.llm_int8_threshold = config.get("llm_int8_threshold", 0.0)
+        self.cache_dir = config.get("cache_dir", "./models")
+        self.trust_remote_code = config.get("trust_remote_code", False)
+        self.batch_size = config.get("batch_size", 8)
+        self.attn_impl = config.get("attn_impl", "sdpa")
+        self.compile = config.get("compile", False)
+        self.static_cache = self.compile and config.get("static_cache", True)
+        self.empty_cache_on_cleanup = config.get("empty_cache_on_cleanup", False)
+
+        self.model: Optional[Any] = None
+        self.tokenizer: Optional[Any] = None
+        self._param_count: Optional[int] = None
+        self._pin_memory = False
+        self._eos_id: Optional[int] = None
+        self._pad_id: Optional[int] = None
+
+    def initialize(self) -> None:
+        """Load the HuggingFace model and tokenizer."""
+        if self.is_initialized:
+            logger.info("huggingface_provider_already_initialized")
+            return
+
+        import torch
+        from transformers import AutoModelForCausalLM, AutoTokenizer
+
+        logger.info(
+            "initializing_huggingface_provider",
+            model=self.model_name,
+            device=self.device,
+        )
+
+        self.device = _resolve_device(self.device)
+
+        # Load tokenizer, preferring the Rust-backed fast implementation
+        tokenizer_kwargs = {
+            "cache_dir": self.cache_dir,
+            "trust_remote_code": self.trust_remote_code,
+        }
+        try:
+            self.tokenizer = AutoTokenizer.from_pretrained(
+                self.model_name, use_fast=True, **tokenizer_kwargs
+            )
+        except (ValueError, OSError) as e:
+            logger.warning("fast_tokenizer_unavailable", error=str(e))
+            self.tokenizer = AutoTokenizer.from_pretrained(
+                self.model_name, use_fast=False, **tokenizer_kwargs
+            )
+        if self.tokenizer.pad_token is None:
+            self.tokenizer.pad_token = self.tokenizer.eos_token
+        self._eos_id = self.tokenizer.eos_token_id
+        # A pad id of 0 is valid (T5, Gemma), so only a missing id falls back
+        pad_id = self.tokenizer.pad_token_id
+        self._pad_id = pad_id if pad_id is not None else self._eos_id
+
+        # Configure model loading
+        model_kwargs = {
+            "cache_dir": self.cache_dir,
+            "trust_remote_code": self.trust_remote_code,
+            "low_cpu_mem_usage": True,
+        }
+
+        # Apply quantization
+        fp8_config = self._build_fp8_config() if self.quantization == "fp8" else None
+        if self.quantization == "int8" and self.device in ("cuda", "auto"):
+            logger.info("int8_quantization", llm_int8_threshold=self.llm_int8_threshold)
+            model_kwargs["quantization_config"] = _build_bnb_config("int8", self.llm_int8_threshold)
+            model_kwargs["device_map"] = "auto"
+        elif self.quantization in ("nf4", "int4") and self.device == "cuda":
+            model_kwargs["quantization_config"] = _build_bnb_config("nf4", self.llm_int8_threshold)
+            model_kwargs["device_map"] = "auto"
+        elif fp8_config is not None:
+            model_kwargs["torch_dtype"] = torch.bfloat16
+            model_kwargs["quantization_config"] = fp8_config
+            model_kwargs["device_map"] = "auto"
+        elif self.quantization in ("fp16", "fp8"):
+            if self.quantization == "fp8":
+                logger.warning("fp8_unsupported_falling_back_to_fp16", device=self.device)
+            model_kwargs["torch_dtype"] = torch.float16
+            if self.device != "cpu":
+                model_kwargs["device_map"] = "auto"
+        else:  # fp32
+            if self.quantization in ("nf4", "int4"):
+                logger.warning("4bit_quantization_requires_cuda", device=self.device)
+            model_kwargs["torch_dtype"] = torch.float32
+
+        # Prefer fused scaled-dot-product attention, falling back to the eager
+        # implementation for architectures that do not support it
+        model_kwargs["attn_implementation"] = self.attn_impl
+
+        # Load model
+        try:
+            self.model = AutoModelForCausalLM.from_pretrained(
+                self.model_name,
+                **model_kwargs,
+            )
+        except (ValueError, ImportError) as e:
+            if self.attn_impl == "eager":
+                raise
+            logger.warning("attn_implementation_unsupported", attn=self.attn_impl, error=str(e))
+            model_kwargs["attn_implementation"] = "eager"
+            self.model = AutoModelForCausalLM.from_pretrained(
+                self.model_name,
+                **model_kwargs,
+            )
+
+        # Move to device if not using device_map
+        if "device_map" not in model_kwargs:
+            self.model = self.model.to(self.device)
+
+        self.model.eval()
+        self.model.config.use_cache = True
+
+        # Decide once whether generate() can ask for a static KV cache
+        if self.static_cache:
+            self.static_cache = self.device == "cuda" and _supports_static_cache(self.model)
+            if not self.static_cache:
+                logger.info("static_cache_unsupported", model=self.model_name, device=self.device)
+        self._param_count = sum(p.numel() for p in self.model.parameters())
+        self._pin_memory = self.device.startswith("cuda") and torch.cuda.is_available()
+
+        if self.compile:
+            self._compile_forward()
+
+        self.is_initialized = True
+        logger.info("huggingface_provider_initialized")
+
+    def _compile_forward(self) -> None:
+        """
+        Compile the model's forward pass with torch.compile.
+
+        generate() runs the decode loop in Python and calls ``forward`` once
+        per step, so that is what gets compiled: wrapping the whole model
+        would leave ``generate`` calling the uncompiled module underneath.
+        Compiled kernels persist across runs via TORCHINDUCTOR_CACHE_DIR.
+        """
+        import torch
+
+        logger.warning("torch_compile_enabled_first_generate_will_be_slow")
+        self.model.forward = torch.compile(
+            self.model.forward,
+            mode=self.config.get("compile_mode", "reduce-overhead"),
+            backend=self.config.get("compile_backend", "inductor"),
+            fullgraph=False,
+        )
+
+    def _build_fp8_config(self) -> Optional[Any]:
+        """
+        Build the FP8 quantization config, if this GPU and install can load FP8.
+
+        Returns:
+            FbgemmFp8Config instance, or None to load in fp16 instead
+        """
+        if not self._supports_fp8():
+            return None
+        try:
+            from transformers import FbgemmFp8Config
+            from transformers.utils import is_fbgemm_gpu_available
+        except ImportError as e:
+            logger.warning("fp8_config_unavailable", error=str(e))
+            return None
+        if not is_fbgemm_gpu_available():
+            logger.warning("fp8_kernels_unavailable", package="fbgemm-gpu")
+            return None
+        return FbgemmFp8Config()
+
+    def _supports_fp8(self) -> bool:
+        """Check whether the target GPU has FP8 tensor cores (Ada or Hopper and newer)."""
+        import torch
+
+        if self.device != "cuda" or not torch.cuda.is_available():
+            return False
+        return bool(torch.cuda.get_device_capability() >= (8, 9))
+
+    def generate(
+        self,
+        prompt: str,
+        max_tokens: int = 512,
+        temperature: float = 0.7,
+        top_p: float = 0.9,
+        **kwargs: Any,
+    ) -> str:
+        """Generate response using HuggingFace model."""
+        if not self.is_initialized:
+            raise RuntimeError("Provider not initialized. Call initialize() first.")
+
+        import torch
+
+        inputs = self._encode(prompt)
+
+        # A pre-allocated KV cache keeps tensor shapes fixed across decode
+        # steps, which lets a reduce-overhead compiled model replay CUDA graphs.
+        # Sizing it for the longest prompt keeps it (and the compiled graphs)
+        # reused across calls instead of resized to each prompt.
+        if self.static_cache:
+            kwargs.setdefault("cache_implementation", "static")
+            kwargs.setdefault("max_cache_len", self.config.get("max_length", 2048) + max_tokens)
+
+        # Generate
+        with torch.inference_mode():
+            outputs = self.model.generate(
+                **inputs,
+                max_new_tokens=max_tokens,
+                temperature=temperature,
+                top_p=top_p,
+                do_sample=True,
+                pad_token_id=self._pad_id,
+                **kwargs,
+            )
+
+        # Decode only the generated tokens, not the echoed prompt
+        input_len = inputs["input_ids"].shape[1]
+        response: str = self.tokenizer.decode(outputs[0, input_len:], skip_special_tokens=True)
+        return response.strip()
+
+    def generate_stream(
+        self,
+        prompt: str,
+        max_tokens: int = 512,
+        temperature: float = 0.7,
+        top_p: float = 0.9,
+        **kwargs: Any,
+    ) -> Iterator[str]:
+        """
+        Yield the response text incrementally as tokens are generated.
+
+        Args:
+            prompt: Input prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            top_p: Nucleus sampling parameter
+            **kwargs: Additional generation arguments
+
+        Yields:
+            Decoded text chunks, excluding the prompt
+        """
+        if not self.is_initialized:
+            raise RuntimeError("Provider not initialized. Call initialize() first.")
+
+        import torch
+        from transformers import TextIteratorStreamer
+
+        inputs = self._encode(prompt)
+        streamer = TextIteratorStreamer(self.tokenizer, skip_prompt=True, skip_special_tokens=True)
+
+        errors: list[Exception] = []
+
+        def run() -> None:
+            try:
+                with torch.inference_mode():
+                    self.model.generate(
+                        **inputs,
+                        max_new_tokens=max_tokens,
+                        temperature=temperature,
+                        top_p=top_p,
+                        do_sample=True,
+                        pad_token_id=self._pad_id,
+                        streamer=streamer,
+                        **kwargs,
+                    )
+            except Exception as e:
+                # Re-raised in the caller; ending the stream unblocks its loop
+                errors.append(e)
+                streamer.end()
+
+        thread = threading.Thread(target=run, name="loggem-generate", daemon=True)
+        thread.start()
+        yield from streamer
+        thread.join()
+        if errors:
+            raise errors[0]
+
+    def _encode(self, prompt: str) -> dict[str, Any]:
+        """Tokenize a single prompt and move the tensors to the model device."""
+        inputs = self.tokenizer(
+            prompt,
+            return_tensors="pt",
+            truncation=True,
+            max_length=self.config.get("max_length", 2048),
+        )
+        return self._to_device(inputs)
+
+    def _to_device(self, inputs: Any) -> dict[str, Any]:
+        """
+        Copy tokenizer output to the model device.
+
+        On CUDA the tensors are staged in pinned host memory so the copy is
+        asynchronous and overlaps with the following kernel launches.
+        """
+        if self._pin_memory:
+            return {k: v.pin_memory().to(self.device, non_blocking=True) for k, v in inputs.items()}
+        return {k: v.to(self.device) for k, v in inputs.items()}
+
+    def generate_batch(
+        self,
+        prompts: list[str],
+        max_tokens: int = 512,
+        temperature: float = 0.7,
+        top_p: float = 0.9,
+        **kwargs: Any,
+    ) -> list[str]:
+        """Generate responses for several prompts using length-bucketed batches."""
+        if not self.is_initialized:
+            raise RuntimeError("Provider not initialized. Call initialize() first.")
+
+        import torch
+
+        max_length = self.config.get("max_length", 2048)
+        lengths = [
+            len(ids)
+            for ids in self.tokenizer(prompts, truncation=True, max_length=max_length)["input_ids"]
+        ]
+
+        responses = [""] * len(prompts)
+        # Decoder-only models continue from the right, so pad on the left
+        self.tokenizer.padding_side = "left"
+        for bucket in _length_buckets(lengths, self.batch_size):
+            inputs = self.tokenizer(
+                [prompts[i] for i in bucket],
+                return_tensors="pt",
+                padding=True,
+                truncation=True,
+                max_length=max_length,
+            )
+            inputs = self._to_device(inputs)
+
+            with torch.inference_mode():
+                outputs = self.model.generate(
+                    **inputs,
+                    max_new_tokens=max_tokens,
+                    temperature=temperature,
+                    top_p=top_p,
+                    do_sample=True,
+                    pad_token_id=self._pad_id,
+                    **kwargs,
+                )
+
+            # All rows share the padded prompt length; keep only new tokens
+            generated = outputs[:, inputs["input_ids"].shape[1] :]
+            texts = self.tokenizer.batch_decode(generated, skip_special_tokens=True)
+            for i, text in zip(bucket, texts):
+                responses[i] = text.strip()
+
+        return responses
+
+    def cleanup(self) -> None:
+        """Cleanup HuggingFace resources."""
+        if self.model is not None:
+            del self.model
+            self.model = None
+
+        if self.tokenizer is not None:
+            del self.tokenizer
+            self.tokenizer = None
+
+        self._param_count = None
+        self._eos_id = None
+        self._pad_id = None
+
+        # Dropping the model reference is usually enough: the caching
+        # allocator reuses the freed blocks. Returning them to the driver is
+        # opt-in, and pinned to our device so it does not initialize cuda:0.
+        if self.empty_cache_on_cleanup and self.device.startswith("cuda"):
+            import torch
+
+            if torch.cuda.is_available():
+                with torch.cuda.device(self.device):
+                    torch.cuda.empty_cache()
+
+        self.is_initialized = False
+        logger.info("huggingface_provider_cleaned_up")
+
+    def get_info(self) -> dict[str, Any]:
+        """Get HuggingFace provider info."""
+        info = {
+            "provider": "huggingface",
+            "model_name": self.model_name,
+            "device": self.device,
+            "quantization": self.quantization,
+            "initialized": self.is_initialized,
+        }
+
+        if self.is_initialized and self._param_count is not None:
+            info["parameters"] = self._param_count
+
+        return info
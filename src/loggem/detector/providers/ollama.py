@@ -0,0 +1,144 @@
+"""
+Ollama local API provider.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Optional
+
+from loggem.core.logging import get_logger
+from loggem.detector.llm_provider import LLMProvider
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize a request payload to JSON bytes, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _loads(data: bytes) -> Any:
+    """Parse a JSON response body, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class OllamaProvider(LLMProvider):
+    """Ollama local API provider."""
+
+    concurrent_requests = True
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        """
+        Initialize Ollama provider.
+
+        Config keys:
+            - model: Model name (required, e.g., "llama3", "mistral")
+            - base_url: Ollama API URL (default: http://localhost:11434)
+        """
+        super().__init__(config)
+        self.model = config.get("model")
+        if not self.model:
+            raise ValueError("model is required for Ollama provider")
+
+        self.base_url = config.get("base_url", "http://localhost:11434")
+        self.client: Optional[Any] = None
+        self.session: Optional[Any] = None
+
+        # Request fields that stay the same for every call
+        self._generate_url = f"{self.base_url}/api/generate"
+        self._payload_template: dict[str, Any] = {"model": self.model, "stream": False}
+
+    def initialize(self) -> None:
+        """Initialize Ollama client."""
+        if self.is_initialized:
+            return
+
+        try:
+            import requests
+            from requests.adapters import HTTPAdapter
+        except ImportError:
+            raise ImportError(
+                "Ollama provider requires 'requests' package. Install with: pip install requests"
+            )
+
+        logger.info(
+            "initializing_ollama_provider",
+            model=self.model,
+            base_url=self.base_url,
+        )
+
+        # Reuse keep-alive connections across requests
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=8)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # Test connection
+        try:
+            response = self.session.get(f"{self.base_url}/api/tags")
+            response.raise_for_status()
+        except Exception as e:
+            self.session.close()
+            self.session = None
+            raise RuntimeError(f"Failed to connect to Ollama at {self.base_url}: {e}")
+
+        self.is_initialized = True
+        logger.info("ollama_provider_initialized")
+
+    def generate(
+        self,
+        prompt: str,
+        max_tokens: int = 512,
+        temperature: float = 0.7,
+        top_p: float = 0.9,
+        **kwargs: Any,
+    ) -> str:
+        """Generate response using Ollama API."""
+        if not self.is_initialized:
+            raise RuntimeError("Provider not initialized. Call initialize() first.")
+
+        payload = self._payload_template | {
+            "prompt": prompt,
+            "options": {
+                "temperature": temperature,
+                "top_p": top_p,
+                "num_predict": max_tokens,
+            },
+        }
+        response = self.session.post(
+            self._generate_url, data=_dumps(payload), headers=_JSON_HEADERS
+        )
+        response.raise_for_status()
+
+        return _loads(response.content)["response"]
+
+    def cleanup(self) -> None:
+        """Cleanup Ollama resources."""
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+        self.is_initialized = False
+        logger.info("ollama_provider_cleaned_up")
+
+    def get_info(self) -> dict[str, Any]:
+        """Get Ollama provider info."""
+        return {
+            "provider": "ollama",
+            "model": self.model,
+            "base_url": self.base_url,
+            "initialized": self.is_initialized,
+        }
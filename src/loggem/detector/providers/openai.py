@@ -0,0 +1,234 @@
+"""
+OpenAI API provider.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import Iterator
+from typing import Any, Optional
+
+from loggem.core.logging import get_logger
+from loggem.detector.llm_provider import LLMProvider
+
+logger = get_logger(__name__)
+
+_BATCH_ENDPOINT = "/v1/chat/completions"
+_BATCH_FINAL_STATES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+class OpenAIProvider(LLMProvider):
+    """OpenAI API provider."""
+
+    concurrent_requests = True
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        """
+        Initialize OpenAI provider.
+
+        Config keys:
+            - api_key: OpenAI API key (required, or set OPENAI_API_KEY env var)
+            - model: Model name (default: gpt-4o-mini)
+            - base_url: Custom API base URL (optional)
+            - organization: Organization ID (optional)
+            - batch_api: Send generate_batch() through the Batch API (default: False)
+            - batch_poll_interval: Seconds between Batch API status checks (default: 10)
+        """
+        super().__init__(config)
+        self.api_key = config.get("api_key")
+        self.model = config.get("model", "gpt-4o-mini")
+        self.base_url = config.get("base_url")
+        self.organization = config.get("organization")
+        self.batch_api = config.get("batch_api", False)
+        self.batch_poll_interval = config.get("batch_poll_interval", 10.0)
+        self.client: Optional[Any] = None
+
+        # Batches go to the Batch API as one job rather than as concurrent requests
+        self.concurrent_requests = not self.batch_api
+
+    def initialize(self) -> None:
+        """Initialize OpenAI client."""
+        if self.is_initialized:
+            return
+
+        try:
+            from openai import OpenAI
+        except ImportError:
+            raise ImportError(
+                "OpenAI provider requires 'openai' package. Install with: pip install openai"
+            )
+
+        logger.info("initializing_openai_provider", model=self.model)
+
+        self.client = OpenAI(
+            api_key=self.api_key,
+            base_url=self.base_url,
+            organization=self.organization,
+        )
+        self.is_initialized = True
+        logger.info("openai_provider_initialized")
+
+    def generate(
+        self,
+        prompt: str,
+        max_tokens: int = 512,
+        temperature: float = 0.7,
+        top_p: float = 0.9,
+        **kwargs: Any,
+    ) -> str:
+        """Generate response using OpenAI API."""
+        if not self.is_initialized:
+            raise RuntimeError("Provider not initialized. Call initialize() first.")
+
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=top_p,
+            **kwargs,
+        )
+
+        return response.choices[0].message.content or ""
+
+    def generate_stream(
+        self,
+        prompt: str,
+        max_tokens: int = 512,
+        temperature: float = 0.7,
+        top_p: float = 0.9,
+        **kwargs: Any,
+    ) -> Iterator[str]:
+        """
+        Yield the response text incrementally as the API streams it back.
+
+        Args:
+            prompt: Input prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            top_p: Nucleus sampling parameter
+            **kwargs: Additional API arguments
+
+        Yields:
+            Text deltas in the order they are received
+        """
+        if not self.is_initialized:
+            raise RuntimeError("Provider not initialized. Call initialize() first.")
+
+        chunks = self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=top_p,
+            stream=True,
+            **kwargs,
+        )
+        for chunk in chunks:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    def generate_batch(
+        self,
+        prompts: list[str],
+        max_tokens: int = 512,
+        temperature: float = 0.7,
+        top_p: float = 0.9,
+        **kwargs: Any,
+    ) -> list[str]:
+        """
+        Generate responses for several prompts.
+
+        With ``batch_api`` enabled the prompts are submitted as a single Batch
+        API job, which is billed at a discount but blocks until the job
+        finishes; otherwise each prompt is sent as a regular request.
+
+        Args:
+            prompts: Input prompts
+            max_tokens: Maximum tokens to generate per prompt
+            temperature: Sampling temperature
+            top_p: Nucleus sampling parameter
+            **kwargs: Additional API arguments
+
+        Returns:
+            Generated responses, in the same order as ``prompts``
+
+        Raises:
+            RuntimeError: If the batch job, or any request in it, does not complete
+        """
+        if not self.batch_api:
+            return super().generate_batch(prompts, max_tokens, temperature, top_p, **kwargs)
+
+        if not self.is_initialized:
+            raise RuntimeError("Provider not initialized. Call initialize() first.")
+
+        requests = "\n".join(
+            json.dumps(
+                {
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": _BATCH_ENDPOINT,
+                    "body": {
+                        "model": self.model,
+                        "messages": [{"role": "user", "content": prompt}],
+                        "max_tokens": max_tokens,
+                        "temperature": temperature,
+                        "top_p": top_p,
+                        **kwargs,
+                    },
+                }
+            )
+            for i, prompt in enumerate(prompts)
+        )
+        input_file = self.client.files.create(
+            file=("batch.jsonl", requests.encode()), purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=_BATCH_ENDPOINT,
+            completion_window="24h",
+        )
+        logger.info("openai_batch_submitted", batch_id=batch.id, size=len(prompts))
+
+        while batch.status not in _BATCH_FINAL_STATES:
+            time.sleep(self.batch_poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            raise RuntimeError(f"OpenAI batch {batch.id} ended with status {batch.status}")
+
+        responses: list[Optional[str]] = [None] * len(prompts)
+        if batch.output_file_id:
+            output = self.client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                result = json.loads(line)
+                body = (result.get("response") or {}).get("body") or {}
+                choices = body.get("choices")
+                if choices:
+                    responses[int(result["custom_id"])] = choices[0]["message"]["content"] or ""
+
+        # An empty response would read as "no anomaly", so failed requests
+        # must not be passed off as answers
+        failed = sum(response is None for response in responses)
+        if failed:
+            logger.warning("openai_batch_incomplete", batch_id=batch.id, failed=failed)
+            raise RuntimeError(
+                f"OpenAI batch {batch.id} completed {len(prompts) - failed} of "
+                f"{len(prompts)} requests"
+            )
+        return [response for response in responses if response is not None]
+
+    def cleanup(self) -> None:
+        """Cleanup OpenAI resources."""
+        self.client = None
+        self.is_initialized = False
+        logger.info("openai_provider_cleaned_up")
+
+    def get_info(self) -> dict[str, Any]:
+        """Get OpenAI provider info."""
+        return {
+            "provider": "openai",
+            "model": self.model,
+            "initialized": self.is_initialized,
+        }
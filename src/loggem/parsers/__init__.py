@@ -1,19 +1,44 @@
 """Log parsers for various formats."""
 
-from loggem.parsers.apache import ApacheLogParser
-from loggem.parsers.auth import AuthLogParser
-from loggem.parsers.base import BaseParser
-from loggem.parsers.docker import DockerParser
-from loggem.parsers.factory import LogParserFactory
-from loggem.parsers.haproxy import HAProxyParser
-from loggem.parsers.json_parser import JSONParser
-from loggem.parsers.kubernetes import KubernetesParser
-from loggem.parsers.mysql import MySQLParser
-from loggem.parsers.nginx import NginxParser
-from loggem.parsers.postgresql import PostgreSQLParser
-from loggem.parsers.redis import RedisParser
-from loggem.parsers.syslog import SyslogParser
-from loggem.parsers.windows_event import WindowsEventLogParser
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from loggem.parsers.apache import ApacheLogParser
+    from loggem.parsers.auth import AuthLogParser
+    from loggem.parsers.base import BaseParser
+    from loggem.parsers.docker import DockerParser
+    from loggem.parsers.factory import LogParserFactory
+    from loggem.parsers.haproxy import HAProxyParser
+    from loggem.parsers.json_parser import JSONParser
+    from loggem.parsers.kubernetes import KubernetesParser
+    from loggem.parsers.mysql import MySQLParser
+    from loggem.parsers.nginx import NginxParser
+    from loggem.parsers.postgresql import PostgreSQLParser
+    from loggem.parsers.redis import RedisParser
+    from loggem.parsers.syslog import SyslogParser
+    from loggem.parsers.windows_event import WindowsEventLogParser
+
+# Parser modules are imported on first use (PEP 562), so importing this
+# package does not compile every parser's regular expressions up front
+_LAZY = {
+    "LogParserFactory": "loggem.parsers.factory",
+    "BaseParser": "loggem.parsers.base",
+    "SyslogParser": "loggem.parsers.syslog",
+    "JSONParser": "loggem.parsers.json_parser",
+    "NginxParser": "loggem.parsers.nginx",
+    "AuthLogParser": "loggem.parsers.auth",
+    "ApacheLogParser": "loggem.parsers.apache",
+    "WindowsEventLogParser": "loggem.parsers.windows_event",
+    "PostgreSQLParser": "loggem.parsers.postgresql",
+    "MySQLParser": "loggem.parsers.mysql",
+    "DockerParser": "loggem.parsers.docker",
+    "KubernetesParser": "loggem.parsers.kubernetes",
+    "HAProxyParser": "loggem.parsers.haproxy",
+    "RedisParser": "loggem.parsers.redis",
+}
 
 __all__ = [
     "LogParserFactory",
@@ -31,3 +56,18 @@ __all__ = [
     "HAProxyParser",
     "RedisParser",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a parser class the first time it is accessed."""
+    module_path = _LAZY.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    obj = getattr(importlib.import_module(module_path), name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> list[str]:
+    """Include lazily imported parsers in dir()."""
+    return sorted(set(globals()) | set(__all__))
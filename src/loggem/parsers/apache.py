@@ -11,9 +11,10 @@ Example formats:
     Combined: 127.0.0.1 - frank [10/Oct/2000:13:55:36 -0700] "GET /apache_pb.gif HTTP/1.0" 200 2326 "http://www.example.com/start.html" "Mozilla/4.08"
 """
 
+import functools
 import re
+from collections.abc import Sequence
 from datetime import datetime
-from pathlib import Path
 from typing import Optional
 
 from ..core.logging import get_logger
@@ -22,17 +23,148 @@ from .base import BaseParser
 
 logger = get_logger(__name__)
 
+# Access log fields, in the order returned by _tokenize_clf
+_CLF_FIELDS = (
+    "ip",
+    "identity",
+    "user",
+    "timestamp",
+    "method",
+    "path",
+    "protocol",
+    "status",
+    "size",
+    "referer",
+    "user_agent",
+)
+
+_REQUEST_PARTS = ("method", "path", "protocol")
+
+# Error log fields, in the order passed to _parse_error_log
+_ERROR_FIELDS = ("timestamp", "level", "client", "message")
+
+# Error log levels mapped to LogEntry levels
+_ERROR_LEVELS = {
+    "emerg": "critical",
+    "alert": "critical",
+    "crit": "critical",
+    "error": "error",
+    "warn": "warning",
+    "notice": "info",
+    "info": "info",
+    "debug": "debug",
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_access_time(timestamp_base: str) -> datetime:
+    """Parse an access log timestamp without its zone, memoized since lines share seconds."""
+    return datetime.strptime(timestamp_base, "%d/%b/%Y:%H:%M:%S")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_error_time(timestamp_base: str) -> datetime:
+    """Parse an error log timestamp without its fraction, memoized like access times."""
+    return datetime.strptime(timestamp_base, "%a %b %d %H:%M:%S %Y")
+
+
+def _tokenize_clf(line: str) -> Optional[tuple[Optional[str], ...]]:
+    """
+    Split a Common or Combined Log Format line into its fields.
+
+    Walks the line once with ``str.find`` instead of matching a regex: the
+    format is fully delimited by single spaces, ``[...]`` and ``"..."``.
+
+    Args:
+        line: Stripped access log line
+
+    Returns:
+        Field values in ``_CLF_FIELDS`` order (path and protocol are None
+        when the request line has fewer parts, referer and user agent are
+        None for Common Log Format), or None if the line does not have the
+        expected shape
+    """
+    ip_end = line.find(" ")
+    if ip_end < 1:
+        return None
+    identity_end = line.find(" ", ip_end + 1)
+    if identity_end <= ip_end + 1:
+        return None
+    user_end = line.find(" ", identity_end + 1)
+    if user_end <= identity_end + 1 or not line.startswith(" [", user_end):
+        return None
+
+    timestamp_end = line.find("]", user_end + 2)
+    if timestamp_end <= user_end + 2 or not line.startswith(' "', timestamp_end + 1):
+        return None
+    request_end = line.find('"', timestamp_end + 3)
+    if request_end < 0 or line[request_end + 1 : request_end + 2] != " ":
+        return None
+
+    status = line[request_end + 2 : request_end + 5]
+    if (
+        len(status) != 3
+        or not (status.isascii() and status.isdecimal())
+        or line[request_end + 5 : request_end + 6] != " "
+    ):
+        return None
+    size_end = line.find(" ", request_end + 6)
+    size = line[request_end + 6 :] if size_end < 0 else line[request_end + 6 : size_end]
+    if size != "-" and not (size.isascii() and size.isdecimal()):
+        return None
+
+    referer = user_agent = None
+    if size_end >= 0 and line.startswith(' "', size_end):
+        referer_end = line.find('"', size_end + 2)
+        if referer_end >= 0 and line.startswith(' "', referer_end + 1):
+            user_agent_end = line.find('"', referer_end + 3)
+            if user_agent_end >= 0:
+                referer = line[size_end + 2 : referer_end]
+                user_agent = line[referer_end + 3 : user_agent_end]
+
+    # Request line: method, path and protocol, the protocol taking any remainder
+    request_start = timestamp_end + 3
+    path = protocol = None
+    method_end = line.find(" ", request_start, request_end)
+    if method_end < 0:
+        method = line[request_start:request_end]
+    else:
+        method = line[request_start:method_end]
+        path_end = line.find(" ", method_end + 1, request_end)
+        if path_end < 0:
+            path = line[method_end + 1 : request_end]
+        else:
+            path = line[method_end + 1 : path_end]
+            protocol = line[path_end + 1 : request_end]
+
+    return (
+        line[:ip_end],
+        line[ip_end + 1 : identity_end],
+        line[identity_end + 1 : user_end],
+        line[user_end + 2 : timestamp_end],
+        method,
+        path,
+        protocol,
+        status,
+        size,
+        referer,
+        user_agent,
+    )
+
 
 class ApacheLogParser(BaseParser):
     """Parser for Apache web server logs (access and error logs)"""
 
+    __slots__ = ("log_type", "custom_pattern", "_pattern_cache")
+
     # Common Log Format (CLF)
     COMMON_LOG_PATTERN = re.compile(
         r"^(?P<ip>[\d\.]+|\S+)\s+"  # IP address or hostname
         r"(?P<identity>\S+)\s+"  # RFC 1413 identity
         r"(?P<user>\S+)\s+"  # HTTP auth user
         r"\[(?P<timestamp>[^\]]+)\]\s+"  # Timestamp
-        r'"(?P<request>[^"]*?)"\s+'  # Request line
+        r'"(?P<request>(?P<method>[^" ]*)'  # Request line: method,
+        r'(?: (?P<path>[^" ]*))?(?: (?P<protocol>[^"]*?))?)"\s+'  # path and protocol
         r"(?P<status>\d{3})\s+"  # Status code
         r"(?P<size>\d+|-)"  # Response size
     )
@@ -43,7 +175,7 @@ class ApacheLogParser(BaseParser):
         r"(?P<identity>\S+)\s+"
         r"(?P<user>\S+)\s+"
         r"\[(?P<timestamp>[^\]]+)\]\s+"
-        r'"(?P<request>[^"]*?)"\s+'
+        r'"(?P<request>(?P<method>[^" ]*)(?: (?P<path>[^" ]*))?(?: (?P<protocol>[^"]*?))?)"\s+'
         r"(?P<status>\d{3})\s+"
         r"(?P<size>\d+|-)\s+"
         r'"(?P<referer>[^"]*)"\s+'  # Referer
@@ -90,12 +222,24 @@ class ApacheLogParser(BaseParser):
             return self.COMBINED_LOG_PATTERN
         return self.COMMON_LOG_PATTERN
 
-    def parse_line(self, line: str) -> Optional[LogEntry]:
+    def _may_match(self, line: str) -> bool:
+        """Cheaply reject lines the built-in patterns cannot match"""
+        if self.custom_pattern:
+            return True
+
+        if self.log_type == "error":
+            return line.startswith("[")
+
+        # Access logs need a bracketed timestamp and a quoted request line
+        return "[" in line and '"' in line
+
+    def parse_line(self, line: str, line_number: int = 0) -> Optional[LogEntry]:
         """
         Parse a single Apache log line
 
         Args:
             line: Raw log line
+            line_number: Line number for error reporting
 
         Returns:
             LogEntry if parsing succeeds, None otherwise
@@ -105,8 +249,14 @@ class ApacheLogParser(BaseParser):
             return None
 
         try:
+            if self.log_type != "error" and self.custom_pattern is None:
+                fields = _tokenize_clf(line)
+                if fields is not None:
+                    return self._parse_access_log(fields, line)
+
+            # Custom formats, error logs and irregular spacing go through the regexes
             pattern = self._get_pattern(line)
-            match = pattern.match(line)
+            match = pattern.match(line) if self._may_match(line) else None
 
             if not match:
                 logger.debug(
@@ -114,41 +264,59 @@ class ApacheLogParser(BaseParser):
                 )
                 return None
 
+            if pattern is self.ERROR_LOG_PATTERN:
+                # Read the groups straight off the match; no dict needed
+                return self._parse_error_log(match.group(*_ERROR_FIELDS), line)
+
+            # Custom patterns may define any subset of the groups
             data = match.groupdict()
 
             # Parse based on log type
             if self.log_type == "error":
-                return self._parse_error_log(data, line)
-            return self._parse_access_log(data, line)
+                return self._parse_error_log([data.get(field) for field in _ERROR_FIELDS], line)
+            if data.get("method") is None:
+                # Custom pattern that only captures the whole request line
+                request = data.get("request") or ""
+                data.update(zip(_REQUEST_PARTS, request.split(" ", 2)))
+            return self._parse_access_log([data.get(field) for field in _CLF_FIELDS], line)
 
         except Exception as e:
             logger.error("apache_parse_error", error=str(e), line=line[:100])
             return None
 
-    def _parse_access_log(self, data: dict, raw_line: str) -> LogEntry:
-        """Parse access log entry"""
+    def _parse_access_log(self, fields: Sequence[Optional[str]], raw_line: str) -> LogEntry:
+        """Parse access log entry from its fields in ``_CLF_FIELDS`` order (None where absent)"""
+        (
+            ip,
+            _identity,
+            user,
+            timestamp_str,
+            method,
+            path,
+            protocol,
+            status_str,
+            size,
+            referer,
+            user_agent,
+        ) = fields
+
         # Parse timestamp (Apache format: 10/Oct/2000:13:55:36 -0700)
         try:
-            timestamp_str = data.get("timestamp", "")
+            timestamp_str = timestamp_str or ""
             # Remove timezone for easier parsing
             timestamp_base = (
                 timestamp_str.rsplit(" ", 1)[0] if " " in timestamp_str else timestamp_str
             )
-            timestamp = datetime.strptime(timestamp_base, "%d/%b/%Y:%H:%M:%S")
+            timestamp = _parse_access_time(timestamp_base)
         except:
-            timestamp = datetime.now()
+            timestamp = self._now()
 
-        # Parse request
-        request = data.get("request", "")
-        method, path, protocol = "", "", ""
-        if request:
-            parts = request.split(" ", 2)
-            method = parts[0] if len(parts) > 0 else ""
-            path = parts[1] if len(parts) > 1 else ""
-            protocol = parts[2] if len(parts) > 2 else ""
+        method = method or ""
+        path = path or ""
+        protocol = protocol or ""
 
         # Determine severity based on status code
-        status = int(data.get("status", 0))
+        status = int(status_str or 0)
         if status >= 500:
             level = "error"
         elif status >= 400:
@@ -157,62 +325,66 @@ class ApacheLogParser(BaseParser):
             level = "info"
 
         # Build message
-        user = data.get("user", "-")
-        user_info = f" (user: {user})" if user != "-" else ""
+        user_info = f" (user: {user})" if user is not None and user != "-" else ""
 
-        message = f"{method} {path} {protocol} - Status {status}{user_info}"
+        # Combined Log Format always has both; format those lines in one pass
+        if referer is not None and user_agent is not None:
+            message = (
+                f"{method} {path} {protocol} - Status {status}{user_info}"
+                f" | Referer: {referer} | UA: {user_agent}"
+            )
+        else:
+            message = f"{method} {path} {protocol} - Status {status}{user_info}"
 
-        # Add referer and user agent if available
-        if "referer" in data:
-            message += f" | Referer: {data['referer']}"
-        if "user_agent" in data:
-            message += f" | UA: {data['user_agent']}"
+            # Add referer or user agent if a custom pattern captured one
+            if referer is not None:
+                message += f" | Referer: {referer}"
+            if user_agent is not None:
+                message += f" | UA: {user_agent}"
 
         return LogEntry(
             timestamp=timestamp,
             level=level,
             message=message,
-            source=data.get("ip", "unknown"),
+            source=ip if ip is not None else "unknown",
             raw=raw_line,
             metadata={
-                "ip": data.get("ip"),
-                "user": data.get("user"),
+                "ip": ip,
+                "user": user,
                 "method": method,
                 "path": path,
                 "protocol": protocol,
                 "status": status,
-                "size": data.get("size", "-"),
-                "referer": data.get("referer"),
-                "user_agent": data.get("user_agent"),
+                "size": size if size is not None else "-",
+                "referer": referer,
+                "user_agent": user_agent,
             },
         )
 
-    def _parse_error_log(self, data: dict, raw_line: str) -> LogEntry:
-        """Parse error log entry"""
+    def _parse_error_log(self, fields: Sequence[Optional[str]], raw_line: str) -> LogEntry:
+        """Parse error log entry from its fields in ``_ERROR_FIELDS`` order (None where absent)"""
+        timestamp_str, apache_level, client, message = fields
+
         # Parse timestamp
         try:
-            timestamp_str = data.get("timestamp", "")
-            # Apache error log: Mon Oct 10 13:55:36 2000
-            timestamp = datetime.strptime(timestamp_str.split(".")[0], "%a %b %d %H:%M:%S %Y")
+            # Apache error log: Mon Oct 10 13:55:36[.123456] 2000; drop the fraction
+            head, dot, tail = (timestamp_str or "").partition(".")
+            if dot:
+                _fraction, space, year = tail.partition(" ")
+                head += space + year
+            timestamp = _parse_error_time(head)
         except:
-            timestamp = datetime.now()
+            timestamp = self._now()
 
-        level_map = {
-            "emerg": "critical",
-            "alert": "critical",
-            "crit": "critical",
-            "error": "error",
-            "warn": "warning",
-            "notice": "info",
-            "info": "info",
-            "debug": "debug",
-        }
+        # Apache writes its level tokens in lowercase, so lowercase only the rest
+        apache_level = apache_level or "info"
+        level = _ERROR_LEVELS.get(apache_level)
+        if level is None:
+            apache_level = apache_level.lower()
+            level = _ERROR_LEVELS.get(apache_level, "info")
 
-        apache_level = data.get("level", "info").lower()
-        level = level_map.get(apache_level, "info")
-
-        message = data.get("message", "")
-        client = data.get("client", "unknown")
+        message = message or ""
+        client = client or "unknown"
 
         if client != "unknown":
             message = f"[Client: {client}] {message}"
@@ -245,43 +417,3 @@ class ApacheLogParser(BaseParser):
 
         # Check for Apache error log patterns
         return bool(self.ERROR_LOG_PATTERN.search(sample))
-
-    def parse_file(self, file_path: str) -> list[LogEntry]:
-        """
-        Parse an Apache log file
-
-        Args:
-            file_path: Path to log file
-
-        Returns:
-            List of parsed log entries
-        """
-        path = Path(file_path)
-        if not path.exists():
-            logger.error("file_not_found", path=str(path))
-            return []
-
-        logger.info(
-            "parsing_file",
-            parser="ApacheLogParser",
-            path=str(path),
-            size=path.stat().st_size,
-            log_type=self.log_type,
-        )
-
-        entries = []
-        with open(path, encoding="utf-8", errors="replace") as f:
-            for _line_num, line in enumerate(f, 1):
-                entry = self.parse_line(line)
-                if entry:
-                    entries.append(entry)
-
-        logger.info(
-            "parsed_file",
-            parser="ApacheLogParser",
-            path=str(path),
-            entries=len(entries),
-            log_type=self.log_type,
-        )
-
-        return entries
@@ -4,12 +4,42 @@ Authentication log parser for Linux auth.log and secure logs.
 
 from __future__ import annotations
 
+import functools
 import re
-from datetime import datetime
 from typing import Optional
 
 from loggem.core.models import LogEntry
-from loggem.parsers.base import BaseParser
+from loggem.parsers.base import BaseParser, _combine_patterns, _parse_syslog_time
+
+# Metadata every SSH/sudo event starts from (copied per entry)
+_SSH_METADATA = {"service": "ssh"}
+_SUDO_METADATA = {"service": "sudo"}
+
+
+@functools.lru_cache(maxsize=256)
+def _process_family(process: str) -> Optional[str]:
+    """
+    Classify a process name as "sshd", "sudo" or neither.
+
+    Memoized because auth logs repeat a handful of process names, so each
+    is lowercased once rather than on every line.
+    """
+    lowered = process.lower()
+    if "sshd" in lowered:
+        return "sshd"
+    if "sudo" in lowered:
+        return "sudo"
+    return None
+
+
+# Message keywords marking a generic authentication failure
+_FAILURE_KEYWORDS = ("failed", "failure", "error", "denied")
+
+
+def _mentions_failure(message: str) -> bool:
+    """Check a message for a failure keyword, lowercasing it only once."""
+    lowered = message.lower()
+    return any(keyword in lowered for keyword in _FAILURE_KEYWORDS)
 
 
 class AuthLogParser(BaseParser):
@@ -20,41 +50,63 @@ class AuthLogParser(BaseParser):
     sudo usage, and authentication failures.
     """
 
+    __slots__ = ()
+
     # Common auth log pattern
     # Oct  5 10:15:30 hostname sshd[12345]: Failed password for invalid user admin from 192.168.1.1 port 22 ssh2
     AUTH_PATTERN = re.compile(
         r"^(?P<timestamp>\w+\s+\d+\s+\d+:\d+:\d+)\s+"
         r"(?P<hostname>\S+)\s+"
-        r"(?P<process>\S+?)(?:\[(?P<pid>\d+)\])?:\s+"
+        r"(?P<process>\S+?)(?:\[(?P<pid>\d{1,10})\])?:\s+"
         r"(?P<message>.*)$"
     )
 
-    # SSH-specific patterns
-    SSH_PATTERNS = {
-        "failed_password": re.compile(
-            r"Failed password for (invalid user )?(?P<user>\S+) from (?P<ip>[\d\.]+) port (?P<port>\d+)"
+    # SSH-specific patterns as (event_type, pattern) pairs, most frequent first
+    SSH_PATTERNS = (
+        (
+            "failed_password",
+            re.compile(
+                r"Failed password for (invalid user )?(?P<user>\S+) from (?P<ip>[\d\.]+) port (?P<port>\d+)"
+            ),
         ),
-        "accepted_password": re.compile(
-            r"Accepted password for (?P<user>\S+) from (?P<ip>[\d\.]+) port (?P<port>\d+)"
+        (
+            "accepted_password",
+            re.compile(
+                r"Accepted password for (?P<user>\S+) from (?P<ip>[\d\.]+) port (?P<port>\d+)"
+            ),
         ),
-        "accepted_publickey": re.compile(
-            r"Accepted publickey for (?P<user>\S+) from (?P<ip>[\d\.]+) port (?P<port>\d+)"
+        (
+            "accepted_publickey",
+            re.compile(
+                r"Accepted publickey for (?P<user>\S+) from (?P<ip>[\d\.]+) port (?P<port>\d+)"
+            ),
         ),
-        "invalid_user": re.compile(r"Invalid user (?P<user>\S+) from (?P<ip>[\d\.]+)"),
-        "connection_closed": re.compile(
-            r"Connection closed by (authenticating user )?(?P<user>\S+)? ?(?P<ip>[\d\.]+) port (?P<port>\d+)"
+        ("invalid_user", re.compile(r"Invalid user (?P<user>\S+) from (?P<ip>[\d\.]+)")),
+        (
+            "connection_closed",
+            re.compile(
+                r"Connection closed by (authenticating user )?(?P<user>\S+)? ?(?P<ip>[\d\.]+) port (?P<port>\d+)"
+            ),
         ),
-    }
+    )
 
-    # Sudo patterns
-    SUDO_PATTERNS = {
-        "sudo_command": re.compile(
-            r"(?P<user>\S+) : TTY=(?P<tty>\S+) ; PWD=(?P<pwd>\S+) ; USER=(?P<target_user>\S+) ; COMMAND=(?P<command>.*)"
+    # Sudo patterns as (event_type, pattern) pairs, most frequent first
+    SUDO_PATTERNS = (
+        (
+            "sudo_command",
+            re.compile(
+                r"(?P<user>\S+) : TTY=(?P<tty>\S+) ; PWD=(?P<pwd>\S+) ; USER=(?P<target_user>\S+) ; COMMAND=(?P<command>.*)"
+            ),
         ),
-        "sudo_failed": re.compile(
-            r"(?P<user>\S+) : (?P<failure_count>\d+) incorrect password attempt"
+        (
+            "sudo_failed",
+            re.compile(r"(?P<user>\S+) : (?P<failure_count>\d+) incorrect password attempt"),
         ),
-    }
+    )
+
+    # All patterns of each family in one regex, so a line is scanned once
+    SSH_COMBINED, _SSH_GROUPS = _combine_patterns(SSH_PATTERNS)
+    SUDO_COMBINED, _SUDO_GROUPS = _combine_patterns(SUDO_PATTERNS)
 
     def parse_line(self, line: str, line_number: int = 0) -> Optional[LogEntry]:
         """
@@ -72,18 +124,15 @@ class AuthLogParser(BaseParser):
             self.logger.debug("unrecognized_auth_format", line=line[:100])
             return None
 
-        data = match.groupdict()
-
-        # Parse timestamp (auth logs don't include year)
-        timestamp = self._parse_timestamp(
-            data["timestamp"],
-            ["%b %d %H:%M:%S", "%b  %d %H:%M:%S"],
+        timestamp_str, hostname, process, pid, message = match.group(
+            "timestamp", "hostname", "process", "pid", "message"
         )
-        if not timestamp:
-            timestamp = datetime.now()
 
-        message = data["message"]
-        process = data["process"]
+        # Parse timestamp (auth logs don't include year)
+        timestamp = _parse_syslog_time(timestamp_str, self._now().year)
+        if timestamp is None:
+            # e.g. a lowercase month name; dateutil is more forgiving
+            timestamp = self._parse_timestamp(timestamp_str, []) or self._now()
 
         # Determine log level and extract security events
         level = "INFO"
@@ -91,34 +140,34 @@ class AuthLogParser(BaseParser):
         user = None
         host = None
 
+        family = _process_family(process)
+
         # Check for SSH events
-        if "sshd" in process.lower():
+        if family == "sshd":
             level, metadata, user, host = self._parse_ssh_event(message)
         # Check for sudo events
-        elif "sudo" in process.lower():
+        elif family == "sudo":
             level, metadata, user = self._parse_sudo_event(message)
         # Check for su events
-        elif process in ["su", "su-session"]:
+        elif process in ("su", "su-session"):
             level = "WARNING" if "failed" in message.lower() else "INFO"
             user = self._extract_user(message)
         # Check for authentication failures
-        elif any(
-            keyword in message.lower() for keyword in ["failed", "failure", "error", "denied"]
-        ):
+        elif _mentions_failure(message):
             level = "WARNING"
             user = self._extract_user(message)
             host = self._extract_ip(message)
 
         # Add process info to metadata
-        if data.get("pid"):
-            metadata["pid"] = data["pid"]
+        if pid:
+            metadata["pid"] = pid
 
         return LogEntry(
             timestamp=timestamp,
             source=self.source_name,
             message=message,
             level=level,
-            host=host or data["hostname"],
+            host=host or hostname,
             user=user,
             process=process,
             metadata=metadata,
@@ -133,27 +182,27 @@ class AuthLogParser(BaseParser):
             Tuple of (level, metadata, user, host)
         """
         level = "INFO"
-        metadata = {"service": "ssh"}
+        metadata = _SSH_METADATA.copy()
         user = None
         host = None
 
-        for event_type, pattern in self.SSH_PATTERNS.items():
-            match = pattern.search(message)
-            if match:
-                event_data = match.groupdict()
-                metadata["event_type"] = event_type
-                metadata.update({k: v for k, v in event_data.items() if v})
-
-                user = event_data.get("user")
-                host = event_data.get("ip")
+        match = self.SSH_COMBINED.search(message)
+        if match and match.lastgroup:
+            event_type = match.lastgroup
+            metadata["event_type"] = event_type
+            for group, name in self._SSH_GROUPS[event_type]:
+                value = match[group]
+                if value:
+                    metadata[name] = value
 
-                # Set appropriate level
-                if "failed" in event_type or "invalid" in event_type:
-                    level = "WARNING"
-                elif "accepted" in event_type:
-                    level = "INFO"
+            user = metadata.get("user")
+            host = metadata.get("ip")
 
-                break
+            # Set appropriate level
+            if "failed" in event_type or "invalid" in event_type:
+                level = "WARNING"
+            elif "accepted" in event_type:
+                level = "INFO"
 
         return level, metadata, user, host
 
@@ -165,24 +214,24 @@ class AuthLogParser(BaseParser):
             Tuple of (level, metadata, user)
         """
         level = "INFO"
-        metadata = {"service": "sudo"}
+        metadata = _SUDO_METADATA.copy()
         user = None
 
-        for event_type, pattern in self.SUDO_PATTERNS.items():
-            match = pattern.search(message)
-            if match:
-                event_data = match.groupdict()
-                metadata["event_type"] = event_type
-                metadata.update({k: v for k, v in event_data.items() if v})
-
-                user = event_data.get("user")
-
-                # Sudo commands are security-relevant
-                if "command" in event_type:
-                    level = "WARNING"  # All sudo usage is noteworthy
-                elif "failed" in event_type:
-                    level = "ERROR"
-
-                break
+        match = self.SUDO_COMBINED.search(message)
+        if match and match.lastgroup:
+            event_type = match.lastgroup
+            metadata["event_type"] = event_type
+            for group, name in self._SUDO_GROUPS[event_type]:
+                value = match[group]
+                if value:
+                    metadata[name] = value
+
+            user = metadata.get("user")
+
+            # Sudo commands are security-relevant
+            if "command" in event_type:
+                level = "WARNING"  # All sudo usage is noteworthy
+            elif "failed" in event_type:
+                level = "ERROR"
 
         return level, metadata, user
@@ -6,19 +6,275 @@ All log parsers inherit from BaseParser and implement the parse methods.
 
 from __future__ import annotations
 
+import functools
+import io
+import mmap
+import multiprocessing
+import os
+import pickle
 import re
+import string
+import sys
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
-from datetime import datetime
+from collections import deque
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta, timezone
+from multiprocessing.pool import AsyncResult, Pool
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from loggem.core.config import get_settings
 from loggem.core.logging import get_logger
 from loggem.core.models import LogEntry
 
+try:
+    import re2
+
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
 logger = get_logger(__name__)
 
+_IPV4_PATTERN = re.compile(r"\b(?:\d{1,3}\.){3}\d{1,3}\b")
+_IPV6_PATTERN = re.compile(r"\b(?:[0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}\b")
+
+# Markers that usually precede the client address in auth messages
+_IP_MARKERS = (" from ", "rhost=")
+
+
+def _is_dotted_quad(token: str) -> bool:
+    """Check a token is four groups of one to three digits, as _IPV4_PATTERN matches."""
+    parts = token.split(".")
+    return len(parts) == 4 and all(0 < len(p) <= 3 and p.isdecimal() for p in parts)
+
+
+# User patterns tried after the hand-rolled r"user[=:]?\s*(name)" scan
+_USER_FALLBACK_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"for\s+([a-zA-Z0-9_-]+)",
+        r"by\s+([a-zA-Z0-9_-]+)",
+        r"from\s+user\s+([a-zA-Z0-9_-]+)",
+    )
+)
+_USER_PATTERN = re.compile(r"user[=:]?\s*([a-zA-Z0-9_-]+)", re.IGNORECASE)
+_USER_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+
+# Month abbreviations as written in syslog-style timestamps
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"),
+        start=1,
+    )
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_syslog_time(timestamp_str: str, year: int) -> Optional[datetime]:
+    """
+    Parse a year-less syslog-style timestamp such as "Oct  5 10:15:30".
+
+    Splits the fields and looks the month up in a table rather than going
+    through strptime. Memoized because bursts of lines share the same second.
+
+    Args:
+        timestamp_str: Month, day and time separated by whitespace
+        year: Year to place the timestamp in
+
+    Returns:
+        Parsed datetime, or None if the fields do not form a valid date
+    """
+    try:
+        month, day, clock = timestamp_str.split()
+        hour, minute, second = clock.split(":")
+        return datetime(year, _MONTHS[month], int(day), int(hour), int(minute), int(second))
+    except (KeyError, ValueError):
+        return None
+
+
+def _parse_date_time(year: str, month: int | str, day: str, clock: str) -> Optional[datetime]:
+    """
+    Build a datetime from date fields and an "HH:MM:SS[.fraction]" clock.
+
+    The shared core of the fixed-shape timestamp parsers below: slicing
+    and int() are several times faster than matching a strptime format.
+
+    Args:
+        year: Four-digit year
+        month: Month number
+        day: Day of the month
+        clock: Time of day, with an optional fraction of any length
+
+    Returns:
+        Parsed datetime, or None if a field is malformed or out of range
+    """
+    try:
+        hms, _, fraction = clock.partition(".")
+        hour, minute, second = hms.split(":")
+        return datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour),
+            int(minute),
+            int(second),
+            int(fraction[:6].ljust(6, "0")) if fraction else 0,
+        )
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_ymd_time(timestamp_str: str, separator: str = "-") -> Optional[datetime]:
+    """
+    Parse a timestamp such as "2024-01-15 10:30:45.123 UTC".
+
+    Any field after the clock (a zone name) is ignored, so the result is naive.
+    Memoized, like _parse_syslog_time().
+
+    Args:
+        timestamp_str: Date and clock separated by whitespace
+        separator: Separator between the date fields
+
+    Returns:
+        Parsed datetime, or None if the timestamp is malformed
+    """
+    try:
+        date, clock = timestamp_str.split()[:2]
+        year, month, day = date.split(separator)
+    except ValueError:
+        return None
+    return _parse_date_time(year, month, day, clock)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_clf_time(timestamp_str: str) -> Optional[datetime]:
+    """
+    Parse a Common Log Format timestamp such as "10/Oct/2023:13:55:36 +0000".
+
+    Memoized, like _parse_syslog_time().
+
+    Args:
+        timestamp_str: Timestamp with an optional numeric UTC offset
+
+    Returns:
+        Parsed datetime, aware when an offset is present, or None if the
+        timestamp is malformed
+    """
+    stamp, _, offset = timestamp_str.partition(" ")
+    date, _, clock = stamp.partition(":")
+    try:
+        day, month, year = date.split("/")
+    except ValueError:
+        return None
+    parsed = _parse_date_time(year, _MONTHS.get(month, 0), day, clock)
+    if parsed is None or not offset:
+        return parsed
+    digits = offset[1:]
+    if len(offset) != 5 or offset[0] not in "+-" or not (digits.isascii() and digits.isdecimal()):
+        return None
+    delta = timedelta(hours=int(offset[1:3]), minutes=int(offset[3:5]))
+    return parsed.replace(tzinfo=timezone(-delta if offset[0] == "-" else delta))
+
+
+@functools.lru_cache(maxsize=4096)
+def _strptime(timestamp_str: str, fmt: str) -> Optional[datetime]:
+    """
+    Parse a timestamp with datetime.strptime, shared by all parsers.
+
+    Memoized, failures included, so a burst of lines from the same second
+    costs one strptime call per format tried.
+
+    Args:
+        timestamp_str: Timestamp string to parse
+        fmt: strftime format string
+
+    Returns:
+        Parsed datetime, or None if the string does not match the format
+    """
+    try:
+        return datetime.strptime(timestamp_str, fmt)
+    except ValueError:
+        return None
+
+
+def _parse_iso_time(timestamp_str: str) -> Optional[datetime]:
+    """
+    Parse an RFC 3339 UTC timestamp such as "2024-01-15T10:30:45.123456789Z".
+
+    The result is naive and truncated to microseconds.
+
+    Args:
+        timestamp_str: Timestamp with an optional fraction and trailing "Z"
+
+    Returns:
+        Parsed datetime, or None if the timestamp is malformed
+    """
+    trimmed = timestamp_str.rstrip("Z")[:26]
+    try:
+        return datetime.fromisoformat(trimmed)
+    except ValueError:
+        pass
+    # Before Python 3.11 fromisoformat() only takes 3 or 6 fractional digits
+    try:
+        return datetime.strptime(trimmed, "%Y-%m-%dT%H:%M:%S.%f")
+    except ValueError:
+        return None
+
+
+_GROUP_NAME = re.compile(r"\(\?P<(\w+)>")
+
+
+def _compile(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    """
+    Compile a line pattern with RE2 when google-re2 is installed.
+
+    RE2 matches in time linear in the line length whatever the input, so a
+    crafted line cannot make the pattern backtrack. Its character classes
+    are ASCII-only, like re.ASCII. Patterns RE2 rejects, and every pattern
+    when it is not installed, are compiled with re and ``flags``.
+    """
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile(pattern)
+        except Exception:
+            pass
+    return re.compile(pattern, flags)
+
+
+def _combine_patterns(
+    patterns: tuple[tuple[str, re.Pattern[str]], ...],
+) -> tuple[re.Pattern[str], dict[str, tuple[tuple[str, str], ...]]]:
+    """
+    Join (name, pattern) pairs into a single alternation.
+
+    Each pattern becomes a branch wrapped in a group with its name, so
+    ``match.lastgroup`` tells which branch matched, and its own named groups
+    are prefixed by that name so that names stay unique across branches.
+
+    Args:
+        patterns: Named patterns in priority order
+
+    Returns:
+        Tuple of (combined pattern, mapping of branch name to
+        (combined group name, original group name) pairs). The pattern is
+        compiled with RE2 when google-re2 is installed, since its automaton
+        matches all branches in one linear-time pass. Otherwise it is
+        compiled with the union of the branches' flags.
+    """
+    branches = []
+    groups = {}
+    flags = 0
+    for event_type, pattern in patterns:
+        # re.UNICODE is implied for str patterns and clashes with re.ASCII
+        flags |= pattern.flags & ~re.UNICODE
+        body = _GROUP_NAME.sub(rf"(?P<{event_type}__\1>", pattern.pattern)
+        branches.append(f"(?P<{event_type}>{body})")
+        groups[event_type] = tuple((f"{event_type}__{name}", name) for name in pattern.groupindex)
+    return _compile("|".join(branches), flags), groups
+
 
 class ParserError(Exception):
     """Raised when parsing fails."""
@@ -34,6 +290,19 @@ class BaseParser(ABC):
     parse_file() for optimized batch parsing.
     """
 
+    # Parsers hold a few fixed attributes, so they need no instance dict;
+    # subclasses declare their own (possibly empty) __slots__
+    __slots__ = ("source_name", "settings", "max_line_length", "logger", "_batch_now")
+
+    # Lines parsed between clock reads while a batch is being parsed
+    NOW_REFRESH_LINES = 1000
+
+    # Approximate bytes per task when a file is parsed across processes
+    PARALLEL_CHUNK_SIZE = 8 * 1024 * 1024
+
+    # Tasks queued or parsed ahead of the consumer, per worker process
+    PARALLEL_CHUNKS_AHEAD = 2
+
     def __init__(self, source_name: str = "unknown") -> None:
         """
         Initialize parser.
@@ -41,16 +310,20 @@ class BaseParser(ABC):
         Args:
             source_name: Name to identify the source of logs
         """
-        self.source_name = source_name
+        self.source_name = sys.intern(source_name)
         self.settings = get_settings()
         self.max_line_length = self.settings.security.max_line_length
         self.logger = logger.bind(parser=self.__class__.__name__)
+        self._batch_now: Optional[datetime] = None
 
     @abstractmethod
     def parse_line(self, line: str, line_number: int = 0) -> Optional[LogEntry]:
         """
         Parse a single log line.
 
+        parse_file() and parse_lines() never pass blank lines and strip the
+        trailing newline, but other whitespace is left to the parser.
+
         Args:
             line: Raw log line to parse
             line_number: Line number in the file (for error reporting)
@@ -89,38 +362,180 @@ class BaseParser(ABC):
         self.logger.info("parsing_file", path=str(file_path), size=file_size)
 
         try:
-            with open(file_path, encoding="utf-8", errors="replace") as f:
-                for line_number, line in enumerate(f, start=1):
-                    # Skip empty lines
-                    if not line.strip():
-                        continue
-
-                    # Enforce line length limit
-                    if len(line) > self.max_line_length:
-                        self.logger.warning(
-                            "line_too_long",
-                            line_number=line_number,
-                            length=len(line),
-                            max=self.max_line_length,
-                        )
-                        line = line[: self.max_line_length]
-
-                    try:
-                        entry = self.parse_line(line.rstrip("\n"), line_number)
-                        if entry:
-                            yield entry
-                    except Exception as e:
-                        self.logger.warning(
-                            "parse_error",
-                            line_number=line_number,
-                            error=str(e),
-                            line=line[:100],  # Log first 100 chars
-                        )
-                        continue
+            workers = self._parallel_workers(file_size)
+            if workers > 1:
+                yield from self._parse_file_parallel(file_path, file_size, workers)
+            else:
+                yield from self._parse_file_serial(file_path)
 
         except Exception as e:
             raise ParserError(f"Failed to read file {file_path}: {e}") from e
 
+    def _parse_file_serial(self, file_path: Path) -> Iterator[LogEntry]:
+        """
+        Parse a file in this process.
+
+        Args:
+            file_path: Path to the log file
+
+        Yields:
+            LogEntry objects for each successfully parsed line
+        """
+        # The text layer decodes in large chunks; reading bytes (or mmap)
+        # and decoding per line measured slower, not faster
+        with open(file_path, encoding="utf-8", errors="replace") as f:
+            yield from self._parse_stream(f)
+
+    def _parse_stream(self, lines: Iterable[str], first_line: int = 1) -> Iterator[LogEntry]:
+        """
+        Parse lines read from a file, numbering them from first_line.
+
+        Args:
+            lines: Text lines, each still carrying its trailing newline
+            first_line: Line number of the first line
+
+        Yields:
+            LogEntry objects for each successfully parsed line
+        """
+        self._batch_now = datetime.now()
+        try:
+            max_line_length = self.max_line_length
+            for line_number, line in enumerate(lines, start=first_line):
+                if line_number % self.NOW_REFRESH_LINES == 0:
+                    self._batch_now = datetime.now()
+
+                # Skip empty lines (isspace() avoids allocating a stripped copy)
+                if line.isspace():
+                    continue
+
+                # Enforce line length limit
+                if len(line) > max_line_length:
+                    self.logger.warning(
+                        "line_too_long",
+                        line_number=line_number,
+                        length=len(line),
+                        max=max_line_length,
+                    )
+                    line = line[:max_line_length]
+
+                try:
+                    entry = self.parse_line(line.rstrip("\n"), line_number)
+                    if entry:
+                        yield entry
+                except Exception as e:
+                    self.logger.warning(
+                        "parse_error",
+                        line_number=line_number,
+                        error=str(e),
+                        line=line[:100],  # Log first 100 chars
+                    )
+                    continue
+        finally:
+            self._batch_now = None
+
+    def _parallel_workers(self, file_size: int) -> int:
+        """
+        Get the number of processes to parse a file of the given size with.
+
+        Args:
+            file_size: Size of the file in bytes
+
+        Returns:
+            Number of worker processes (1 means parse in this process)
+        """
+        min_size = self.settings.parallel_parse_min_size
+        if not min_size or file_size < min_size:
+            return 1
+
+        try:
+            cpus = len(os.sched_getaffinity(0))
+        except AttributeError:  # Not available on macOS and Windows
+            cpus = os.cpu_count() or 1
+
+        chunks = -(-file_size // self.PARALLEL_CHUNK_SIZE)
+        return max(1, min(cpus, self.settings.max_workers, chunks))
+
+    def _parse_file_parallel(
+        self, file_path: Path, file_size: int, workers: int
+    ) -> Iterator[LogEntry]:
+        """
+        Parse a file in newline-aligned chunks across worker processes.
+
+        Entries are yielded in file order, with at most
+        ``PARALLEL_CHUNKS_AHEAD`` chunks per worker submitted ahead of the
+        consumer. Falls back to parsing in this process when the parser
+        cannot be pickled or the worker processes cannot be started.
+
+        Args:
+            file_path: Path to the log file
+            file_size: Size of the file in bytes
+            workers: Number of worker processes
+
+        Yields:
+            LogEntry objects for each successfully parsed line
+        """
+        pool = self._start_pool(workers)
+        if pool is None:
+            yield from self._parse_file_serial(file_path)
+            return
+
+        self.logger.debug("parsing_file_parallel", path=str(file_path), workers=workers)
+
+        max_pending = self.PARALLEL_CHUNKS_AHEAD * workers
+        pending: deque[AsyncResult] = deque()
+        with pool, open(file_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                start = 0
+                first_line = 1
+                while start < file_size:
+                    cut = buf.find(b"\n", min(start + self.PARALLEL_CHUNK_SIZE, file_size) - 1)
+                    end = file_size if cut < 0 else cut + 1
+                    if len(pending) >= max_pending:
+                        yield from pending.popleft().get()
+                    task = (self, str(file_path), start, end, first_line)
+                    pending.append(pool.apply_async(_parse_chunk, (task,)))
+                    first_line += _count_lines(buf[start:end])
+                    start = end
+            while pending:
+                yield from pending.popleft().get()
+
+    def _start_pool(self, workers: int) -> Optional[Pool]:
+        """
+        Start worker processes to parse with.
+
+        Args:
+            workers: Number of worker processes
+
+        Returns:
+            The process pool, or None if this parser cannot be sent to
+            workers or the platform cannot start them
+        """
+        try:
+            pickle.dumps(self)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            self.logger.warning("parallel_parse_unavailable", reason="pickle", error=str(e))
+            return None
+        try:
+            return multiprocessing.get_context().Pool(workers)
+        except (OSError, RuntimeError, ValueError) as e:
+            self.logger.warning("parallel_parse_unavailable", reason="pool", error=str(e))
+            return None
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Drop the bound logger so parsers can be sent to worker processes."""
+        names = (name for cls in type(self).__mro__ for name in cls.__dict__.get("__slots__", ()))
+        state = {name: getattr(self, name) for name in names if hasattr(self, name)}
+        # Subclasses without __slots__ keep further attributes in a dict
+        state.update(getattr(self, "__dict__", {}))
+        del state["logger"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a parser received by a worker process."""
+        for name, value in state.items():
+            setattr(self, name, value)
+        self.logger = logger.bind(parser=self.__class__.__name__)
+
     def parse_lines(self, lines: list[str]) -> list[LogEntry]:
         """
         Parse multiple log lines.
@@ -132,24 +547,49 @@ class BaseParser(ABC):
             List of successfully parsed LogEntry objects
         """
         entries = []
-        for i, line in enumerate(lines, start=1):
-            if not line.strip():
-                continue
-
-            try:
-                entry = self.parse_line(line.rstrip("\n"), i)
-                if entry:
-                    entries.append(entry)
-            except Exception as e:
-                self.logger.warning("parse_error", line_number=i, error=str(e))
-                continue
+        self._batch_now = datetime.now()
+        try:
+            for i, line in enumerate(lines, start=1):
+                if i % self.NOW_REFRESH_LINES == 0:
+                    self._batch_now = datetime.now()
+
+                # Skip empty lines without allocating a stripped copy
+                if not line or line.isspace():
+                    continue
+
+                try:
+                    entry = self.parse_line(line.rstrip("\n"), i)
+                    if entry:
+                        entries.append(entry)
+                except Exception as e:
+                    self.logger.warning("parse_error", line_number=i, error=str(e))
+                    continue
+        finally:
+            self._batch_now = None
 
         return entries
 
+    def _now(self) -> datetime:
+        """
+        Get the timestamp for entries whose own timestamp is missing or invalid.
+
+        While parse_file() or parse_lines() runs, this is a clock reading
+        refreshed every NOW_REFRESH_LINES lines rather than one per entry.
+
+        Returns:
+            Current (or batch) time
+        """
+        return self._batch_now or datetime.now()
+
     def _parse_timestamp(self, timestamp_str: str, formats: list[str]) -> Optional[datetime]:
         """
         Try to parse timestamp using multiple formats.
 
+        The explicit formats are tried first; dateutil's much slower
+        free-form parser is only the fallback. As with dateutil, formats
+        without a year take the current year and a literal trailing "Z"
+        yields a UTC-aware datetime.
+
         Args:
             timestamp_str: Timestamp string to parse
             formats: List of strftime format strings to try
@@ -157,22 +597,24 @@ class BaseParser(ABC):
         Returns:
             Parsed datetime or None if all formats fail
         """
+        # Try specific formats
+        for fmt in formats:
+            parsed = _strptime(timestamp_str, fmt)
+            if parsed is None:
+                continue
+            if "%Y" not in fmt and "%y" not in fmt:
+                parsed = parsed.replace(year=self._now().year)
+            elif fmt.endswith("Z") and parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            return parsed
+
         from dateutil import parser as dateutil_parser
 
-        # First try dateutil for flexibility
+        # Fall back to dateutil for flexibility
         try:
             return dateutil_parser.parse(timestamp_str)
         except Exception:
-            pass
-
-        # Try specific formats
-        for fmt in formats:
-            try:
-                return datetime.strptime(timestamp_str, fmt)
-            except ValueError:
-                continue
-
-        return None
+            return None
 
     def _extract_user(self, text: str) -> Optional[str]:
         """
@@ -184,15 +626,32 @@ class BaseParser(ABC):
         Returns:
             Extracted username or None
         """
-        patterns = [
-            r"user[=:]?\s*([a-zA-Z0-9_-]+)",
-            r"for\s+([a-zA-Z0-9_-]+)",
-            r"by\s+([a-zA-Z0-9_-]+)",
-            r"from\s+user\s+([a-zA-Z0-9_-]+)",
-        ]
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            # Scan each "user" keyword for a following name; equivalent to
+            # r"user[=:]?\s*([a-zA-Z0-9_-]+)" but without the regex engine
+            length = len(text)
+            idx = lowered.find("user")
+            while idx >= 0:
+                pos = idx + 4
+                if pos < length and text[pos] in "=:":
+                    pos += 1
+                while pos < length and text[pos].isspace():
+                    pos += 1
+                end = pos
+                while end < length and text[end] in _USER_NAME_CHARS:
+                    end += 1
+                if end > pos:
+                    return text[pos:end]
+                idx = lowered.find("user", idx + 1)
+        else:
+            # Lowercasing changed the length, so indices would not line up
+            match = _USER_PATTERN.search(text)
+            if match:
+                return match.group(1)
 
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _USER_FALLBACK_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1)
 
@@ -208,16 +667,53 @@ class BaseParser(ABC):
         Returns:
             Extracted IP address or None
         """
+        # Fast path: a dotted quad right after a marker is the first IPv4
+        # address in the text as long as no dot appears before the marker
+        for marker in _IP_MARKERS:
+            idx = text.find(marker)
+            if idx < 0 or text.find(".", 0, idx) >= 0:
+                continue
+            # A dotted quad is at most 15 characters, so 16 are enough to reject longer tokens
+            candidate = text[idx + len(marker) : idx + len(marker) + 16]
+            token = candidate.split(None, 1)[0] if candidate[:1].strip() else ""
+            if _is_dotted_quad(token):
+                return token
+
         # IPv4 pattern
-        ipv4_pattern = r"\b(?:\d{1,3}\.){3}\d{1,3}\b"
-        match = re.search(ipv4_pattern, text)
-        if match:
-            return match.group(0)
+        if "." in text:
+            match = _IPV4_PATTERN.search(text)
+            if match:
+                return match.group(0)
 
         # IPv6 pattern (simplified)
-        ipv6_pattern = r"\b(?:[0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}\b"
-        match = re.search(ipv6_pattern, text)
-        if match:
-            return match.group(0)
+        if ":" in text:
+            match = _IPV6_PATTERN.search(text)
+            if match:
+                return match.group(0)
 
         return None
+
+
+def _count_lines(data: bytes) -> int:
+    """Count lines the way universal-newline decoding splits them."""
+    return data.count(b"\n") + data.count(b"\r") - data.count(b"\r\n")
+
+
+def _parse_chunk(task: tuple[BaseParser, str, int, int, int]) -> list[LogEntry]:
+    """
+    Parse one newline-aligned byte range of a file in a worker process.
+
+    Args:
+        task: Parser, file path, start and end offsets, and first line number
+
+    Returns:
+        Entries parsed from the range
+    """
+    parser, file_path, start, end, first_line = task
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    # Decode exactly as the serial path does, including universal newlines
+    lines = io.TextIOWrapper(io.BytesIO(data), encoding="utf-8", errors="replace")
+    return list(parser._parse_stream(lines, first_line))
@@ -1,20 +1,30 @@
 """Docker container log parser."""
 
+import json
 import re
-from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
-from .base import BaseParser, LogEntry
+from .base import BaseParser, LogEntry, _parse_iso_time
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _loads(line: str) -> Any:
+    """Parse a JSON document, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(line)
+    return json.loads(line)
 
 
 class DockerParser(BaseParser):
     """Parser for Docker container logs."""
 
-    # Docker JSON log format
-    # {"log":"message\n","stream":"stdout","time":"2024-01-15T10:30:45.123456789Z"}
-    JSON_PATTERN = re.compile(
-        r'\{"log":"(?P<message>[^"]*)".*?"stream":"(?P<stream>[^"]*)".*?"time":"(?P<timestamp>[^"]*)"\}'
-    )
+    __slots__ = ()
 
     # Docker compose logs with container name
     # container_name | message
@@ -40,32 +50,31 @@ class DockerParser(BaseParser):
             Parsed LogEntry or None if parsing fails
         """
         # Try JSON format
-        match = self.JSON_PATTERN.search(line)
-        if match:
-            timestamp_str = match.group("timestamp")
+        # {"log":"message\n","stream":"stdout","time":"2024-01-15T10:30:45.123456789Z"}
+        if line.lstrip().startswith("{"):
             try:
-                # ISO 8601 format with nanoseconds
-                timestamp = datetime.strptime(timestamp_str[:26] + "Z", "%Y-%m-%dT%H:%M:%S.%fZ")
+                record = _loads(line)
             except ValueError:
-                timestamp = datetime.now()
-
-            message = match.group("message").replace("\\n", "\n").replace('\\"', '"')
-            stream = match.group("stream")
-
-            return LogEntry(
-                timestamp=timestamp,
-                source="docker",
-                message=message.strip(),
-                level="INFO" if stream == "stdout" else "ERROR",
-                raw=line,
-                metadata={"stream": stream},
-            )
-
-        # Try Docker Compose format
-        match = self.COMPOSE_PATTERN.search(line)
+                record = None
+            if isinstance(record, dict) and isinstance(record.get("log"), str):
+                stream = record.get("stream", "")
+                time_str = record.get("time")
+                timestamp = _parse_iso_time(time_str) if isinstance(time_str, str) else None
+
+                return LogEntry(
+                    timestamp=timestamp or self._now(),
+                    source="docker",
+                    message=record["log"].strip(),
+                    level="INFO" if stream == "stdout" else "ERROR",
+                    raw=line,
+                    metadata={"stream": stream},
+                )
+
+        # Try Docker Compose format (its separator is a required literal)
+        match = self.COMPOSE_PATTERN.search(line) if "|" in line else None
         if match:
             return LogEntry(
-                timestamp=datetime.now(),
+                timestamp=self._now(),
                 source="docker",
                 message=match.group("message").strip(),
                 level="INFO",
@@ -73,17 +82,12 @@ class DockerParser(BaseParser):
                 metadata={"container": match.group("container")},
             )
 
-        # Try CLI format
-        match = self.CLI_PATTERN.search(line)
+        # Try CLI format; the unanchored search is only worth running when
+        # the line could hold an RFC 3339 timestamp
+        match = self.CLI_PATTERN.search(line) if "Z" in line else None
         if match:
-            timestamp_str = match.group("timestamp")
-            try:
-                timestamp = datetime.strptime(timestamp_str[:26] + "Z", "%Y-%m-%dT%H:%M:%S.%fZ")
-            except ValueError:
-                timestamp = datetime.now()
-
             return LogEntry(
-                timestamp=timestamp,
+                timestamp=_parse_iso_time(match.group("timestamp")) or self._now(),
                 source="docker",
                 message=match.group("message").strip(),
                 level="INFO",
@@ -92,11 +96,12 @@ class DockerParser(BaseParser):
             )
 
         # Fallback: treat as plain Docker log
-        if line.strip():
+        message = line.strip()
+        if message:
             return LogEntry(
-                timestamp=datetime.now(),
+                timestamp=self._now(),
                 source="docker",
-                message=line.strip(),
+                message=message,
                 level="INFO",
                 raw=line,
                 metadata={},
@@ -115,7 +120,7 @@ class DockerParser(BaseParser):
             True if appears to be Docker format
         """
         return bool(
-            self.JSON_PATTERN.search(sample)
+            '"log":' in sample
             or self.COMPOSE_PATTERN.search(sample)
             or self.CLI_PATTERN.search(sample)
             or '"stream":"std' in sample
@@ -4,6 +4,7 @@ Factory for creating log parsers based on format type.
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 from typing import Optional
 
@@ -24,6 +25,11 @@ from loggem.parsers.windows_event import WindowsEventLogParser
 
 logger = get_logger(__name__)
 
+# Content sniffing patterns, compiled once at import rather than per call
+# Nginx access log (IP - user [timestamp] "request" status bytes)
+_NGINX_RE = re.compile(r'^\d+\.\d+\.\d+\.\d+ - .* \[.+\] ".+" \d{3} \d+')
+_AUTH_KEYWORDS = ("sshd", "sudo", "su:", "authentication", "login")
+
 
 class LogParserFactory:
     """
@@ -48,6 +54,16 @@ class LogParserFactory:
         "redis": RedisParser,
     }
 
+    # Alternative names accepted for registered formats
+    _aliases = {
+        "postgres": "postgresql",
+        "pgsql": "postgresql",
+        "mariadb": "mysql",
+        "k8s": "kubernetes",
+        "evtx": "windows",
+        "httpd": "apache",
+    }
+
     # File path patterns for auto-detection
     _path_patterns = {
         "syslog": ["/var/log/syslog", "/var/log/messages"],
@@ -63,6 +79,26 @@ class LogParserFactory:
         "redis": ["redis"],
     }
 
+    # Bytes read from the start of a file to sniff its format
+    _sniff_bytes = 4096
+
+    # Extensions and file names that decide the format on their own
+    _extension_formats = {".json": "json", ".evtx": "windows", ".xml": "windows"}
+    _name_formats = {
+        "syslog": "syslog",
+        "messages": "syslog",
+        "auth.log": "auth",
+        "secure": "auth",
+    }
+
+    # The path patterns flattened to (pattern, format) pairs in priority order,
+    # so detection is a single loop with no per-format list iteration
+    _path_rules = tuple(
+        (pattern, format_name)
+        for format_name, patterns in _path_patterns.items()
+        for pattern in patterns
+    )
+
     @classmethod
     def register_parser(cls, name: str, parser_class: type[BaseParser]) -> None:
         """
@@ -89,7 +125,8 @@ class LogParserFactory:
         Create a parser for the specified format.
 
         Args:
-            format_type: Explicit format type (syslog, json, nginx, auth)
+            format_type: Explicit format type (syslog, json, nginx, auth) or
+                an alias such as postgres or k8s
             file_path: Path to log file (for auto-detection if format_type not specified)
             source_name: Name to identify the log source
 
@@ -106,12 +143,12 @@ class LogParserFactory:
         # If format explicitly specified, use it
         if format_type:
             format_type = format_type.lower()
-            if format_type not in cls._parsers:
+            format_type = cls._aliases.get(format_type, format_type)
+            parser_class = cls._parsers.get(format_type)
+            if parser_class is None:
                 raise ValueError(
-                    f"Unknown format: {format_type}. "
-                    f"Available formats: {', '.join(cls._parsers.keys())}"
+                    f"Unknown format: {format_type}. Available formats: {', '.join(cls._parsers)}"
                 )
-            parser_class = cls._parsers[format_type]
             logger.info("parser_created", format=format_type, source=source_name)
             return parser_class(source_name=source_name)
 
@@ -145,31 +182,29 @@ class LogParserFactory:
         Returns:
             Detected format name or None
         """
+        # Check the extension and file name, which are decisive when known
+        format_name = cls._extension_formats.get(file_path.suffix.lower())
+        if format_name is None:
+            format_name = cls._name_formats.get(file_path.name.lower())
+        if format_name:
+            return format_name
+
         file_str = str(file_path).lower()
 
         # Check against known patterns
-        for format_name, patterns in cls._path_patterns.items():
-            for pattern in patterns:
-                if pattern in file_str:
-                    return format_name
-
-        # Check file extension
-        if file_path.suffix == ".json":
-            return "json"
+        for pattern, format_name in cls._path_rules:
+            if pattern in file_str:
+                return format_name
 
         # Try to detect from first few lines
         if file_path.exists() and file_path.is_file():
             try:
-                with open(file_path, encoding="utf-8", errors="replace") as f:
-                    # Read first few non-empty lines
-                    lines = []
-                    for line in f:
-                        if line.strip():
-                            lines.append(line.strip())
-                        if len(lines) >= 5:
-                            break
+                # Sniff the first few non-empty lines from one small read
+                with open(file_path, "rb") as f:
+                    head = f.read(cls._sniff_bytes).decode("utf-8", errors="replace")
 
-                    return cls._detect_format_from_content(lines)
+                lines = [line.strip() for line in head.splitlines() if line.strip()]
+                return cls._detect_format_from_content(lines[:5])
 
             except Exception as e:
                 logger.warning("format_detection_failed", error=str(e))
@@ -195,15 +230,11 @@ class LogParserFactory:
             return "json"
 
         # Check for Nginx access log (IP - user [timestamp])
-        import re
-
-        nginx_pattern = r'^\d+\.\d+\.\d+\.\d+ - .* \[.+\] ".+" \d{3} \d+'
-        if any(re.match(nginx_pattern, line) for line in lines[:3]):
+        if any(_NGINX_RE.match(line) for line in lines[:3]):
             return "nginx"
 
         # Check for auth log keywords
-        auth_keywords = ["sshd", "sudo", "su:", "authentication", "login"]
-        if any(any(keyword in line.lower() for keyword in auth_keywords) for line in lines[:3]):
+        if any(any(keyword in line.lower() for keyword in _AUTH_KEYWORDS) for line in lines[:3]):
             return "auth"
 
         # Default to syslog (most common format)
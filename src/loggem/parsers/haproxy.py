@@ -1,15 +1,16 @@
 """HAProxy load balancer log parser."""
 
 import re
-from datetime import datetime
 from typing import Optional
 
-from .base import BaseParser, LogEntry
+from .base import BaseParser, LogEntry, _combine_patterns, _parse_syslog_time
 
 
 class HAProxyParser(BaseParser):
     """Parser for HAProxy load balancer logs."""
 
+    __slots__ = ()
+
     # HAProxy HTTP log format
     # timestamp frontend_name backend_name/server_name timers status bytes headers...
     HTTP_PATTERN = re.compile(
@@ -24,7 +25,8 @@ class HAProxyParser(BaseParser):
         r"(?P<status>\d{3})\s+"
         r"(?P<bytes>\d+)\s+"
         r".*?"
-        r'"(?P<request>[^"]*)"'
+        r'"(?P<request>[^"]*)"',
+        re.ASCII,
     )
 
     # HAProxy TCP log format
@@ -38,9 +40,15 @@ class HAProxyParser(BaseParser):
         r"(?P<backend>\S+)/(?P<server>\S+)\s+"
         r"(?P<tw>-?\d+)/(?P<tc>-?\d+)/(?P<tt>\d+)\s+"
         r"(?P<bytes_read>\d+)\s+"
-        r"(?P<termination_state>\S+)"
+        r"(?P<termination_state>\S+)",
+        re.ASCII,
     )
 
+    # Both formats in one regex, so a line is scanned once
+    COMBINED_PATTERN, _GROUPS = _combine_patterns((("http", HTTP_PATTERN), ("tcp", TCP_PATTERN)))
+    _HTTP_GROUPS = tuple(group for group, _name in _GROUPS["http"])
+    _TCP_GROUPS = tuple(group for group, _name in _GROUPS["tcp"])
+
     def parse_line(self, line: str, line_number: int = 0) -> Optional[LogEntry]:
         """
         Parse a single HAProxy log line.
@@ -52,41 +60,57 @@ class HAProxyParser(BaseParser):
         Returns:
             Parsed LogEntry or None if parsing fails
         """
-        # Try HTTP format
-        match = self.HTTP_PATTERN.search(line)
-        if match:
-            timestamp_str = match.group("timestamp")
-            try:
-                current_year = datetime.now().year
-                timestamp = datetime.strptime(
-                    f"{current_year} {timestamp_str}", "%Y %b %d %H:%M:%S"
-                )
-            except ValueError:
-                timestamp = datetime.now()
-
-            status = int(match.group("status"))
+        # Not anchored: relayed syslog lines may carry a priority or forwarder prefix
+        match = self.COMBINED_PATTERN.search(line)
+        if not match:
+            return None
+
+        # HTTP format
+        if match.lastgroup == "http":
+            (
+                timestamp_str,
+                _hostname,
+                _process,
+                client_ip,
+                client_port,
+                _accept_date,
+                frontend,
+                backend,
+                server,
+                tq,
+                tw,
+                tc,
+                tr,
+                tt,
+                status_str,
+                bytes_str,
+                request,
+            ) = match.group(*self._HTTP_GROUPS)
+            timestamp = _parse_syslog_time(timestamp_str, self._now().year) or self._now()
+
+            status = int(status_str)
             level = "ERROR" if status >= 500 else "WARNING" if status >= 400 else "INFO"
 
             metadata = {
-                "client_ip": match.group("client_ip"),
-                "client_port": match.group("client_port"),
-                "frontend": match.group("frontend"),
-                "backend": match.group("backend"),
-                "server": match.group("server"),
+                "client_ip": client_ip,
+                "client_port": client_port,
+                "frontend": frontend,
+                "backend": backend,
+                "server": server,
                 "status": status,
-                "bytes": int(match.group("bytes")),
-                "request": match.group("request"),
+                "bytes": int(bytes_str),
+                "request": request,
                 "timers": {
-                    "tq": int(match.group("tq")),
-                    "tw": int(match.group("tw")),
-                    "tc": int(match.group("tc")),
-                    "tr": int(match.group("tr")),
-                    "tt": int(match.group("tt")),
+                    "tq": int(tq),
+                    "tw": int(tw),
+                    "tc": int(tc),
+                    "tr": int(tr),
+                    "tt": int(tt),
                 },
                 "log_type": "http",
             }
 
-            message = f"{match.group('request')} -> {status}"
+            message = f"{request} -> {status}"
 
             return LogEntry(
                 timestamp=timestamp,
@@ -97,46 +121,51 @@ class HAProxyParser(BaseParser):
                 metadata=metadata,
             )
 
-        # Try TCP format
-        match = self.TCP_PATTERN.search(line)
-        if match:
-            timestamp_str = match.group("timestamp")
-            try:
-                current_year = datetime.now().year
-                timestamp = datetime.strptime(
-                    f"{current_year} {timestamp_str}", "%Y %b %d %H:%M:%S"
-                )
-            except ValueError:
-                timestamp = datetime.now()
-
-            metadata = {
-                "client_ip": match.group("client_ip"),
-                "client_port": match.group("client_port"),
-                "frontend": match.group("frontend"),
-                "backend": match.group("backend"),
-                "server": match.group("server"),
-                "bytes_read": int(match.group("bytes_read")),
-                "termination_state": match.group("termination_state"),
-                "timers": {
-                    "tw": int(match.group("tw")),
-                    "tc": int(match.group("tc")),
-                    "tt": int(match.group("tt")),
-                },
-                "log_type": "tcp",
-            }
-
-            message = f"TCP connection: {match.group('client_ip')} -> {match.group('backend')}/{match.group('server')}"
-
-            return LogEntry(
-                timestamp=timestamp,
-                source="haproxy",
-                message=message,
-                level="INFO",
-                raw=line,
-                metadata=metadata,
-            )
-
-        return None
+        # TCP format
+        (
+            timestamp_str,
+            _hostname,
+            _process,
+            client_ip,
+            client_port,
+            _accept_date,
+            frontend,
+            backend,
+            server,
+            tw,
+            tc,
+            tt,
+            bytes_read,
+            termination_state,
+        ) = match.group(*self._TCP_GROUPS)
+        timestamp = _parse_syslog_time(timestamp_str, self._now().year) or self._now()
+
+        metadata = {
+            "client_ip": client_ip,
+            "client_port": client_port,
+            "frontend": frontend,
+            "backend": backend,
+            "server": server,
+            "bytes_read": int(bytes_read),
+            "termination_state": termination_state,
+            "timers": {
+                "tw": int(tw),
+                "tc": int(tc),
+                "tt": int(tt),
+            },
+            "log_type": "tcp",
+        }
+
+        message = f"TCP connection: {client_ip} -> {backend}/{server}"
+
+        return LogEntry(
+            timestamp=timestamp,
+            source="haproxy",
+            message=message,
+            level="INFO",
+            raw=line,
+            metadata=metadata,
+        )
 
     def validate(self, sample: str) -> bool:
         """
@@ -148,8 +177,8 @@ class HAProxyParser(BaseParser):
         Returns:
             True if appears to be HAProxy format
         """
+        # Both formats contain a bracketed accept date, so samples without
+        # one skip the combined (RE2 when installed) pattern entirely
         return bool(
-            self.HTTP_PATTERN.search(sample)
-            or self.TCP_PATTERN.search(sample)
-            or "haproxy[" in sample.lower()
+            ("[" in sample and self.COMBINED_PATTERN.search(sample)) or "haproxy[" in sample.lower()
         )
@@ -6,11 +6,33 @@ from __future__ import annotations
 
 import json
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 from loggem.core.models import LogEntry
 from loggem.parsers.base import BaseParser
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _loads(line: str) -> Any:
+    """
+    Parse a JSON document, using orjson when installed.
+
+    Documents orjson rejects but json accepts (NaN, Infinity) are retried
+    with json, so malformed lines still raise json.JSONDecodeError.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(line)
+
 
 class JSONParser(BaseParser):
     """
@@ -19,6 +41,8 @@ class JSONParser(BaseParser):
     Handles various JSON log formats from applications, containers, and cloud services.
     """
 
+    __slots__ = ()
+
     # Common timestamp field names
     TIMESTAMP_FIELDS = [
         "timestamp",
@@ -40,6 +64,9 @@ class JSONParser(BaseParser):
         "body",
     ]
 
+    # Message fields left out of the metadata
+    MESSAGE_KEYS = ("message", "msg", "text")
+
     # Common level field names
     LEVEL_FIELDS = [
         "level",
@@ -49,6 +76,31 @@ class JSONParser(BaseParser):
         "priority",
     ]
 
+    # Common host, user and process field names
+    HOST_FIELDS = ["host", "hostname", "server", "node"]
+    USER_FIELDS = ["user", "username", "uid", "account"]
+    PROCESS_FIELDS = ["process", "service", "application", "app"]
+
+    # Formats tried for string timestamps before dateutil
+    TIMESTAMP_FORMATS = [
+        "%Y-%m-%dT%H:%M:%S.%fZ",
+        "%Y-%m-%dT%H:%M:%SZ",
+        "%Y-%m-%dT%H:%M:%S%z",
+        "%Y-%m-%d %H:%M:%S",
+        "%Y/%m/%d %H:%M:%S",
+    ]
+
+    # Level names normalized to LogEntry levels
+    LEVEL_MAP = {
+        "TRACE": "DEBUG",
+        "VERBOSE": "DEBUG",
+        "WARN": "WARNING",
+        "ERR": "ERROR",
+        "FATAL": "CRITICAL",
+        "EMERG": "CRITICAL",
+        "EMERGENCY": "CRITICAL",
+    }
+
     def parse_line(self, line: str, line_number: int = 0) -> Optional[LogEntry]:
         """
         Parse a single JSON log line.
@@ -61,7 +113,7 @@ class JSONParser(BaseParser):
             LogEntry or None if line cannot be parsed
         """
         try:
-            data = json.loads(line)
+            data = _loads(line)
         except json.JSONDecodeError as e:
             self.logger.warning(
                 "invalid_json",
@@ -90,12 +142,14 @@ class JSONParser(BaseParser):
         level = self._extract_level(data)
 
         # Extract common fields
-        host = self._extract_field(data, ["host", "hostname", "server", "node"])
-        user = self._extract_field(data, ["user", "username", "uid", "account"])
-        process = self._extract_field(data, ["process", "service", "application", "app"])
+        host = self._extract_field(data, self.HOST_FIELDS)
+        user = self._extract_field(data, self.USER_FIELDS)
+        process = self._extract_field(data, self.PROCESS_FIELDS)
 
-        # Store remaining fields as metadata
-        metadata = {k: v for k, v in data.items() if k not in ["message", "msg", "text"]}
+        # Store remaining fields as metadata; the decoded record is ours, so
+        # drop the message keys in place rather than copying it
+        for key in self.MESSAGE_KEYS:
+            data.pop(key, None)
 
         return LogEntry(
             timestamp=timestamp,
@@ -105,7 +159,7 @@ class JSONParser(BaseParser):
             host=host,
             user=user,
             process=process,
-            metadata=metadata,
+            metadata=data,
             raw=line,
         )
 
@@ -125,18 +179,14 @@ class JSONParser(BaseParser):
                     except (ValueError, OSError):
                         continue
 
-                # Handle string timestamps
+                # Handle string timestamps; ISO 8601 (the common case) is
+                # parsed in C before trying the strptime formats
                 if isinstance(value, str):
-                    parsed = self._parse_timestamp(
-                        value,
-                        [
-                            "%Y-%m-%dT%H:%M:%S.%fZ",
-                            "%Y-%m-%dT%H:%M:%SZ",
-                            "%Y-%m-%dT%H:%M:%S%z",
-                            "%Y-%m-%d %H:%M:%S",
-                            "%Y/%m/%d %H:%M:%S",
-                        ],
-                    )
+                    try:
+                        return datetime.fromisoformat(value)
+                    except ValueError:
+                        pass
+                    parsed = self._parse_timestamp(value, self.TIMESTAMP_FORMATS)
                     if parsed:
                         return parsed
 
@@ -159,16 +209,7 @@ class JSONParser(BaseParser):
             if field in data:
                 level = str(data[field]).upper()
                 # Normalize common level names
-                level_map = {
-                    "TRACE": "DEBUG",
-                    "VERBOSE": "DEBUG",
-                    "WARN": "WARNING",
-                    "ERR": "ERROR",
-                    "FATAL": "CRITICAL",
-                    "EMERG": "CRITICAL",
-                    "EMERGENCY": "CRITICAL",
-                }
-                return level_map.get(level, level)
+                return self.LEVEL_MAP.get(level, level)
         return "INFO"
 
     def _extract_field(self, data: dict, possible_keys: list[str]) -> Optional[str]:
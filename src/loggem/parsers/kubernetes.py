@@ -1,22 +1,33 @@
 """Kubernetes cluster log parser."""
 
 import re
-from datetime import datetime
 from typing import Optional
 
-from .base import BaseParser, LogEntry
+from .base import BaseParser, LogEntry, _combine_patterns, _parse_iso_time
+
+# Lowercase markers of kubectl output and resource references
+_KUBERNETES_KEYWORDS = ("kubectl", "pod/", "deployment/", "service/", "namespace/")
+
+
+def _mentions_kubernetes(sample: str) -> bool:
+    """Check a sample for a Kubernetes keyword, lowercasing it only once."""
+    lowered = sample.lower()
+    return any(keyword in lowered for keyword in _KUBERNETES_KEYWORDS)
 
 
 class KubernetesParser(BaseParser):
     """Parser for Kubernetes cluster logs."""
 
+    __slots__ = ()
+
     # kubectl logs format
     # timestamp level message
     # 2024-01-15T10:30:45.123Z INFO Starting application...
     KUBECTL_PATTERN = re.compile(
         r"(?P<timestamp>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z)\s+"
         r"(?P<level>[A-Z]+)\s+"
-        r"(?P<message>.*)"
+        r"(?P<message>.*)",
+        re.ASCII,
     )
 
     # Kubernetes event format
@@ -26,7 +37,8 @@ class KubernetesParser(BaseParser):
         r"(?P<type>Normal|Warning)\s+"
         r"(?P<reason>\S+)\s+"
         r"(?P<object>\S+)\s+"
-        r"(?P<message>.*)"
+        r"(?P<message>.*)",
+        re.ASCII,
     )
 
     # Container runtime log (containerd/CRI-O)
@@ -35,9 +47,22 @@ class KubernetesParser(BaseParser):
         r"(?P<timestamp>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z)\s+"
         r"(?P<stream>stdout|stderr)\s+"
         r"(?P<flags>[FP])\s+"
-        r"(?P<message>.*)"
+        r"(?P<message>.*)",
+        re.ASCII,
     )
 
+    # All three formats in one regex, each branch named after its log_type
+    COMBINED_PATTERN, _GROUPS = _combine_patterns(
+        (
+            ("application", KUBECTL_PATTERN),
+            ("event", EVENT_PATTERN),
+            ("container", RUNTIME_PATTERN),
+        )
+    )
+    _KUBECTL_GROUPS = tuple(group for group, _name in _GROUPS["application"])
+    _EVENT_GROUPS = tuple(group for group, _name in _GROUPS["event"])
+    _RUNTIME_GROUPS = tuple(group for group, _name in _GROUPS["container"])
+
     def parse_line(self, line: str, line_number: int = 0) -> Optional[LogEntry]:
         """
         Parse a single Kubernetes log line.
@@ -49,69 +74,60 @@ class KubernetesParser(BaseParser):
         Returns:
             Parsed LogEntry or None if parsing fails
         """
-        # Try kubectl logs format
-        match = self.KUBECTL_PATTERN.search(line)
-        if match:
-            timestamp_str = match.group("timestamp")
-            try:
-                timestamp = datetime.strptime(timestamp_str[:26] + "Z", "%Y-%m-%dT%H:%M:%S.%fZ")
-            except ValueError:
-                try:
-                    timestamp = datetime.strptime(timestamp_str, "%Y-%m-%dT%H:%M:%SZ")
-                except ValueError:
-                    timestamp = datetime.now()
+        # Every format starts at column 0, so a miss fails on the first characters
+        match = self.COMBINED_PATTERN.match(line)
+        if not match:
+            return None
+        log_type = match.lastgroup
+
+        # kubectl logs format
+        if log_type == "application":
+            timestamp_str, level, message = match.group(*self._KUBECTL_GROUPS)
+            timestamp = _parse_iso_time(timestamp_str) or self._now()
 
             return LogEntry(
                 timestamp=timestamp,
                 source="kubernetes",
-                message=match.group("message").strip(),
-                level=match.group("level"),
+                message=message.strip(),
+                level=level,
                 raw=line,
                 metadata={"log_type": "application"},
             )
 
-        # Try event format
-        match = self.EVENT_PATTERN.search(line)
-        if match:
+        # Event format
+        if log_type == "event":
+            age, event_type, reason, obj, message = match.group(*self._EVENT_GROUPS)
             return LogEntry(
-                timestamp=datetime.now(),
+                timestamp=self._now(),
                 source="kubernetes",
-                message=match.group("message").strip(),
-                level="WARNING" if match.group("type") == "Warning" else "INFO",
+                message=message.strip(),
+                level="WARNING" if event_type == "Warning" else "INFO",
                 raw=line,
                 metadata={
-                    "event_type": match.group("type"),
-                    "reason": match.group("reason"),
-                    "object": match.group("object"),
-                    "age": match.group("age"),
+                    "event_type": event_type,
+                    "reason": reason,
+                    "object": obj,
+                    "age": age,
                     "log_type": "event",
                 },
             )
 
-        # Try container runtime format
-        match = self.RUNTIME_PATTERN.search(line)
-        if match:
-            timestamp_str = match.group("timestamp")
-            try:
-                timestamp = datetime.strptime(timestamp_str[:26] + "Z", "%Y-%m-%dT%H:%M:%S.%fZ")
-            except ValueError:
-                timestamp = datetime.now()
-
-            stream = match.group("stream")
-            return LogEntry(
-                timestamp=timestamp,
-                source="kubernetes",
-                message=match.group("message").strip(),
-                level="ERROR" if stream == "stderr" else "INFO",
-                raw=line,
-                metadata={
-                    "stream": stream,
-                    "flags": match.group("flags"),
-                    "log_type": "container",
-                },
-            )
-
-        return None
+        # Container runtime format
+        timestamp_str, stream, flags, message = match.group(*self._RUNTIME_GROUPS)
+        timestamp = _parse_iso_time(timestamp_str) or self._now()
+
+        return LogEntry(
+            timestamp=timestamp,
+            source="kubernetes",
+            message=message.strip(),
+            level="ERROR" if stream == "stderr" else "INFO",
+            raw=line,
+            metadata={
+                "stream": stream,
+                "flags": flags,
+                "log_type": "container",
+            },
+        )
 
     def validate(self, sample: str) -> bool:
         """
@@ -123,13 +139,12 @@ class KubernetesParser(BaseParser):
         Returns:
             True if appears to be Kubernetes format
         """
+        # Each format has an RFC 3339 "Z" timestamp or an event type, so
+        # samples without one skip the combined (RE2 when installed) pattern
         return bool(
-            self.KUBECTL_PATTERN.search(sample)
-            or self.EVENT_PATTERN.search(sample)
-            or self.RUNTIME_PATTERN.search(sample)
-            or "kubectl" in sample.lower()
-            or any(
-                keyword in sample.lower()
-                for keyword in ["pod/", "deployment/", "service/", "namespace/"]
+            (
+                ("Z" in sample or "Normal" in sample or "Warning" in sample)
+                and self.COMBINED_PATTERN.search(sample)
             )
+            or _mentions_kubernetes(sample)
         )
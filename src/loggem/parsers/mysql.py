@@ -1,15 +1,16 @@
 """MySQL database log parser."""
 
 import re
-from datetime import datetime
 from typing import Optional
 
-from .base import BaseParser, LogEntry
+from .base import BaseParser, LogEntry, _combine_patterns, _parse_iso_time, _strptime
 
 
 class MySQLParser(BaseParser):
     """Parser for MySQL database logs."""
 
+    __slots__ = ()
+
     # MySQL error log pattern
     # Format: 2024-01-15T10:30:45.123456Z 0 [Note] Event Scheduler: scheduler thread started
     # Format: 2024-01-15T10:30:45.123456Z 123 [ERROR] Access denied for user 'root'@'localhost'
@@ -17,20 +18,31 @@ class MySQLParser(BaseParser):
         r"(?P<timestamp>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}Z)\s+"
         r"(?P<thread_id>\d+)\s+"
         r"\[(?P<level>[^\]]+)\]\s+"
-        r"(?P<message>.*)"
+        r"(?P<message>.*)",
+        re.ASCII,
     )
 
     # Legacy format (MySQL 5.x)
     LEGACY_PATTERN = re.compile(
         r"(?P<timestamp>\d{6}\s+\d{1,2}:\d{2}:\d{2})\s+"
         r"\[(?P<level>[^\]]+)\]\s+"
-        r"(?P<message>.*)"
+        r"(?P<message>.*)",
+        re.ASCII,
     )
 
     # Slow query log
     SLOW_QUERY_PATTERN = re.compile(
-        r"# Time: (?P<timestamp>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}Z)"
+        r"# Time: (?P<timestamp>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}Z)",
+        re.ASCII,
+    )
+
+    # All three formats in one regex, so a line is scanned once
+    COMBINED_PATTERN, _GROUPS = _combine_patterns(
+        (("standard", LOG_PATTERN), ("legacy", LEGACY_PATTERN), ("slow_query", SLOW_QUERY_PATTERN))
     )
+    _LOG_GROUPS = tuple(group for group, _name in _GROUPS["standard"])
+    _LEGACY_GROUPS = tuple(group for group, _name in _GROUPS["legacy"])
+    _SLOW_QUERY_GROUP = _GROUPS["slow_query"][0][0]
 
     def parse_line(self, line: str, line_number: int = 0) -> Optional[LogEntry]:
         """
@@ -43,62 +55,53 @@ class MySQLParser(BaseParser):
         Returns:
             Parsed LogEntry or None if parsing fails
         """
-        # Try standard format
-        match = self.LOG_PATTERN.search(line)
-        if match:
-            timestamp_str = match.group("timestamp")
-            try:
-                timestamp = datetime.strptime(timestamp_str, "%Y-%m-%dT%H:%M:%S.%fZ")
-            except ValueError:
-                timestamp = datetime.now()
-
-            return LogEntry(
-                timestamp=timestamp,
-                source="mysql",
-                message=match.group("message").strip(),
-                level=match.group("level"),
-                raw=line,
-                metadata={"thread_id": match.group("thread_id")},
-            )
+        # Every format starts at column 0, so a miss fails on the first characters
+        match = self.COMBINED_PATTERN.match(line)
+        if not match:
+            return None
+        log_format = match.lastgroup
 
-        # Try legacy format
-        match = self.LEGACY_PATTERN.search(line)
-        if match:
-            timestamp_str = match.group("timestamp")
-            try:
-                # Format: YYMMDD HH:MM:SS
-                timestamp = datetime.strptime(timestamp_str, "%y%m%d %H:%M:%S")
-            except ValueError:
-                timestamp = datetime.now()
+        # Standard format
+        if log_format == "standard":
+            timestamp_str, thread_id, level, message = match.group(*self._LOG_GROUPS)
+            timestamp = _parse_iso_time(timestamp_str) or self._now()
 
             return LogEntry(
                 timestamp=timestamp,
                 source="mysql",
-                message=match.group("message").strip(),
-                level=match.group("level"),
+                message=message.strip(),
+                level=level,
                 raw=line,
-                metadata={},
+                metadata={"thread_id": thread_id},
             )
 
-        # Try slow query log
-        match = self.SLOW_QUERY_PATTERN.search(line)
-        if match:
-            timestamp_str = match.group("timestamp")
-            try:
-                timestamp = datetime.strptime(timestamp_str, "%Y-%m-%dT%H:%M:%S.%fZ")
-            except ValueError:
-                timestamp = datetime.now()
+        # Legacy format
+        if log_format == "legacy":
+            timestamp_str, level, message = match.group(*self._LEGACY_GROUPS)
+            # Format: YYMMDD HH:MM:SS
+            timestamp = _strptime(timestamp_str, "%y%m%d %H:%M:%S") or self._now()
 
             return LogEntry(
                 timestamp=timestamp,
                 source="mysql",
-                message="Slow query detected",
-                level="WARNING",
+                message=message.strip(),
+                level=level,
                 raw=line,
-                metadata={"type": "slow_query"},
+                metadata={},
             )
 
-        return None
+        # Slow query log
+        timestamp_str = match.group(self._SLOW_QUERY_GROUP)
+        timestamp = _parse_iso_time(timestamp_str) or self._now()
+
+        return LogEntry(
+            timestamp=timestamp,
+            source="mysql",
+            message="Slow query detected",
+            level="WARNING",
+            raw=line,
+            metadata={"type": "slow_query"},
+        )
 
     def validate(self, sample: str) -> bool:
         """
@@ -110,10 +113,10 @@ class MySQLParser(BaseParser):
         Returns:
             True if appears to be MySQL format
         """
+        # Each format has a bracketed level or a "# Time:" header, so samples
+        # without one skip the combined (RE2 when installed) pattern
         return bool(
-            self.LOG_PATTERN.search(sample)
-            or self.LEGACY_PATTERN.search(sample)
-            or self.SLOW_QUERY_PATTERN.search(sample)
+            (("[" in sample or "# Time: " in sample) and self.COMBINED_PATTERN.search(sample))
+            # Also covers "[mysqld]" section headers
             or "mysqld" in sample.lower()
-            or "[mysqld]" in sample.lower()
         )
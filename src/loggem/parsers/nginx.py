@@ -9,7 +9,13 @@ from datetime import datetime
 from typing import Optional
 
 from loggem.core.models import LogEntry
-from loggem.parsers.base import BaseParser
+from loggem.parsers.base import (
+    BaseParser,
+    _combine_patterns,
+    _is_dotted_quad,
+    _parse_clf_time,
+    _parse_ymd_time,
+)
 
 
 class NginxParser(BaseParser):
@@ -19,6 +25,8 @@ class NginxParser(BaseParser):
     Supports combined log format and common error log formats.
     """
 
+    __slots__ = ()
+
     # Nginx combined log format:
     # $remote_addr - $remote_user [$time_local] "$request" $status $body_bytes_sent "$http_referer" "$http_user_agent"
     ACCESS_LOG_PATTERN = re.compile(
@@ -29,7 +37,8 @@ class NginxParser(BaseParser):
         r"(?P<status>\d{3})\s+"
         r"(?P<body_bytes_sent>\d+)\s+"
         r'"(?P<http_referer>[^"]*)"\s+'
-        r'"(?P<http_user_agent>[^"]*)"'
+        r'"(?P<http_user_agent>[^"]*)"',
+        re.ASCII,
     )
 
     # Nginx error log format:
@@ -37,11 +46,29 @@ class NginxParser(BaseParser):
     ERROR_LOG_PATTERN = re.compile(
         r"^(?P<timestamp>\d{4}/\d{2}/\d{2}\s+\d{2}:\d{2}:\d{2})\s+"
         r"\[(?P<level>\w+)\]\s+"
-        r"(?P<pid>\d+)#(?P<tid>\d+):\s+"
-        r"(?:\*(?P<connection_id>\d+)\s+)?"
-        r"(?P<message>.*)$"
+        r"(?P<pid>\d{1,10})#(?P<tid>\d{1,10}):\s+"
+        r"(?:\*(?P<connection_id>\d{1,20})\s+)?"
+        r"(?P<message>.*)$",
+        re.ASCII,
+    )
+
+    # Both formats in one regex, so a line is scanned once
+    COMBINED_PATTERN, _GROUPS = _combine_patterns(
+        (("access", ACCESS_LOG_PATTERN), ("error", ERROR_LOG_PATTERN))
     )
 
+    # Error log severities mapped to LogEntry levels
+    LEVEL_MAP = {
+        "EMERG": "CRITICAL",
+        "ALERT": "CRITICAL",
+        "CRIT": "CRITICAL",
+        "ERR": "ERROR",
+        "WARN": "WARNING",
+        "NOTICE": "INFO",
+        "INFO": "INFO",
+        "DEBUG": "DEBUG",
+    }
+
     def parse_line(self, line: str, line_number: int = 0) -> Optional[LogEntry]:
         """
         Parse a single Nginx log line.
@@ -53,32 +80,25 @@ class NginxParser(BaseParser):
         Returns:
             LogEntry or None if line cannot be parsed
         """
-        # Try access log format first
-        entry = self._parse_access_log(line)
-        if entry:
-            return entry
-
-        # Try error log format
-        entry = self._parse_error_log(line)
-        if entry:
-            return entry
+        # Both formats bracket a field (time or level), so a substring test
+        # rules most other lines out before the regex runs
+        match = self.COMBINED_PATTERN.match(line) if "[" in line else None
+        if match:
+            log_type = match.lastgroup
+            data = {name: match[group] for group, name in self._GROUPS[log_type]}
+            if log_type == "access":
+                return self._parse_access_log(data, line)
+            return self._parse_error_log(data, line)
 
         # If both fail, return None
         self.logger.debug("unrecognized_nginx_format", line=line[:100])
         return None
 
-    def _parse_access_log(self, line: str) -> Optional[LogEntry]:
-        """Parse Nginx access log line."""
-        match = self.ACCESS_LOG_PATTERN.match(line)
-        if not match:
-            return None
-
-        data = match.groupdict()
-
-        # Parse timestamp
-        timestamp = self._parse_timestamp(
-            data["time_local"],
-            ["%d/%b/%Y:%H:%M:%S %z", "%d/%b/%Y:%H:%M:%S"],
+    def _parse_access_log(self, data: dict[str, Optional[str]], line: str) -> LogEntry:
+        """Build an entry from the fields of an Nginx access log line."""
+        # Parse timestamp (dateutil only for layouts other than the default)
+        timestamp = _parse_clf_time(data["time_local"]) or self._parse_timestamp(
+            data["time_local"], []
         )
         if not timestamp:
             timestamp = datetime.now()
@@ -123,35 +143,16 @@ class NginxParser(BaseParser):
             raw=line,
         )
 
-    def _parse_error_log(self, line: str) -> Optional[LogEntry]:
-        """Parse Nginx error log line."""
-        match = self.ERROR_LOG_PATTERN.match(line)
-        if not match:
-            return None
-
-        data = match.groupdict()
-
+    def _parse_error_log(self, data: dict[str, Optional[str]], line: str) -> LogEntry:
+        """Build an entry from the fields of an Nginx error log line."""
         # Parse timestamp
-        timestamp = self._parse_timestamp(
-            data["timestamp"],
-            ["%Y/%m/%d %H:%M:%S"],
-        )
+        timestamp = _parse_ymd_time(data["timestamp"], "/")
         if not timestamp:
             timestamp = datetime.now()
 
         # Normalize level
         level = data["level"].upper()
-        level_map = {
-            "EMERG": "CRITICAL",
-            "ALERT": "CRITICAL",
-            "CRIT": "CRITICAL",
-            "ERR": "ERROR",
-            "WARN": "WARNING",
-            "NOTICE": "INFO",
-            "INFO": "INFO",
-            "DEBUG": "DEBUG",
-        }
-        level = level_map.get(level, level)
+        level = self.LEVEL_MAP.get(level, level)
 
         # Build metadata
         metadata = {
@@ -161,8 +162,17 @@ class NginxParser(BaseParser):
         if data.get("connection_id"):
             metadata["connection_id"] = data["connection_id"]
 
-        # Extract client IP from message if present
-        client_ip = self._extract_ip(data["message"])
+        # Extract client IP from message if present; nginx writes it after a
+        # literal "client: ", so the general search is only a fallback
+        message = data["message"]
+        client_ip = None
+        idx = message.find("client: ")
+        if idx >= 0:
+            token = message[idx + 8 :].split(",", 1)[0]
+            if _is_dotted_quad(token):
+                client_ip = token
+        if client_ip is None:
+            client_ip = self._extract_ip(message)
 
         return LogEntry(
             timestamp=timestamp,
@@ -4,26 +4,30 @@ import re
 from datetime import datetime
 from typing import Optional
 
-from .base import BaseParser, LogEntry
+from .base import BaseParser, LogEntry, _compile, _parse_ymd_time
 
 
 class PostgreSQLParser(BaseParser):
     """Parser for PostgreSQL database logs."""
 
+    __slots__ = ()
+
     # PostgreSQL log patterns
     # Format: timestamp [pid] LOG:  statement: SELECT ...
     # Format: timestamp [pid] ERROR:  syntax error at or near "..."
-    LOG_PATTERN = re.compile(
+    LOG_PATTERN = _compile(
         r"(?P<timestamp>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}(?:\.\d{3})?(?: [A-Z]{3,4})?)\s+"
-        r"\[(?P<pid>\d+)\]\s+"
+        r"\[(?P<pid>\d{1,10})\]\s+"
         r"(?P<level>[A-Z]+):\s+"
-        r"(?P<message>.*)"
+        r"(?P<message>.*)",
+        re.ASCII,
     )
 
     # CSV log format (common with log_destination = 'csvlog')
-    CSV_PATTERN = re.compile(
+    CSV_PATTERN = _compile(
         r"(?P<timestamp>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}(?:\.\d{3})?(?: [A-Z]{3,4})?),.*?"
-        r",(?P<level>[A-Z]+),"
+        r",(?P<level>[A-Z]+),",
+        re.ASCII,
     )
 
     def parse_line(self, line: str, line_number: int = 0) -> Optional[LogEntry]:
@@ -37,31 +41,17 @@ class PostgreSQLParser(BaseParser):
         Returns:
             Parsed LogEntry or None if parsing fails
         """
-        match = self.LOG_PATTERN.search(line)
+        # Both formats start with the timestamp, so match() anchors them there;
+        # substring tests for each format's separators skip hopeless attempts
+        match = self.LOG_PATTERN.match(line) if "[" in line else None
         if not match:
             # Try CSV format
-            match = self.CSV_PATTERN.search(line)
+            match = self.CSV_PATTERN.match(line) if "," in line else None
             if not match:
                 return None
 
-        timestamp_str = match.group("timestamp")
-        try:
-            # Try multiple timestamp formats
-            for fmt in [
-                "%Y-%m-%d %H:%M:%S.%f %Z",
-                "%Y-%m-%d %H:%M:%S %Z",
-                "%Y-%m-%d %H:%M:%S.%f",
-                "%Y-%m-%d %H:%M:%S",
-            ]:
-                try:
-                    timestamp = datetime.strptime(timestamp_str.strip(), fmt)
-                    break
-                except ValueError:
-                    continue
-            else:
-                timestamp = datetime.now()
-        except Exception:
-            timestamp = datetime.now()
+        # Timestamps are naive; a trailing zone name is ignored
+        timestamp = _parse_ymd_time(match.group("timestamp")) or datetime.now()
 
         level = match.group("level")
         message = match.group("message") if "message" in match.groupdict() else line
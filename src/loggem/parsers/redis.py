@@ -4,30 +4,42 @@ import re
 from datetime import datetime
 from typing import Optional
 
-from .base import BaseParser, LogEntry
+from .base import _MONTHS, BaseParser, LogEntry, _compile, _parse_date_time
 
 
 class RedisParser(BaseParser):
     """Parser for Redis database logs."""
 
+    __slots__ = ()
+
     # Redis log pattern
     # pid:role timestamp * level message
     # 1234:M 15 Jan 2024 10:30:45.123 * Server started, Redis version 7.0.0
     # 1234:M 15 Jan 2024 10:30:45.123 # WARNING overcommit_memory is set to 0
-    LOG_PATTERN = re.compile(
-        r"(?P<pid>\d+):(?P<role>[CMSX])\s+"
+    LOG_PATTERN = _compile(
+        r"(?P<pid>\d{1,10}):(?P<role>[CMSX])\s+"
         r"(?P<day>\d{1,2})\s+(?P<month>\w{3})\s+(?P<year>\d{4})\s+"
         r"(?P<time>\d{2}:\d{2}:\d{2}\.\d{3})\s+"
         r"(?P<level>[*#\-.])\s+"
-        r"(?P<message>.*)"
+        r"(?P<message>.*)",
+        re.ASCII,
     )
 
     # Role mapping
     ROLE_MAP = {"M": "master", "C": "child", "S": "sentinel", "X": "cluster"}
+    ROLE_MARKERS = tuple(f":{role} " for role in ROLE_MAP)
 
     # Level mapping
     LEVEL_MAP = {"*": "INFO", "#": "WARNING", "-": "NOTICE", ".": "DEBUG"}
 
+    # Message keywords marking each event, checked in priority order
+    EVENT_KEYWORDS = (
+        ("startup", ("starting", "ready to accept")),
+        ("shutdown", ("shutdown", "signal received")),
+        ("persistence", ("saving", "background save")),
+        ("replication", ("replica", "master")),
+    )
+
     def parse_line(self, line: str, line_number: int = 0) -> Optional[LogEntry]:
         """
         Parse a single Redis log line.
@@ -39,19 +51,18 @@ class RedisParser(BaseParser):
         Returns:
             Parsed LogEntry or None if parsing fails
         """
-        match = self.LOG_PATTERN.search(line)
+        # Redis writes "pid:role " literally; skip the search without it
+        if not any(marker in line for marker in self.ROLE_MARKERS):
+            return None
+
+        # Lines start with the pid, so match() anchors the pattern there
+        match = self.LOG_PATTERN.match(line)
         if not match:
             return None
 
-        # Parse timestamp
-        try:
-            timestamp_str = (
-                f"{match.group('day')} {match.group('month')} "
-                f"{match.group('year')} {match.group('time')}"
-            )
-            timestamp = datetime.strptime(timestamp_str, "%d %b %Y %H:%M:%S.%f")
-        except ValueError:
-            timestamp = datetime.now()
+        # Parse timestamp from the captured fields
+        day, month, year, clock = match.group("day", "month", "year", "time")
+        timestamp = _parse_date_time(year, _MONTHS.get(month, 0), day, clock) or datetime.now()
 
         level_char = match.group("level")
         level = self.LEVEL_MAP.get(level_char, "INFO")
@@ -63,17 +74,15 @@ class RedisParser(BaseParser):
 
         metadata = {"pid": match.group("pid"), "role": role, "level_char": level_char}
 
-        # Detect specific Redis events
-        if "starting" in message.lower() or "ready to accept" in message.lower():
-            metadata["event"] = "startup"
-        elif "shutdown" in message.lower() or "signal received" in message.lower():
-            metadata["event"] = "shutdown"
-        elif "saving" in message.lower() or "background save" in message.lower():
-            metadata["event"] = "persistence"
-        elif "replica" in message.lower() or "master" in message.lower():
-            metadata["event"] = "replication"
-        elif "warning" in message.lower():
-            level = "WARNING"
+        # Detect specific Redis events, lowercasing the message only once
+        lowered = message.lower()
+        for event, keywords in self.EVENT_KEYWORDS:
+            if any(keyword in lowered for keyword in keywords):
+                metadata["event"] = event
+                break
+        else:
+            if "warning" in lowered:
+                level = "WARNING"
 
         return LogEntry(
             timestamp=timestamp,
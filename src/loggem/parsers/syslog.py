@@ -9,7 +9,19 @@ from datetime import datetime
 from typing import Optional
 
 from loggem.core.models import LogEntry
-from loggem.parsers.base import BaseParser
+from loggem.parsers.base import BaseParser, _combine_patterns, _parse_syslog_time
+
+
+def _rfc5424_format(timestamp_str: str) -> str:
+    """
+    Pick the strptime format for an RFC 5424 timestamp from its shape.
+
+    A trailing "Z" or a numeric offset and an optional fraction are the only
+    variations, so one format is tried instead of probing each in turn.
+    """
+    fraction = ".%f" if "." in timestamp_str else ""
+    zone = "Z" if timestamp_str.endswith("Z") else "%z"
+    return f"%Y-%m-%dT%H:%M:%S{fraction}{zone}"
 
 
 class SyslogParser(BaseParser):
@@ -19,62 +31,76 @@ class SyslogParser(BaseParser):
     Supports both traditional BSD syslog and modern structured syslog formats.
     """
 
+    __slots__ = ()
+
     # RFC 3164 pattern: <priority>timestamp hostname process[pid]: message
     RFC3164_PATTERN = re.compile(
-        r"^(?:<(?P<priority>\d+)>)?"
+        r"^(?:<(?P<priority>\d{1,3})>)?"
         r"(?P<timestamp>\w+\s+\d+\s+\d+:\d+:\d+)\s+"
         r"(?P<hostname>\S+)\s+"
-        r"(?P<process>\S+?)(?:\[(?P<pid>\d+)\])?:\s+"
-        r"(?P<message>.*)$"
+        r"(?P<process>\S+?)(?:\[(?P<pid>\d{1,10})\])?:\s+"
+        r"(?P<message>.*)$",
+        re.ASCII,
     )
 
     # RFC 5424 pattern: <priority>version timestamp hostname app-name procid msgid [structured-data] message
     RFC5424_PATTERN = re.compile(
-        r"^<(?P<priority>\d+)>"
-        r"(?P<version>\d+)\s+"
+        r"^<(?P<priority>\d{1,3})>"
+        r"(?P<version>\d{1,2})\s+"
         r"(?P<timestamp>\S+)\s+"
         r"(?P<hostname>\S+)\s+"
         r"(?P<appname>\S+)\s+"
         r"(?P<procid>\S+)\s+"
         r"(?P<msgid>\S+)\s+"
         r"(?P<structured_data>\[.*?\]|-)\s*"
-        r"(?P<message>.*)$"
+        r"(?P<message>.*)$",
+        re.ASCII,
     )
 
-    # Syslog facilities and severities
-    FACILITIES = {
-        0: "kern",
-        1: "user",
-        2: "mail",
-        3: "daemon",
-        4: "auth",
-        5: "syslog",
-        6: "lpr",
-        7: "news",
-        8: "uucp",
-        9: "cron",
-        10: "authpriv",
-        11: "ftp",
-        16: "local0",
-        17: "local1",
-        18: "local2",
-        19: "local3",
-        20: "local4",
-        21: "local5",
-        22: "local6",
-        23: "local7",
-    }
-
-    SEVERITIES = {
-        0: "EMERGENCY",
-        1: "ALERT",
-        2: "CRITICAL",
-        3: "ERROR",
-        4: "WARNING",
-        5: "NOTICE",
-        6: "INFO",
-        7: "DEBUG",
-    }
+    # Both formats in one regex, RFC 5424 first (more structured)
+    COMBINED_PATTERN, _GROUPS = _combine_patterns(
+        (("rfc5424", RFC5424_PATTERN), ("rfc3164", RFC3164_PATTERN))
+    )
+
+    # Syslog facility and severity names, indexed by their codes; facilities
+    # 12-15 and any above 23 are reported as unknown(N)
+    FACILITIES = (
+        "kern",
+        "user",
+        "mail",
+        "daemon",
+        "auth",
+        "syslog",
+        "lpr",
+        "news",
+        "uucp",
+        "cron",
+        "authpriv",
+        "ftp",
+        "unknown(12)",
+        "unknown(13)",
+        "unknown(14)",
+        "unknown(15)",
+        "local0",
+        "local1",
+        "local2",
+        "local3",
+        "local4",
+        "local5",
+        "local6",
+        "local7",
+    )
+
+    SEVERITIES = (
+        "EMERGENCY",
+        "ALERT",
+        "CRITICAL",
+        "ERROR",
+        "WARNING",
+        "NOTICE",
+        "INFO",
+        "DEBUG",
+    )
 
     def parse_line(self, line: str, line_number: int = 0) -> Optional[LogEntry]:
         """
@@ -87,15 +113,13 @@ class SyslogParser(BaseParser):
         Returns:
             LogEntry or None if line cannot be parsed
         """
-        # Try RFC 5424 first (more structured)
-        entry = self._parse_rfc5424(line)
-        if entry:
-            return entry
-
-        # Fall back to RFC 3164
-        entry = self._parse_rfc3164(line)
-        if entry:
-            return entry
+        match = self.COMBINED_PATTERN.match(line)
+        if match:
+            log_format = match.lastgroup
+            data = {name: match[group] for group, name in self._GROUPS[log_format]}
+            if log_format == "rfc5424":
+                return self._parse_rfc5424(data, line)
+            return self._parse_rfc3164(data, line)
 
         # If both fail, create a basic entry
         self.logger.debug("unstructured_syslog", line=line[:100])
@@ -107,14 +131,8 @@ class SyslogParser(BaseParser):
             raw=line,
         )
 
-    def _parse_rfc3164(self, line: str) -> Optional[LogEntry]:
-        """Parse RFC 3164 format syslog."""
-        match = self.RFC3164_PATTERN.match(line)
-        if not match:
-            return None
-
-        data = match.groupdict()
-
+    def _parse_rfc3164(self, data: dict[str, Optional[str]], line: str) -> LogEntry:
+        """Build an entry from the fields of an RFC 3164 syslog line."""
         # Parse priority (default to 13 = user.notice if not present)
         priority_str = data.get("priority")
         priority = int(priority_str) if priority_str else 13
@@ -123,17 +141,21 @@ class SyslogParser(BaseParser):
 
         # Parse timestamp (BSD syslog format doesn't include year)
         timestamp_str = data["timestamp"]
-        timestamp = self._parse_timestamp(
-            timestamp_str,
-            ["%b %d %H:%M:%S", "%b  %d %H:%M:%S"],  # Note: double space for single digit days
-        )
+        timestamp = _parse_syslog_time(timestamp_str, self._now().year)
+        if timestamp is None:
+            # e.g. a lowercase month name; dateutil is more forgiving
+            timestamp = self._parse_timestamp(timestamp_str, [])
         if not timestamp:
             timestamp = datetime.now()
 
         # Build metadata
         metadata = {
-            "facility": self.FACILITIES.get(facility, f"unknown({facility})"),
-            "severity": self.SEVERITIES.get(severity, f"unknown({severity})"),
+            "facility": (
+                self.FACILITIES[facility]
+                if facility < len(self.FACILITIES)
+                else f"unknown({facility})"
+            ),
+            "severity": self.SEVERITIES[severity],
             "priority": priority,
         }
 
@@ -144,38 +166,34 @@ class SyslogParser(BaseParser):
             timestamp=timestamp,
             source=self.source_name,
             message=data["message"],
-            level=self.SEVERITIES.get(severity, "INFO"),
+            level=self.SEVERITIES[severity],
             host=data["hostname"],
             process=data["process"],
             metadata=metadata,
             raw=line,
         )
 
-    def _parse_rfc5424(self, line: str) -> Optional[LogEntry]:
-        """Parse RFC 5424 format syslog."""
-        match = self.RFC5424_PATTERN.match(line)
-        if not match:
-            return None
-
-        data = match.groupdict()
-
+    def _parse_rfc5424(self, data: dict[str, Optional[str]], line: str) -> LogEntry:
+        """Build an entry from the fields of an RFC 5424 syslog line."""
         # Parse priority
         priority = int(data["priority"])
         facility = priority >> 3
         severity = priority & 0x07
 
         # Parse timestamp (ISO 8601 format)
-        timestamp = self._parse_timestamp(
-            data["timestamp"],
-            ["%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%dT%H:%M:%S%z"],
-        )
+        timestamp_str = data["timestamp"]
+        timestamp = self._parse_timestamp(timestamp_str, [_rfc5424_format(timestamp_str)])
         if not timestamp:
             timestamp = datetime.now()
 
         # Build metadata
         metadata = {
-            "facility": self.FACILITIES.get(facility, f"unknown({facility})"),
-            "severity": self.SEVERITIES.get(severity, f"unknown({severity})"),
+            "facility": (
+                self.FACILITIES[facility]
+                if facility < len(self.FACILITIES)
+                else f"unknown({facility})"
+            ),
+            "severity": self.SEVERITIES[severity],
             "priority": priority,
             "version": data["version"],
             "msgid": data["msgid"],
@@ -189,7 +207,7 @@ class SyslogParser(BaseParser):
             timestamp=timestamp,
             source=self.source_name,
             message=data["message"],
-            level=self.SEVERITIES.get(severity, "INFO"),
+            level=self.SEVERITIES[severity],
             host=data["hostname"] if data["hostname"] != "-" else None,
             process=data["appname"] if data["appname"] != "-" else None,
             metadata=metadata,
@@ -8,20 +8,136 @@ Supports parsing Windows Event Logs in XML and EVTX formats:
 - Custom event logs
 """
 
+import functools
+import re
+import sys
 import xml.etree.ElementTree as ET
 from datetime import datetime
 from typing import Optional
 
 from ..core.logging import get_logger
 from ..core.models import LogEntry
-from .base import BaseParser
+from .base import BaseParser, _parse_date_time, _parse_ymd_time
 
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_text_time(timestamp_str: str) -> Optional[datetime]:
+    """Parse a text format timestamp, memoized since events share seconds"""
+    parts = timestamp_str.split()
+    if len(parts) not in (2, 3):
+        return None
+
+    # 2025-10-05 14:30:45
+    if len(parts) == 2 and "-" in parts[0]:
+        return _parse_ymd_time(timestamp_str)
+
+    # 10/5/2025 14:30:45 or 10/5/2025 2:30:45 PM
+    try:
+        month, day, year = parts[0].split("/")
+    except ValueError:
+        return None
+    parsed = _parse_date_time(year, month, day, parts[1])
+    if parsed is None or len(parts) == 2:
+        return parsed
+
+    meridiem = parts[2].upper()
+    if meridiem not in ("AM", "PM") or not 1 <= parsed.hour <= 12:
+        return None
+    return parsed.replace(hour=parsed.hour % 12 + (12 if meridiem == "PM" else 0))
+
+
+# System fields read straight off the raw XML of an unprefixed event
+_XML_TEXT_PATTERNS = tuple(
+    (tag, re.compile(rf"<{tag}(?:\s[^>]*)?>([^<]*)</{tag}>"))
+    for tag in ("EventID", "Level", "Computer", "Channel")
+)
+_XML_TIME_PATTERN = re.compile(r"<TimeCreated\s(?:[^>]*?\s)?SystemTime=([\"'])(.*?)\1")
+_XML_PROVIDER_PATTERN = re.compile(r"<Provider\s(?:[^>]*?\s)?Name=([\"'])(.*?)\1")
+_XML_DATA_PATTERN = re.compile(r"<Data((?:\s[^>]*?)?)(?:/>|>([^<]*)</Data>)")
+_XML_NAME_PATTERN = re.compile(r"\sName=([\"'])(.*?)\1")
+
+
+# "Label: value" lines of an event copied from Event Viewer
+_TEXT_FIELD_PATTERN = re.compile(r"^([^:\n]*):(.*)$", re.MULTILINE)
+
+# Event Viewer labels stored under the metadata names the XML path uses
+_TEXT_KEY_NAMES = {"date": "timestamp", "source": "provider", "log_name": "channel"}
+
+
+@functools.lru_cache(maxsize=256)
+def _text_key(label: str) -> str:
+    """Turn an Event Viewer label such as "Event ID" into a metadata key"""
+    key = label.strip().lower().replace(" ", "_")
+    return _TEXT_KEY_NAMES.get(key, key)
+
+
+def _scan_xml_event(xml_string: str) -> Optional[tuple]:
+    """
+    Extract event fields from XML with regular expressions, skipping ElementTree.
+
+    Only handles the plain layout of exported events. Entities, comments,
+    CDATA, namespace prefixes, nested Data content or a missing field all
+    return None so the caller can fall back to a full parse.
+
+    Returns:
+        (event_id, level, system_time, provider, computer, channel, data_items)
+        or None
+    """
+    if "&" in xml_string or "<!" in xml_string or not xml_string.rstrip().endswith("</Event>"):
+        return None
+
+    start = xml_string.find("<System>")
+    end = xml_string.find("</System>", start)
+    if start < 0 or end < 0:
+        return None
+    system = xml_string[start:end]
+
+    fields = {}
+    for tag, pattern in _XML_TEXT_PATTERNS:
+        match = pattern.search(system)
+        if match is None:
+            return None
+        fields[tag] = match.group(1)
+    time_match = _XML_TIME_PATTERN.search(system)
+    provider_match = _XML_PROVIDER_PATTERN.search(system)
+    if time_match is None or provider_match is None:
+        return None
+
+    data_items = {}
+    start = xml_string.find("<EventData")
+    if start >= 0:
+        end = xml_string.find("</EventData>", start)
+        if end < 0:
+            return None
+        event_data = xml_string[start:end]
+        matches = _XML_DATA_PATTERN.findall(event_data)
+        if len(matches) != event_data.count("<Data"):
+            return None
+        for attributes, text in matches:
+            name = _XML_NAME_PATTERN.search(attributes)
+            if name and name.group(2):
+                data_items[name.group(2)] = text
+
+    # Provider, computer and channel repeat across a whole export, so every
+    # entry shares one copy of each
+    return (
+        fields["EventID"],
+        fields["Level"],
+        time_match.group(2),
+        sys.intern(provider_match.group(2)),
+        sys.intern(fields["Computer"]),
+        sys.intern(fields["Channel"]),
+        data_items,
+    )
+
+
 class WindowsEventLogParser(BaseParser):
     """Parser for Windows Event Logs"""
 
+    __slots__ = ()
+
     # Windows Event Log XML namespaces
     NAMESPACES = {"evt": "http://schemas.microsoft.com/win/2004/08/events/event"}
 
@@ -93,11 +209,12 @@ class WindowsEventLogParser(BaseParser):
         Returns:
             LogEntry or None if parsing fails
         """
-        if not line or not line.strip():
+        stripped = line.strip()
+        if not stripped:
             return None
 
         # Try XML format first
-        if line.strip().startswith("<Event"):
+        if stripped.startswith("<Event"):
             return self._parse_xml_event(line)
 
         # Try plain text format
@@ -114,46 +231,16 @@ class WindowsEventLogParser(BaseParser):
             LogEntry or None
         """
         try:
-            root = ET.fromstring(xml_string)
-
-            # Remove namespace from tags for easier parsing
-            for elem in root.iter():
-                if "}" in elem.tag:
-                    elem.tag = elem.tag.split("}", 1)[1]
-
-            # Extract System section
-            system = root.find("System")
-            if system is None:
+            # Typical exported events are read with regular expressions; anything
+            # unusual goes through ElementTree
+            fields = _scan_xml_event(xml_string) or self._read_xml_event(xml_string)
+            if fields is None:
                 return None
+            event_id, level, timestamp_str, provider, computer, channel, data_items = fields
 
-            # Extract event metadata
-            event_id_elem = system.find(".//EventID")
-            level_elem = system.find(".//Level")
-            time_created = system.find(".//TimeCreated")
-            provider_elem = system.find(".//Provider")
-            computer_elem = system.find(".//Computer")
-            channel_elem = system.find(".//Channel")
-
-            event_id = event_id_elem.text if event_id_elem is not None else "Unknown"
-            level = level_elem.text if level_elem is not None else "4"
             level_name = self.EVENT_LEVELS.get(level, "Information")
-
-            timestamp_str = time_created.get("SystemTime") if time_created is not None else None
             timestamp = self._parse_timestamp(timestamp_str) if timestamp_str else None
 
-            provider = provider_elem.get("Name") if provider_elem is not None else "Unknown"
-            computer = computer_elem.text if computer_elem is not None else "Unknown"
-            channel = channel_elem.text if channel_elem is not None else "Unknown"
-
-            # Extract EventData
-            event_data = root.find(".//EventData")
-            data_items = {}
-            if event_data is not None:
-                for data in event_data.findall(".//Data"):
-                    name = data.get("Name")
-                    if name:
-                        data_items[name] = data.text or ""
-
             # Get event description
             event_description = self._get_event_description(int(event_id), channel)
 
@@ -203,6 +290,55 @@ class WindowsEventLogParser(BaseParser):
             logger.error("windows_event_parse_error", error=str(e))
             return None
 
+    def _read_xml_event(self, xml_string: str) -> Optional[tuple]:
+        """
+        Extract event fields by parsing the XML with ElementTree
+
+        Args:
+            xml_string: XML event string
+
+        Returns:
+            The same field tuple as _scan_xml_event(), or None without a System section
+        """
+        root = ET.fromstring(xml_string)
+
+        # Remove namespace from tags for easier parsing
+        for elem in root.iter():
+            if "}" in elem.tag:
+                elem.tag = elem.tag.split("}", 1)[1]
+
+        # Extract System section
+        system = root.find("System")
+        if system is None:
+            return None
+
+        # Extract event metadata
+        event_id_elem = system.find(".//EventID")
+        level_elem = system.find(".//Level")
+        time_created = system.find(".//TimeCreated")
+        provider_elem = system.find(".//Provider")
+        computer_elem = system.find(".//Computer")
+        channel_elem = system.find(".//Channel")
+
+        # Extract EventData
+        event_data = root.find(".//EventData")
+        data_items = {}
+        if event_data is not None:
+            for data in event_data.findall(".//Data"):
+                name = data.get("Name")
+                if name:
+                    data_items[name] = data.text or ""
+
+        return (
+            event_id_elem.text if event_id_elem is not None else "Unknown",
+            level_elem.text if level_elem is not None else "4",
+            time_created.get("SystemTime") if time_created is not None else None,
+            provider_elem.get("Name") if provider_elem is not None else "Unknown",
+            computer_elem.text if computer_elem is not None else "Unknown",
+            channel_elem.text if channel_elem is not None else "Unknown",
+            data_items,
+        )
+
     def _parse_text_event(self, text: str) -> Optional[LogEntry]:
         """
         Parse plain text Windows Event (from Event Viewer copy)
@@ -226,32 +362,11 @@ class WindowsEventLogParser(BaseParser):
             LogEntry or None
         """
         try:
-            lines = text.strip().split("\n")
             metadata = {"log_type": "windows_event"}
 
-            for line in lines:
-                if ":" in line:
-                    key, value = line.split(":", 1)
-                    key = key.strip().lower().replace(" ", "_")
-                    value = value.strip()
-
-                    if key == "date":
-                        timestamp = self._parse_text_timestamp(value)
-                        metadata["timestamp"] = value
-                    elif key == "event_id":
-                        metadata["event_id"] = value
-                    elif key == "level":
-                        metadata["level"] = value
-                    elif key == "source":
-                        metadata["provider"] = value
-                    elif key == "computer":
-                        metadata["computer"] = value
-                    elif key == "log_name":
-                        metadata["channel"] = value
-                    elif key == "description":
-                        metadata["description"] = value
-                    else:
-                        metadata[key] = value
+            # Every "Label: value" line, split at its first colon
+            for label, value in _TEXT_FIELD_PATTERN.findall(text):
+                metadata[_text_key(label)] = value.strip()
 
             # Build message
             event_id = metadata.get("event_id", "Unknown")
@@ -287,19 +402,7 @@ class WindowsEventLogParser(BaseParser):
 
     def _parse_text_timestamp(self, timestamp_str: str) -> Optional[datetime]:
         """Parse text format timestamp"""
-        formats = [
-            "%m/%d/%Y %I:%M:%S %p",  # 10/5/2025 2:30:45 PM
-            "%m/%d/%Y %H:%M:%S",  # 10/5/2025 14:30:45
-            "%Y-%m-%d %H:%M:%S",  # 2025-10-05 14:30:45
-        ]
-
-        for fmt in formats:
-            try:
-                return datetime.strptime(timestamp_str, fmt)
-            except:
-                continue
-
-        return None
+        return _parse_text_time(timestamp_str)
 
     def _get_event_description(self, event_id: int, channel: str) -> Optional[str]:
         """Get human-readable description for event ID"""
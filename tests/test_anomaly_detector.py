@@ -0,0 +1,75 @@
+"""
+Unit tests for the AI anomaly detector.
+"""
+
+import json
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from loggem.core.config import reset_settings
+from loggem.core.models import LogEntry, Severity
+from loggem.detector.anomaly_detector import AnomalyDetector
+
+ANOMALY = json.dumps(
+    {"is_anomaly": True, "confidence": 0.9, "severity": "high", "anomaly_type": "brute_force"}
+)
+NORMAL = json.dumps({"is_anomaly": False})
+
+
+class TestAnomalyDetector:
+    """Test AnomalyDetector batch detection."""
+
+    def setup_method(self):
+        """Reset settings before each test."""
+        reset_settings()
+
+    def teardown_method(self):
+        """Reset settings after each test."""
+        reset_settings()
+
+    @pytest.fixture
+    def detector(self, monkeypatch):
+        """Detector with a mocked model manager and windows of two entries."""
+        with patch("loggem.detector.anomaly_detector.ModelManager"):
+            detector = AnomalyDetector(sensitivity=1.0, min_confidence=0.5)
+        monkeypatch.setattr(detector.settings.detection, "batch_size", 2)
+        return detector
+
+    @staticmethod
+    def entries(count):
+        now = datetime.now()
+        return [
+            LogEntry(timestamp=now, message=f"msg{i}", source="auth", raw=f"msg{i}")
+            for i in range(count)
+        ]
+
+    def test_detect_batch_generates_responses_per_window(self, detector):
+        """Test prompts reach the model through batched generate_responses calls."""
+        manager = detector.model_manager
+        manager.generate_responses.side_effect = lambda prompts, **_kwargs: [
+            ANOMALY if "msg1" in prompt.rsplit("Message:", 1)[1] else NORMAL for prompt in prompts
+        ]
+        entries = self.entries(5)
+
+        anomalies = detector.detect_batch(entries)
+
+        assert [len(c.args[0]) for c in manager.generate_responses.call_args_list] == [2, 2, 1]
+        assert manager.generate_responses.call_args.kwargs == {"temperature": 0.3, "cache": True}
+        manager.generate_response.assert_not_called()
+        assert [a.log_entry_id for a in anomalies] == [entries[1].id]
+        assert anomalies[0].severity == Severity.HIGH
+
+    def test_failed_window_does_not_stop_detection(self, detector):
+        """Test a window whose generation fails is skipped, not reported as normal."""
+        manager = detector.model_manager
+        manager.generate_responses.side_effect = [
+            RuntimeError("batch failed"),
+            [ANOMALY, ANOMALY],
+        ]
+
+        anomalies = detector.detect_batch(self.entries(4))
+
+        assert len(anomalies) == 2
+        assert manager.generate_responses.call_count == 2
@@ -45,6 +45,15 @@ class TestModelConfig:
         config = ModelConfig()
         assert config.quantization == "int8"
 
+    def test_four_bit_quantization(self):
+        """Test 4-bit quantization modes are accepted."""
+        assert ModelConfig(quantization="nf4").quantization == "nf4"
+        assert ModelConfig(quantization="int4").quantization == "int4"
+
+    def test_fp8_quantization(self):
+        """Test fp8 quantization mode is accepted."""
+        assert ModelConfig(quantization="fp8").quantization == "fp8"
+
     def test_default_max_length(self):
         """Test default max_length is 2048."""
         config = ModelConfig()
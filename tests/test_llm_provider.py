@@ -5,6 +5,13 @@ Note: Initialization tests are skipped because they require mocking dynamic impo
 Integration tests should test actual provider initialization.
 """
 
+import contextlib
+import json
+import queue
+import sys
+import types
+from unittest.mock import MagicMock, Mock
+
 import pytest
 
 from loggem.detector.llm_provider import (
@@ -16,6 +23,11 @@ from loggem.detector.llm_provider import (
     OpenAIProvider,
     create_provider,
 )
+from loggem.detector.providers.huggingface import (
+    _length_buckets,
+    _resolve_device,
+    _supports_static_cache,
+)
 
 
 class TestLLMProviderBase:
@@ -26,6 +38,70 @@ class TestLLMProviderBase:
         with pytest.raises(TypeError):
             LLMProvider({})
 
+    def test_generate_batch_defaults_to_generate(self):
+        """Test the default generate_batch calls generate once per prompt."""
+
+        class EchoProvider(LLMProvider):
+            def initialize(self):
+                pass
+
+            def generate(self, prompt, max_tokens=512, temperature=0.7, top_p=0.9, **kwargs):
+                return f"{prompt}:{max_tokens}:{temperature}:{top_p}:{len(kwargs)}"
+
+            def cleanup(self):
+                pass
+
+            def get_info(self):
+                return {}
+
+        provider = EchoProvider({})
+        responses = provider.generate_batch(["a", "b"], max_tokens=8, temperature=0.1)
+
+        assert responses == ["a:8:0.1:0.9:0", "b:8:0.1:0.9:0"]
+
+
+class TestResolveDevice:
+    """Test device resolution for local models."""
+
+    def test_explicit_device_is_kept(self):
+        """Test explicit devices are returned without probing torch."""
+        assert _resolve_device("cpu") == "cpu"
+        assert _resolve_device("cuda") == "cuda"
+
+
+class TestSupportsStaticCache:
+    """Test the static KV cache capability check."""
+
+    @pytest.mark.parametrize(
+        ("flags", "expected"),
+        [
+            ({"_supports_static_cache": True}, True),
+            ({"_can_compile_fullgraph": True}, True),
+            ({}, False),
+        ],
+    )
+    def test_model_flags(self, flags, expected):
+        """Test support is read from the architecture's flags."""
+        model = Mock(spec=list(flags))
+        for name, value in flags.items():
+            setattr(model, name, value)
+
+        assert _supports_static_cache(model) is expected
+
+
+class TestLengthBuckets:
+    """Test length bucketing for batched generation."""
+
+    def test_buckets_respect_batch_size(self):
+        """Test equal-length sequences are split by batch size."""
+        assert _length_buckets([10] * 5, batch_size=2) == [[0, 1], [2, 3], [4]]
+
+    def test_buckets_group_similar_lengths(self):
+        """Test sequences are sorted and split when the length spread is too large."""
+        buckets = _length_buckets([100, 10, 105, 11, 50], batch_size=8)
+
+        assert buckets == [[1, 3], [4], [0, 2]]
+
 
 class TestHuggingFaceProvider:
     """Test HuggingFaceProvider implementation."""
@@ -58,6 +134,7 @@ class TestHuggingFaceProvider:
         assert provider.quantization == "int8"
         assert provider.cache_dir == "./models"
         assert provider.trust_remote_code is False
+        assert provider.attn_impl == "sdpa"
 
     def test_get_info_not_initialized(self):
         """Test get_info when not initialized."""
@@ -69,6 +146,131 @@ class TestHuggingFaceProvider:
         assert info["model_name"] == "test-model"
         assert info["initialized"] is False
 
+    def test_get_info_uses_cached_parameter_count(self):
+        """Test get_info reports the parameter count computed at load time."""
+        provider = HuggingFaceProvider({"model_name": "test-model"})
+        provider.model = Mock()
+        provider.is_initialized = True
+        provider._param_count = 1234
+
+        assert provider.get_info()["parameters"] == 1234
+        provider.model.parameters.assert_not_called()
+
+    @pytest.fixture
+    def streaming_provider(self, monkeypatch):
+        """Provider whose generate_stream runs against a queue-backed streamer."""
+
+        class QueueStreamer:
+            """Stand-in for TextIteratorStreamer: yields text until end()."""
+
+            def __init__(self, tokenizer, **kwargs):
+                self.tokenizer = tokenizer
+                self.options = kwargs
+                self.queue = queue.Queue()
+
+            def put(self, text):
+                self.queue.put(text)
+
+            def end(self):
+                self.queue.put(None)
+
+            def __iter__(self):
+                return iter(self.queue.get, None)
+
+        torch = types.SimpleNamespace(inference_mode=contextlib.nullcontext)
+        transformers = types.SimpleNamespace(TextIteratorStreamer=QueueStreamer)
+        monkeypatch.setitem(sys.modules, "torch", torch)
+        monkeypatch.setitem(sys.modules, "transformers", transformers)
+
+        provider = HuggingFaceProvider({"model_name": "test-model"})
+        provider.model = Mock()
+        provider.tokenizer = Mock()
+        provider._encode = Mock(return_value={})
+        provider.is_initialized = True
+        return provider
+
+    def test_generate_stream_yields_chunks(self, streaming_provider):
+        """Test streamed text chunks are yielded as the worker produces them."""
+
+        def generate(streamer, **kwargs):
+            streamer.put("Hello ")
+            streamer.put("world")
+            streamer.end()
+
+        streaming_provider.model.generate.side_effect = generate
+
+        assert list(streaming_provider.generate_stream("prompt")) == ["Hello ", "world"]
+
+    def test_compiled_forward_used_by_generate(self, monkeypatch):
+        """Test generate() runs through the forward pass torch.compile returned."""
+        compiled_calls = []
+
+        def fake_compile(fn, **kwargs):
+            def compiled(**inputs):
+                compiled_calls.append(inputs)
+                return fn(**inputs)
+
+            return compiled
+
+        class Model:
+            def forward(self, **inputs):
+                return {"logits": inputs}
+
+            def generate(self, **kwargs):
+                self.kwargs = kwargs
+                self.forward(input_ids=kwargs["input_ids"])
+                return MagicMock()
+
+        torch = types.SimpleNamespace(inference_mode=contextlib.nullcontext, compile=fake_compile)
+        monkeypatch.setitem(sys.modules, "torch", torch)
+
+        provider = HuggingFaceProvider({"model_name": "test-model", "compile": True})
+        provider.model = Model()
+        provider.tokenizer = Mock()
+        provider.tokenizer.decode.return_value = " ok "
+        input_ids = types.SimpleNamespace(shape=(1, 3))
+        provider._encode = Mock(return_value={"input_ids": input_ids})
+        provider.is_initialized = True
+
+        provider._compile_forward()
+
+        assert provider.generate("prompt", max_tokens=64) == "ok"
+        assert compiled_calls == [{"input_ids": input_ids}]
+        # The compiled decode loop gets a static cache of fixed length
+        assert provider.model.kwargs["cache_implementation"] == "static"
+        assert provider.model.kwargs["max_cache_len"] == 2048 + 64
+
+    @pytest.mark.parametrize(
+        "transformers, fbgemm_available, expected",
+        [
+            (types.SimpleNamespace(FbgemmFp8Config=lambda: "fp8-config"), True, "fp8-config"),
+            (types.SimpleNamespace(FbgemmFp8Config=lambda: "fp8-config"), False, None),
+            (types.SimpleNamespace(), True, None),
+        ],
+    )
+    def test_fp8_config_falls_back(self, monkeypatch, transformers, fbgemm_available, expected):
+        """Test FP8 loads fall back to fp16 without the config class or fbgemm kernels."""
+        utils = types.SimpleNamespace(is_fbgemm_gpu_available=lambda: fbgemm_available)
+        monkeypatch.setitem(sys.modules, "transformers", transformers)
+        monkeypatch.setitem(sys.modules, "transformers.utils", utils)
+        monkeypatch.setattr(HuggingFaceProvider, "_supports_fp8", lambda _self: True)
+
+        provider = HuggingFaceProvider({"model_name": "m", "quantization": "fp8"})
+
+        assert provider._build_fp8_config() == expected
+
+    def test_static_cache_requires_compile(self):
+        """Test the static KV cache is off unless the forward pass is compiled."""
+        assert HuggingFaceProvider({"model_name": "m"}).static_cache is False
+        assert HuggingFaceProvider({"model_name": "m", "compile": True}).static_cache is True
+
+    def test_generate_stream_reraises_worker_error(self, streaming_provider):
+        """Test a failing generate ends the stream and raises in the caller."""
+        streaming_provider.model.generate.side_effect = RuntimeError("CUDA out of memory")
+
+        with pytest.raises(RuntimeError, match="out of memory"):
+            list(streaming_provider.generate_stream("prompt"))
+
 
 class TestOpenAIProvider:
     """Test OpenAIProvider implementation."""
@@ -101,6 +303,55 @@ class TestOpenAIProvider:
         assert info["model"] == "gpt-4o"
         assert info["initialized"] is False
 
+    def test_generate_stream_yields_deltas(self):
+        """Test streamed completions yield each non-empty delta."""
+        provider = OpenAIProvider({})
+        provider.client = Mock()
+        provider.client.chat.completions.create.return_value = [
+            Mock(choices=[Mock(delta=Mock(content=text))]) for text in ("Hel", None, "lo")
+        ]
+        provider.is_initialized = True
+
+        assert list(provider.generate_stream("prompt")) == ["Hel", "lo"]
+        assert provider.client.chat.completions.create.call_args.kwargs["stream"] is True
+
+    def test_generate_batch_uses_batch_api(self):
+        """Test batch generation submits one job and maps results back by id."""
+        provider = OpenAIProvider({"batch_api": True, "batch_poll_interval": 0})
+        provider.client = Mock()
+        provider.client.batches.create.return_value = Mock(id="b1", status="validating")
+        provider.client.batches.retrieve.return_value = Mock(
+            id="b1", status="completed", output_file_id="out"
+        )
+        provider.client.files.content.return_value.text = "\n".join(
+            json.dumps(
+                {
+                    "custom_id": custom_id,
+                    "response": {"body": {"choices": [{"message": {"content": text}}]}},
+                }
+            )
+            for custom_id, text in (("1", "second"), ("0", "first"))
+        )
+        provider.is_initialized = True
+
+        assert provider.concurrent_requests is False
+        assert provider.generate_batch(["a", "b"]) == ["first", "second"]
+        provider.client.batches.create.assert_called_once()
+
+        # A request missing from the output is an error, not an empty answer
+        with pytest.raises(RuntimeError, match="completed 2 of 3 requests"):
+            provider.generate_batch(["a", "b", "c"])
+
+    def test_generate_batch_failed_job_raises(self):
+        """Test a batch job that does not complete raises an error."""
+        provider = OpenAIProvider({"batch_api": True, "batch_poll_interval": 0})
+        provider.client = Mock()
+        provider.client.batches.create.return_value = Mock(id="b1", status="failed")
+        provider.is_initialized = True
+
+        with pytest.raises(RuntimeError, match="failed"):
+            provider.generate_batch(["a"])
+
 
 class TestAnthropicProvider:
     """Test AnthropicProvider implementation."""
@@ -170,6 +421,49 @@ class TestOllamaProvider:
         assert info["model"] == "llama2"
         assert info["initialized"] is False
 
+    def test_generate_reuses_session(self):
+        """Test requests go through the provider's pooled session."""
+        provider = OllamaProvider({"model": "llama2"})
+        provider.session = Mock()
+        provider.session.post.return_value.content = b'{"response": "ok"}'
+        provider.is_initialized = True
+
+        assert provider.generate("one") == "ok"
+        assert provider.generate("two") == "ok"
+        assert provider.session.post.call_count == 2
+
+    def test_generate_payload(self):
+        """Test the request body combines the fixed fields with per-call options."""
+        provider = OllamaProvider({"model": "llama2"})
+        provider.session = Mock()
+        provider.session.post.return_value.content = b'{"response": "ok"}'
+        provider.is_initialized = True
+
+        provider.generate("prompt", max_tokens=64, temperature=0.0, top_p=1.0)
+
+        args, kwargs = provider.session.post.call_args
+        assert args[0] == "http://localhost:11434/api/generate"
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+        assert json.loads(kwargs["data"]) == {
+            "model": "llama2",
+            "stream": False,
+            "prompt": "prompt",
+            "options": {"temperature": 0.0, "top_p": 1.0, "num_predict": 64},
+        }
+        assert provider._payload_template == {"model": "llama2", "stream": False}
+
+    def test_cleanup_closes_session(self):
+        """Test cleanup closes the pooled session."""
+        provider = OllamaProvider({"model": "llama2"})
+        session = Mock()
+        provider.session = session
+        provider.is_initialized = True
+
+        provider.cleanup()
+
+        session.close.assert_called_once()
+        assert provider.session is None
+
 
 class TestProviderFactory:
     """Test provider factory functions."""
@@ -221,3 +515,8 @@ class TestProviderFactory:
         """Test that provider registry has expected keys."""
         expected_providers = {"huggingface", "openai", "anthropic", "ollama"}
         assert set(PROVIDERS.keys()) == expected_providers
+
+    def test_provider_registry_is_read_only(self):
+        """Test the provider registry cannot be mutated at runtime."""
+        with pytest.raises(TypeError):
+            PROVIDERS["custom"] = "custom.module:CustomProvider"
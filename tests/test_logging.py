@@ -0,0 +1,175 @@
+"""
+Unit tests for logging utilities.
+"""
+
+import json
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from loggem.core.logging import AuditLogger, _dumps, _dumps_bytes, _SwappableSink
+
+
+class TestJSONSerializer:
+    """Test cases for the log event serializer."""
+
+    def test_dumps_non_json_types(self):
+        """Test values without a JSON form are rendered as strings."""
+        event = {"event": "scan", "path": Path("/var/log/auth.log"), "at": datetime(2025, 1, 1)}
+
+        assert json.loads(_dumps(event))["path"] == "/var/log/auth.log"
+        assert json.loads(_dumps_bytes(event))["event"] == "scan"
+
+    def test_dumps_non_str_keys_and_wide_ints(self):
+        """Test integer keys and integers wider than 64 bits serialize."""
+        event = {"event": "scan", "counts": {404: 3}, "offset": 2**70}
+
+        for rendered in (_dumps(event), _dumps_bytes(event).decode()):
+            decoded = json.loads(rendered)
+            assert decoded["counts"] == {"404": 3}
+            assert decoded["offset"] == 2**70
+
+    def test_dumps_honors_json_kwargs(self):
+        """Test json.dumps options are applied rather than dropped."""
+        event = {"b": 1, "a": Path("/x")}
+
+        assert _dumps(event, sort_keys=True) == '{"a": "/x", "b": 1}'
+        assert json.loads(_dumps(event, default=repr))["a"] == repr(Path("/x"))
+        assert _dumps_bytes(event, sort_keys=True) == b'{"a": "/x", "b": 1}'
+
+
+class TestSwappableSink:
+    """Test cases for the bytes logging sink."""
+
+    def test_reopen_closes_previous_file(self, tmp_path):
+        """Test reconfiguring closes the old file and redirects writes."""
+        sink = _SwappableSink()
+        sink.open(tmp_path / "first.log")
+        first = sink._file
+        sink.write(b"one\n")
+
+        sink.open(tmp_path / "second.log")
+        sink.write(b"two\n")
+        sink.close()
+
+        assert first.closed
+        assert (tmp_path / "first.log").read_bytes() == b"one\n"
+        assert (tmp_path / "second.log").read_bytes() == b"two\n"
+
+    def test_per_event_flush_keeps_buffering(self, tmp_path):
+        """Test structlog's per-event flush leaves events in the buffer until sync()."""
+        log_file = tmp_path / "app.log"
+        sink = _SwappableSink()
+        sink.open(log_file)
+
+        for _ in range(100):
+            sink.write(b"event\n")
+            sink.flush()
+        assert log_file.read_bytes() == b""
+
+        sink.sync()
+        assert log_file.read_bytes() == b"event\n" * 100
+        sink.close()
+
+    def test_buffer_flushed_on_timer(self, tmp_path):
+        """Test buffered events reach the file without an explicit sync."""
+
+        class FastFlushSink(_SwappableSink):
+            FLUSH_INTERVAL = 0.01
+
+        log_file = tmp_path / "app.log"
+        sink = FastFlushSink()
+        sink.open(log_file)
+        sink.write(b"event\n")
+
+        for _ in range(200):
+            if log_file.read_bytes():
+                break
+            time.sleep(0.01)
+
+        assert log_file.read_bytes() == b"event\n"
+        sink.close()
+
+
+class TestAuditLogger:
+    """Test cases for AuditLogger."""
+
+    def test_events_written_as_json_lines(self, tmp_path):
+        """Test queued events are flushed to the audit file."""
+        audit_file = tmp_path / "audit.log"
+        audit_logger = AuditLogger(audit_file=audit_file)
+
+        audit_logger.log_model_load("test-model", "cpu")
+        audit_logger.log_anomaly_detection(anomaly_count=2, severity="high", source="test")
+        audit_logger.flush()
+
+        records = [json.loads(line) for line in audit_file.read_text().splitlines()]
+        assert [r["event"] for r in records] == ["model_load", "anomaly_detection"]
+        assert records[0]["extra"] == {"model": "test-model", "device": "cpu"}
+        assert records[1]["level"] == "WARNING"
+
+        audit_logger.close()
+
+    def test_close_drains_queue(self, tmp_path):
+        """Test closing the logger writes pending events and stops the writer."""
+        audit_file = tmp_path / "audit.log"
+        audit_logger = AuditLogger(audit_file=audit_file)
+
+        for i in range(10):
+            audit_logger.log_event("event", index=i)
+        audit_logger.close()
+
+        assert len(audit_file.read_text().splitlines()) == 10
+        assert audit_logger.dropped == 0
+
+    def test_idle_writer_flushes_buffer(self, tmp_path):
+        """Test buffered events reach disk once the queue goes idle."""
+
+        class FastFlushAuditLogger(AuditLogger):
+            FLUSH_INTERVAL = 0.01
+
+        audit_file = tmp_path / "audit.log"
+        audit_logger = FastFlushAuditLogger(audit_file=audit_file)
+
+        audit_logger.log_event("event")
+        for _ in range(200):
+            if audit_file.exists() and audit_file.read_bytes():
+                break
+            time.sleep(0.01)
+
+        assert json.loads(audit_file.read_text())["event"] == "event"
+        audit_logger.close()
+
+    @pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+    def test_flush_returns_when_writer_dies(self, tmp_path, monkeypatch):
+        """Test flush() and close() do not hang after the writer fails."""
+
+        class FastFlushAuditLogger(AuditLogger):
+            FLUSH_INTERVAL = 0.01
+
+        def fail(obj):
+            # Fail only once flush() has queued its event behind this record
+            for _ in range(500):
+                if not audit_logger._queue.empty():
+                    break
+                time.sleep(0.01)
+            raise OSError("disk full")
+
+        monkeypatch.setattr("loggem.core.logging._dumps_bytes", fail)
+        audit_logger = FastFlushAuditLogger(audit_file=tmp_path / "audit.log")
+        audit_logger.log_event("event")
+
+        caller = threading.Thread(
+            target=lambda: (audit_logger.flush(), audit_logger.close()), daemon=True
+        )
+        caller.start()
+        caller.join(timeout=5)
+
+        assert not caller.is_alive()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -4,24 +4,34 @@ Comprehensive test suite for ModelManager.
 Tests model manager initialization and provider integration.
 """
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 import pytest
 
 from loggem.core.config import reset_settings
-from loggem.detector.model_manager import ModelManager
+from loggem.detector.llm_provider import LLMProvider
+from loggem.detector.model_manager import (
+    ModelManager,
+    _response_cache_key,
+    reset_provider_cache,
+)
 
 
 class TestModelManager:
     """Test ModelManager class."""
 
     def setup_method(self):
-        """Reset settings before each test."""
+        """Reset settings and shared providers before each test."""
         reset_settings()
+        reset_provider_cache()
 
     def teardown_method(self):
-        """Reset settings after each test."""
+        """Reset settings and shared providers after each test."""
         reset_settings()
+        reset_provider_cache()
 
     def test_default_initialization(self):
         """Test initialization with default settings."""
@@ -57,6 +67,8 @@ class TestModelManager:
         assert "device" in config
         assert "quantization" in config
         assert "cache_dir" in config
+        assert config["compile"] is False
+        assert config["llm_int8_threshold"] == 0.0
 
     def test_build_provider_config_openai(self):
         """Test building config for OpenAI provider."""
@@ -65,6 +77,7 @@ class TestModelManager:
 
         assert "model" in config
         assert "api_key" in config
+        assert config["batch_api"] is False
 
     def test_build_provider_config_anthropic(self):
         """Test building config for Anthropic provider."""
@@ -132,6 +145,39 @@ class TestModelManager:
         with pytest.raises(RuntimeError, match="Failed to initialize"):
             manager.load_model()
 
+    @patch("loggem.detector.model_manager.create_provider")
+    def test_load_model_shares_provider(self, mock_create_provider):
+        """Test managers with the same config share one initialized provider."""
+        mock_provider = Mock()
+        mock_create_provider.return_value = mock_provider
+
+        first = ModelManager(provider_type="huggingface")
+        second = ModelManager(provider_type="huggingface")
+        first.load_model()
+        second.load_model()
+
+        mock_create_provider.assert_called_once()
+        mock_provider.initialize.assert_called_once()
+        assert second.provider is first.provider
+
+        first.unload_model()
+        mock_provider.cleanup.assert_not_called()
+        second.unload_model()
+        mock_provider.cleanup.assert_called_once()
+
+    @patch("loggem.detector.model_manager.create_provider")
+    def test_load_model_different_config_not_shared(self, mock_create_provider):
+        """Test managers with different configs load separate providers."""
+        mock_create_provider.side_effect = lambda *_: Mock()
+
+        first = ModelManager(provider_type="ollama", provider_config={"model": "a"})
+        second = ModelManager(provider_type="ollama", provider_config={"model": "b"})
+        first.load_model()
+        second.load_model()
+
+        assert mock_create_provider.call_count == 2
+        assert first.provider is not second.provider
+
     def test_unload_model(self):
         """Test unloading model."""
         mock_provider = Mock()
@@ -195,6 +241,89 @@ class TestModelManager:
             top_p=0.95,
         )
 
+    def test_generate_response_caches_deterministic_requests(self):
+        """Test identical temperature-0 requests are served from the cache."""
+        mock_provider = Mock()
+        mock_provider.is_initialized = True
+        mock_provider.generate.return_value = "Response"
+
+        manager = ModelManager()
+        manager.provider = mock_provider
+
+        assert manager.generate_response("test", temperature=0) == "Response"
+        assert manager.generate_response("test", temperature=0) == "Response"
+        manager.generate_response("other", temperature=0)
+
+        assert mock_provider.generate.call_count == 2
+
+    def test_generate_response_skips_cache_when_sampling(self):
+        """Test sampled requests are not cached unless asked to be."""
+        mock_provider = Mock()
+        mock_provider.is_initialized = True
+        mock_provider.generate.return_value = "Response"
+
+        manager = ModelManager()
+        manager.provider = mock_provider
+
+        manager.generate_response("test", temperature=0.7)
+        manager.generate_response("test", temperature=0.7)
+        manager.generate_response("test", temperature=0.7, cache=True)
+        manager.generate_response("test", temperature=0.7, cache=True)
+
+        assert mock_provider.generate.call_count == 3
+
+    @pytest.mark.parametrize("max_tokens", [-1, 0, 2**32, 2**70])
+    def test_response_cache_key_accepts_any_max_tokens(self, max_tokens):
+        """Test cache keys are built for token limits outside 32-bit range."""
+        key = _response_cache_key("prompt", max_tokens, 0.0, 0.9)
+
+        assert len(key) == 16
+        assert key != _response_cache_key("prompt", max_tokens + 1, 0.0, 0.9)
+
+    def test_response_cache_evicts_least_recently_used(self):
+        """Test the response cache is bounded by cache_size."""
+        mock_provider = Mock()
+        mock_provider.is_initialized = True
+        mock_provider.generate.return_value = "Response"
+
+        manager = ModelManager()
+        manager.provider = mock_provider
+        manager.cache_size = 2
+
+        for prompt in ("a", "b", "a", "c", "a", "b"):
+            manager.generate_response(prompt, temperature=0)
+
+        # "b" was evicted by "c" and generated again
+        assert [c.kwargs["prompt"] for c in mock_provider.generate.call_args_list] == [
+            "a",
+            "b",
+            "c",
+            "b",
+        ]
+
+    def test_response_cache_shared_across_threads(self):
+        """Test concurrent lookups and evictions on a small cache do not fail."""
+        mock_provider = Mock()
+        mock_provider.is_initialized = True
+        mock_provider.generate.side_effect = lambda **kwargs: kwargs["prompt"]
+
+        manager = ModelManager()
+        manager.provider = mock_provider
+        manager.cache_size = 2
+
+        def worker(offset):
+            prompts = "abcde"
+            return [
+                manager.generate_response(prompts[(i + offset) % 5], temperature=0)
+                for i in range(200)
+            ]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(worker, range(8)))
+
+        assert all(len(responses) == 200 for responses in results)
+        assert len(manager._response_cache) <= 2
+
     def test_generate_response_handles_errors(self):
         """Test generate_response handles provider errors."""
         mock_provider = Mock()
@@ -207,6 +336,177 @@ class TestModelManager:
         with pytest.raises(RuntimeError, match="Failed to generate response"):
             manager.generate_response("test")
 
+    def test_generate_responses_uses_batch(self):
+        """Test generate_responses delegates to the provider's batch API."""
+        mock_provider = Mock()
+        mock_provider.is_initialized = True
+        mock_provider.concurrent_requests = False
+        mock_provider.generate_batch.return_value = ["first", "second"]
+
+        manager = ModelManager()
+        manager.provider = mock_provider
+
+        responses = manager.generate_responses(["one", "two"], temperature=0.3)
+
+        assert responses == ["first", "second"]
+        mock_provider.generate_batch.assert_called_once_with(
+            prompts=["one", "two"],
+            max_tokens=512,
+            temperature=0.3,
+            top_p=0.9,
+        )
+        mock_provider.generate.assert_not_called()
+
+    def test_generate_responses_batches_cache_misses(self):
+        """Test cached prompts are answered without entering the batch."""
+        mock_provider = Mock()
+        mock_provider.is_initialized = True
+        mock_provider.concurrent_requests = False
+        mock_provider.generate_batch.side_effect = lambda prompts, **_kwargs: [
+            p.upper() for p in prompts
+        ]
+
+        manager = ModelManager()
+        manager.provider = mock_provider
+
+        assert manager.generate_responses(["a", "b"], cache=True) == ["A", "B"]
+        assert manager.generate_responses(["b", "c", "a"], cache=True) == ["B", "C", "A"]
+        assert mock_provider.generate_batch.call_args.kwargs["prompts"] == ["c"]
+
+    def test_generate_responses_concurrent_provider(self):
+        """Test network-bound providers get concurrent requests in prompt order."""
+
+        class SlowRemoteProvider(LLMProvider):
+            concurrent_requests = True
+
+            def initialize(self):
+                self.is_initialized = True
+
+            def generate(self, prompt, max_tokens=512, temperature=0.7, top_p=0.9, **kwargs):
+                time.sleep(0.05 if prompt == "slow" else 0)
+                return f"{prompt}:{max_tokens}:{temperature}:{top_p}:{len(kwargs)}"
+
+            def cleanup(self):
+                pass
+
+            def get_info(self):
+                return {}
+
+        manager = ModelManager()
+        manager.provider = SlowRemoteProvider({})
+        manager.provider.initialize()
+
+        responses = manager.generate_responses(["slow", "fast"], max_tokens=8, max_concurrency=2)
+
+        assert responses == ["slow:8:0.7:0.9:0", "fast:8:0.7:0.9:0"]
+
+    @patch("loggem.detector.model_manager.time.sleep")
+    def test_generate_responses_retries_rate_limits(self, mock_sleep):
+        """Test rate-limited requests are retried with growing delays."""
+
+        class RateLimitError(Exception):
+            status_code = 429
+
+        mock_provider = Mock()
+        mock_provider.is_initialized = True
+        mock_provider.concurrent_requests = True
+        mock_provider.generate.side_effect = [RateLimitError(), RateLimitError(), "ok"]
+
+        manager = ModelManager()
+        manager.provider = mock_provider
+
+        assert manager.generate_responses(["prompt"]) == ["ok"]
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1.0]
+
+    @patch("loggem.detector.model_manager.time.sleep")
+    def test_generate_responses_client_error_not_retried(self, mock_sleep):
+        """Test errors other than 429/5xx fail without retrying."""
+
+        class BadRequestError(Exception):
+            status_code = 400
+
+        mock_provider = Mock()
+        mock_provider.is_initialized = True
+        mock_provider.concurrent_requests = True
+        mock_provider.generate.side_effect = BadRequestError()
+
+        manager = ModelManager()
+        manager.provider = mock_provider
+
+        with pytest.raises(RuntimeError, match="Failed to generate response"):
+            manager.generate_responses(["prompt"])
+        mock_sleep.assert_not_called()
+
+    def test_request_pool_is_owned_by_manager(self):
+        """Test the API pool is created once, shared by calls and shut down on unload."""
+        mock_provider = Mock()
+        mock_provider.is_initialized = True
+        mock_provider.concurrent_requests = True
+        mock_provider.generate.return_value = "ok"
+
+        manager = ModelManager()
+        manager.provider = mock_provider
+
+        manager.generate_responses(["a", "b"], max_concurrency=2)
+        pool = manager._executor
+        manager.generate_responses(["c"], max_concurrency=2)
+        assert manager._executor is pool
+
+        manager.generate_responses(["d"], max_concurrency=3)
+        assert manager._executor is pool
+        assert pool._max_workers == manager.settings.max_workers
+
+        manager.unload_model()
+        assert manager._executor is None
+        assert pool._shutdown
+
+    def test_generate_responses_limits_concurrency_per_call(self):
+        """Test concurrent calls with different limits share the pool safely."""
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def generate(prompt, **kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return prompt
+
+        mock_provider = Mock()
+        mock_provider.is_initialized = True
+        mock_provider.concurrent_requests = True
+        mock_provider.generate.side_effect = generate
+
+        manager = ModelManager()
+        manager.provider = mock_provider
+
+        assert manager.generate_responses([str(i) for i in range(6)], max_concurrency=1) == [
+            str(i) for i in range(6)
+        ]
+        assert peak == 1
+
+        with ThreadPoolExecutor(max_workers=2) as callers:
+            results = list(
+                callers.map(
+                    lambda limit: manager.generate_responses(
+                        ["a", "b", "c"], max_concurrency=limit
+                    ),
+                    [1, 3],
+                )
+            )
+        assert results == [["a", "b", "c"], ["a", "b", "c"]]
+
+    def test_generate_responses_not_loaded(self):
+        """Test generate_responses raises error when not loaded."""
+        manager = ModelManager()
+
+        with pytest.raises(RuntimeError, match="Provider not initialized"):
+            manager.generate_responses(["test prompt"])
+
     def test_is_loaded_true(self):
         """Test is_loaded returns True when provider is initialized."""
         mock_provider = Mock()
@@ -6,6 +6,7 @@ from datetime import datetime
 from uuid import uuid4
 
 import pytest
+from pydantic import ValidationError
 
 from loggem.core.models import AnalysisResult, Anomaly, AnomalyType, LogEntry, Severity
 
@@ -36,6 +37,18 @@ class TestLogEntry:
         assert "\x00" not in entry.message
         assert "\x01" not in entry.message
 
+    def test_sanitize_keeps_printable_text(self):
+        """Test clean strings are only truncated and newlines/tabs survive."""
+        entry = LogEntry(
+            timestamp=datetime.now(),
+            source="test",
+            message="x" * 10001,
+            raw="line one\n\tline two",
+        )
+
+        assert entry.message == "x" * 10000
+        assert entry.raw == "line one\n\tline two"
+
     def test_validate_level(self):
         """Test log level validation."""
         entry = LogEntry(
@@ -45,6 +58,16 @@ class TestLogEntry:
         # Invalid level should default to INFO
         assert entry.level == "INFO"
 
+    def test_level_is_shared(self):
+        """Test normalized levels reuse one string object across entries."""
+        entries = [
+            LogEntry(timestamp=datetime.now(), source="test", message="m", level=level, raw="r")
+            for level in ("warning", "".join(["WARN", "ING"]))
+        ]
+
+        assert entries[0].level == "WARNING"
+        assert entries[0].level is entries[1].level
+
     def test_get_hash(self):
         """Test hash generation for deduplication."""
         entry1 = LogEntry(
@@ -57,6 +80,55 @@ class TestLogEntry:
         # Same content should produce same hash
         assert entry1.get_hash() == entry2.get_hash()
 
+    def test_get_hash_bytes(self):
+        """Test compact digest used as a deduplication key."""
+        entry1 = LogEntry(timestamp=datetime.now(), source="test", message="Message", raw="raw1")
+        entry2 = LogEntry(timestamp=entry1.timestamp, source="test", message="Other", raw="raw2")
+
+        assert len(entry1.get_hash_bytes()) == 20
+        assert entry1.get_hash_bytes().hex() == entry1.get_hash()
+        assert entry1.get_hash_bytes() != entry2.get_hash_bytes()
+
+    def test_entry_ids_are_unique_uuid4(self):
+        """Test generated entry IDs are distinct version 4 UUIDs."""
+        entries = [
+            LogEntry(timestamp=datetime.now(), source="test", message="Message", raw="raw")
+            for _ in range(100)
+        ]
+
+        assert len({entry.id for entry in entries}) == 100
+        assert all(entry.id.version == 4 for entry in entries)
+
+    def test_entry_is_immutable(self):
+        """Test entries are frozen and updated through model_copy."""
+        entry = LogEntry(timestamp=datetime.now(), source="test", message="Message", raw="raw")
+
+        with pytest.raises(ValidationError):
+            entry.level = "ERROR"
+
+        updated = entry.model_copy(update={"host": "server1"})
+        assert updated.host == "server1"
+        assert entry.host is None
+
+
+class TestSeverity:
+    """Test cases for Severity ordering."""
+
+    def test_severity_ordering(self):
+        """Test severities compare by rank, not by string value."""
+        assert Severity.LOW < Severity.MEDIUM < Severity.HIGH < Severity.CRITICAL
+        assert Severity.HIGH <= Severity.HIGH
+        assert not Severity.CRITICAL < Severity.MEDIUM
+        assert Severity.MEDIUM > Severity.LOW
+        assert Severity.CRITICAL >= Severity.HIGH
+        assert max([Severity.MEDIUM, Severity.CRITICAL, Severity.LOW]) == Severity.CRITICAL
+        assert sorted([Severity.HIGH, Severity.LOW, Severity.CRITICAL, Severity.MEDIUM]) == [
+            Severity.LOW,
+            Severity.MEDIUM,
+            Severity.HIGH,
+            Severity.CRITICAL,
+        ]
+
 
 class TestAnomaly:
     """Test cases for Anomaly model."""
@@ -147,6 +219,28 @@ class TestAnalysisResult:
         assert len(critical) == 1
         assert critical[0].severity == Severity.CRITICAL
 
+    def test_to_dict_is_json_serializable(self):
+        """Test nested serialization emits plain JSON types."""
+        entry = LogEntry(
+            timestamp=datetime(2024, 1, 1, 12, 0, 0), source="test", message="Test", raw="raw"
+        )
+        anomaly = Anomaly(
+            log_entry_id=entry.id,
+            severity=Severity.HIGH,
+            anomaly_type=AnomalyType.BRUTE_FORCE,
+            description="High severity",
+            confidence=0.9,
+        )
+        result = AnalysisResult(total_entries=1, anomalies=[anomaly], duration=1.0)
+
+        data = result.to_dict()
+
+        assert data["anomalies"][0]["id"] == str(anomaly.id)
+        assert data["anomalies"][0]["log_entry_id"] == str(entry.id)
+        assert data["anomalies"][0]["severity"] == "high"
+        assert data["anomalies"][0]["anomaly_type"] == "brute_force"
+        assert entry.to_dict()["timestamp"] == "2024-01-01T12:00:00"
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,15 +1,104 @@
 """
-Unit tests for syslog parser.
+Unit tests for log parsers.
 """
 
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
 import pytest
 
+import loggem.parsers
+from loggem.parsers.apache import ApacheLogParser, _parse_access_time, _tokenize_clf
+from loggem.parsers.auth import AuthLogParser
+from loggem.parsers.base import _parse_clf_time, _parse_ymd_time, _strptime
+from loggem.parsers.docker import DockerParser
+from loggem.parsers.factory import LogParserFactory
+from loggem.parsers.haproxy import HAProxyParser
+from loggem.parsers.json_parser import JSONParser
+from loggem.parsers.kubernetes import KubernetesParser
+from loggem.parsers.mysql import MySQLParser
+from loggem.parsers.nginx import NginxParser
+from loggem.parsers.postgresql import PostgreSQLParser
+from loggem.parsers.redis import RedisParser
 from loggem.parsers.syslog import SyslogParser
 
+COMBINED_LINE = (
+    '127.0.0.1 - frank [10/Oct/2000:13:55:36 -0700] "GET /apache_pb.gif HTTP/1.0" 200 2326 '
+    '"http://www.example.com/start.html" "Mozilla/4.08"'
+)
+
+
+class LineNumberParser(ApacheLogParser):
+    """Apache parser recording line numbers, importable by worker processes."""
+
+    __slots__ = ()
+
+    def parse_line(self, line, line_number=0):
+        entry = super().parse_line(line, line_number)
+        if entry:
+            entry.metadata["line_number"] = line_number
+        return entry
+
+
+class SyncPool:
+    """Process pool stand-in running tasks as they are submitted."""
+
+    def __init__(self):
+        self.submitted = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+    def apply_async(self, func, args):
+        self.submitted += 1
+        result = func(*args)
+        return SimpleNamespace(get=lambda: result)
+
+
+class TestParsersPackage:
+    """Test cases for the lazily populated parsers package."""
+
+    def test_exports_resolve(self):
+        """Test every exported name resolves to the class in its module."""
+        for name in loggem.parsers.__all__:
+            assert getattr(loggem.parsers, name).__name__ == name
+
+        assert loggem.parsers.SyslogParser is SyslogParser
+
+    def test_unknown_attribute(self):
+        """Test unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            loggem.parsers.NoSuchParser  # noqa: B018
+
 
 class TestSyslogParser:
     """Test cases for SyslogParser."""
 
+    def test_parse_timestamp_without_year(self):
+        """Test year-less timestamps take the current year."""
+        parser = SyslogParser()
+        parsed = parser._parse_timestamp("Oct  5 10:15:30", ["%b %d %H:%M:%S"])
+
+        assert parsed == datetime(datetime.now().year, 10, 5, 10, 15, 30)
+
+    def test_parse_timestamp_utc_suffix(self):
+        """Test a literal Z suffix produces a UTC-aware timestamp."""
+        parser = SyslogParser()
+        parsed = parser._parse_timestamp("2023-10-05T10:15:30Z", ["%Y-%m-%dT%H:%M:%SZ"])
+
+        assert parsed == datetime(2023, 10, 5, 10, 15, 30, tzinfo=timezone.utc)
+
+    def test_parse_timestamp_falls_back_to_dateutil(self):
+        """Test strings matching no format are handled by dateutil."""
+        parser = SyslogParser()
+        parsed = parser._parse_timestamp("5 October 2023 10:15", ["%Y-%m-%d"])
+
+        assert parsed == datetime(2023, 10, 5, 10, 15)
+
     def test_parse_rfc3164_basic(self):
         """Test parsing basic RFC 3164 format."""
         parser = SyslogParser(source_name="test")
@@ -35,6 +124,18 @@ class TestSyslogParser:
         assert entry.metadata["facility"] == "auth"
         assert entry.metadata["severity"] == "CRITICAL"
 
+    @pytest.mark.parametrize(
+        ("priority", "facility", "severity"),
+        [(100, "unknown(12)", "WARNING"), (191, "local7", "DEBUG"), (999, "unknown(124)", "DEBUG")],
+    )
+    def test_priority_names(self, priority, facility, severity):
+        """Test priorities decode to facility and severity names, unnamed ones included."""
+        entry = SyslogParser().parse_line(f"<{priority}>Oct  5 10:15:30 host app: x")
+
+        assert entry is not None
+        assert entry.metadata["facility"] == facility
+        assert entry.metadata["severity"] == severity
+
     def test_parse_rfc5424_basic(self):
         """Test parsing RFC 5424 format."""
         parser = SyslogParser(source_name="test")
@@ -49,6 +150,23 @@ class TestSyslogParser:
         assert entry.metadata["version"] == "1"
         assert entry.metadata["msgid"] == "ID47"
 
+    @pytest.mark.parametrize(
+        ("timestamp", "expected"),
+        [
+            ("2023-10-05T10:15:30Z", datetime(2023, 10, 5, 10, 15, 30, tzinfo=timezone.utc)),
+            (
+                "2023-10-05T10:15:30.5+02:00",
+                datetime(2023, 10, 5, 10, 15, 30, 500000, tzinfo=timezone(timedelta(hours=2))),
+            ),
+        ],
+    )
+    def test_rfc5424_timestamp_shapes(self, timestamp, expected):
+        """Test RFC 5424 timestamps with and without fractions or offsets."""
+        entry = SyslogParser().parse_line(f"<34>1 {timestamp} hostname app - - - Test")
+
+        assert entry is not None
+        assert entry.timestamp == expected
+
     def test_parse_empty_line(self):
         """Test parsing empty line."""
         parser = SyslogParser(source_name="test")
@@ -71,5 +189,823 @@ class TestSyslogParser:
         assert entry.message == line
 
 
+class TestApacheLogParser:
+    """Test cases for ApacheLogParser."""
+
+    def test_tokenize_combined(self):
+        """Test the tokenizer splits every Combined Log Format field."""
+        assert _tokenize_clf(COMBINED_LINE) == (
+            "127.0.0.1",
+            "-",
+            "frank",
+            "10/Oct/2000:13:55:36 -0700",
+            "GET",
+            "/apache_pb.gif",
+            "HTTP/1.0",
+            "200",
+            "2326",
+            "http://www.example.com/start.html",
+            "Mozilla/4.08",
+        )
+
+    def test_tokenize_rejects_malformed_lines(self):
+        """Test the tokenizer returns None for lines that are not CLF."""
+        assert _tokenize_clf("not an access log line") is None
+        assert _tokenize_clf('1.2.3.4 - - [10/Oct/2000:13:55:36 -0700] "GET /" abc 1') is None
+
+    @pytest.mark.parametrize(
+        "status, size",
+        [("\u00b2\u2070\u2070", "1"), ("\u0662\u0660\u0660", "1"), ("200", "\u00b9\u00b2")],
+    )
+    def test_tokenize_rejects_non_ascii_digits(self, status, size):
+        """Test the tokenizer leaves non-ASCII digits to the regex fallback."""
+        line = f'1.2.3.4 - - [10/Oct/2000:13:55:36 -0700] "GET /" {status} {size}'
+        assert _tokenize_clf(line) is None
+
+    def test_clf_time_rejects_non_ascii_offset(self):
+        """Test a UTC offset with superscript digits is malformed, not an error."""
+        assert _parse_clf_time("10/Oct/2000:13:55:36 +\u00b2000") is None
+        assert _parse_clf_time("10/Oct/2000:13:55:36 +0200").utcoffset().total_seconds() == 7200
+
+    def test_parse_superscript_status(self):
+        """Test superscript digits are rejected instead of failing in int()."""
+        line = '1.2.3.4 - - [10/Oct/2000:13:55:36 -0700] "GET /" \u00b2\u2070\u2070 1'
+        assert ApacheLogParser().parse_line(line) is None
+
+    def test_parse_combined(self):
+        """Test parsing a Combined Log Format line."""
+        entry = ApacheLogParser().parse_line(COMBINED_LINE)
+
+        assert entry is not None
+        assert entry.source == "127.0.0.1"
+        assert entry.timestamp.year == 2000
+        assert entry.metadata["path"] == "/apache_pb.gif"
+        assert entry.metadata["user_agent"] == "Mozilla/4.08"
+        assert entry.message.endswith(
+            "(user: frank) | Referer: http://www.example.com/start.html | UA: Mozilla/4.08"
+        )
+
+    def test_parse_malformed_request_line(self):
+        """Test request lines without path or protocol are still parsed."""
+        entry = ApacheLogParser().parse_line('10.0.0.1 - - [10/Oct/2000:13:55:36 -0700] "-" 400 0')
+
+        assert entry is not None
+        assert entry.metadata["method"] == "-"
+        assert entry.metadata["path"] == ""
+        assert entry.metadata["protocol"] == ""
+
+    def test_parse_common_server_error(self):
+        """Test parsing a Common Log Format line without a response body."""
+        entry = ApacheLogParser().parse_line(
+            '10.0.0.1 - - [10/Oct/2000:13:55:36 -0700] "POST /x HTTP/1.1" 503 -'
+        )
+
+        assert entry is not None
+        assert entry.level == "ERROR"
+        assert entry.metadata["size"] == "-"
+        assert entry.metadata["referer"] is None
+
+    @pytest.mark.parametrize(
+        ("token", "apache_level", "level"),
+        [("crit", "crit", "CRITICAL"), ("WARN", "warn", "WARNING"), ("trace1", "trace1", "INFO")],
+    )
+    def test_parse_error_log_levels(self, token, apache_level, level):
+        """Test error log levels map to entry levels in either case."""
+        entry = ApacheLogParser(log_type="error").parse_line(
+            f"[Mon Oct 10 13:55:36.123 2000] [{token}] [client 10.0.0.1] File does not exist"
+        )
+
+        assert entry is not None
+        assert entry.metadata["apache_level"] == apache_level
+        assert entry.level == level
+
+    def test_parse_error_log_without_client(self):
+        """Test error lines without a client field are attributed to "unknown"."""
+        entry = ApacheLogParser(log_type="error").parse_line(
+            "[Mon Oct 10 13:55:36.123 2000] [notice] Apache configured -- resuming normal operations"
+        )
+
+        assert entry is not None
+        assert entry.source == "unknown"
+        assert entry.message == "Apache configured -- resuming normal operations"
+        assert entry.timestamp == datetime(2000, 10, 10, 13, 55, 36)
+
+    def test_repeated_timestamps_are_memoized(self):
+        """Test lines sharing a timestamp reuse the parsed value."""
+        _parse_access_time.cache_clear()
+        parser = ApacheLogParser()
+
+        first = parser.parse_line(COMBINED_LINE)
+        second = parser.parse_line(COMBINED_LINE)
+
+        assert first.timestamp == second.timestamp
+        assert _parse_access_time.cache_info().hits == 1
+
+    def test_parse_file_streams_entries(self, tmp_path):
+        """Test parse_file yields entries lazily and skips blank lines."""
+        log_file = tmp_path / "access.log"
+        log_file.write_text(f"{COMBINED_LINE}\n\n{COMBINED_LINE}\n")
+
+        entries = ApacheLogParser().parse_file(log_file)
+
+        assert not isinstance(entries, list)
+        assert [entry.metadata["status"] for entry in entries] == [200, 200]
+
+    def test_parse_file_parallel_matches_serial(self, tmp_path, monkeypatch):
+        """Test parsing across processes yields the serial entries in file order."""
+        log_file = tmp_path / "access.log"
+        lines = [COMBINED_LINE.replace("2326", str(i)) for i in range(200)]
+        log_file.write_text("\n".join(lines[:50] + [""] + lines[50:]))
+
+        monkeypatch.setattr(ApacheLogParser, "PARALLEL_CHUNK_SIZE", 4096)
+        parser = ApacheLogParser()
+        serial = list(parser.parse_file(log_file))
+        parallel = list(parser._parse_file_parallel(log_file, log_file.stat().st_size, workers=2))
+
+        assert len(parallel) == 200
+        assert [e.metadata["size"] for e in parallel] == [e.metadata["size"] for e in serial]
+
+    def test_parse_file_parallel_numbers_lines_like_serial(self, tmp_path, monkeypatch):
+        """Test chunk line numbers count bare carriage returns as the decoder does."""
+        log_file = tmp_path / "access.log"
+        separators = ["\n", "\r", "\r\n"]
+        log_file.write_bytes(
+            "".join(f"{COMBINED_LINE}{separators[i % 3]}" for i in range(200)).encode()
+        )
+
+        monkeypatch.setattr(LineNumberParser, "PARALLEL_CHUNK_SIZE", 4096)
+        parser = LineNumberParser()
+        serial = list(parser._parse_file_serial(log_file))
+        parallel = list(parser._parse_file_parallel(log_file, log_file.stat().st_size, workers=2))
+
+        assert [e.metadata["line_number"] for e in serial] == list(range(1, 201))
+        assert [e.metadata["line_number"] for e in parallel] == list(range(1, 201))
+
+    def test_parse_file_parallel_bounds_chunks_in_flight(self, tmp_path, monkeypatch):
+        """Test chunks are submitted only a bounded distance ahead of the consumer."""
+        log_file = tmp_path / "access.log"
+        log_file.write_text(f"{COMBINED_LINE}\n" * 500)
+
+        pool = SyncPool()
+        monkeypatch.setattr(ApacheLogParser, "PARALLEL_CHUNK_SIZE", 1024)
+        monkeypatch.setattr(ApacheLogParser, "_start_pool", lambda *_: pool)
+        entries = ApacheLogParser()._parse_file_parallel(log_file, log_file.stat().st_size, 2)
+
+        next(entries)
+        assert pool.submitted == 2 * ApacheLogParser.PARALLEL_CHUNKS_AHEAD
+        assert len(list(entries)) == 499
+
+    def test_parse_file_parallel_falls_back_to_serial(self, tmp_path, monkeypatch):
+        """Test parsing continues in-process when worker processes cannot start."""
+        log_file = tmp_path / "access.log"
+        log_file.write_text(f"{COMBINED_LINE}\n" * 3)
+
+        def no_pool(workers):
+            raise OSError("process limit reached")
+
+        monkeypatch.setattr(
+            "loggem.parsers.base.multiprocessing.get_context", lambda: SimpleNamespace(Pool=no_pool)
+        )
+        parser = ApacheLogParser()
+
+        assert parser._start_pool(2) is None
+        assert len(list(parser._parse_file_parallel(log_file, log_file.stat().st_size, 2))) == 3
+
+    def test_unpicklable_parser_parses_serially(self, monkeypatch):
+        """Test no worker processes are started for a parser that cannot be pickled."""
+
+        def unpicklable(self):
+            raise TypeError("cannot pickle parser")
+
+        monkeypatch.setattr(ApacheLogParser, "__getstate__", unpicklable)
+
+        assert ApacheLogParser()._start_pool(2) is None
+
+    @pytest.mark.parametrize("log_type", ["access", "error"])
+    def test_rejects_lines_without_delimiters(self, log_type):
+        """Test lines that cannot match the built-in formats are skipped."""
+        assert (
+            ApacheLogParser(log_type=log_type).parse_line("Traceback (most recent call last):")
+            is None
+        )
+
+    def test_parse_irregular_spacing_uses_regex(self):
+        """Test lines the tokenizer rejects still parse through the regex."""
+        entry = ApacheLogParser().parse_line(COMBINED_LINE.replace(" - ", "  -  ", 1))
+
+        assert entry is not None
+        assert entry.metadata["status"] == 200
+
+
+class TestAuthLogParser:
+    """Test cases for AuthLogParser."""
+
+    @pytest.mark.parametrize(
+        ("message", "event_type", "user", "ip", "level"),
+        [
+            (
+                "Failed password for invalid user admin from 10.0.0.5 port 22 ssh2",
+                "failed_password",
+                "admin",
+                "10.0.0.5",
+                "WARNING",
+            ),
+            (
+                "Accepted publickey for alice from 10.0.0.6 port 50022 ssh2",
+                "accepted_publickey",
+                "alice",
+                "10.0.0.6",
+                "INFO",
+            ),
+            ("Invalid user test from 10.0.0.7", "invalid_user", "test", "10.0.0.7", "WARNING"),
+            (
+                "Connection closed by authenticating user bob 10.0.0.8 port 41000 [preauth]",
+                "connection_closed",
+                "bob",
+                "10.0.0.8",
+                "INFO",
+            ),
+        ],
+    )
+    def test_parse_ssh_events(self, message, event_type, user, ip, level):
+        """Test each SSH event is classified with its captured fields."""
+        entry = AuthLogParser().parse_line(f"Oct  5 10:15:30 bastion sshd[4242]: {message}")
+
+        assert entry is not None
+        assert entry.metadata["event_type"] == event_type
+        assert entry.metadata["pid"] == "4242"
+        assert entry.user == user
+        assert entry.host == ip
+        assert entry.level == level
+
+    @pytest.mark.parametrize(
+        ("process", "service"), [("sshd", "ssh"), ("SSHD", "ssh"), ("/usr/bin/sudo", "sudo")]
+    )
+    def test_process_names_select_event_family(self, process, service):
+        """Test SSH and sudo processes are recognized regardless of case or path."""
+        entry = AuthLogParser().parse_line(f"Oct  5 10:15:30 bastion {process}: hello")
+
+        assert entry is not None
+        assert entry.metadata["service"] == service
+
+    @pytest.mark.parametrize(
+        ("timestamp", "expected"),
+        [
+            ("Oct  5 10:15:30", (10, 5, 10, 15, 30)),
+            ("Jan 15 07:03:09", (1, 15, 7, 3, 9)),
+            ("oct 5 1:2:3", (10, 5, 1, 2, 3)),
+        ],
+    )
+    def test_parse_timestamps(self, timestamp, expected):
+        """Test auth timestamps parse into the current year."""
+        entry = AuthLogParser().parse_line(f"{timestamp} bastion cron[1]: session opened")
+
+        assert entry is not None
+        assert entry.timestamp == datetime(datetime.now().year, *expected)
+
+    def test_parse_sudo_failure(self):
+        """Test sudo password failures are reported as errors."""
+        line = (
+            "Oct  5 10:15:30 bastion sudo: bob : 3 incorrect password attempts ; "
+            "TTY=pts/0 ; PWD=/home/bob ; USER=root ; COMMAND=/bin/ls"
+        )
+        entry = AuthLogParser().parse_line(line)
+
+        assert entry is not None
+        assert entry.metadata["event_type"] == "sudo_failed"
+        assert entry.metadata["failure_count"] == "3"
+        assert entry.user == "bob"
+        assert entry.level == "ERROR"
+
+    @pytest.mark.parametrize(
+        ("text", "ip"),
+        [
+            ("authentication failure; logname= uid=0 rhost=203.0.113.9 user=bob", "203.0.113.9"),
+            ("refused connect from 198.51.100.7 (host)", "198.51.100.7"),
+            ("peer 192.0.2.1 closed, reconnect from 198.51.100.7", "192.0.2.1"),
+            ("connection from 198.51.100.7:2222 lost", "198.51.100.7"),
+            ("no address here", None),
+        ],
+    )
+    def test_extract_ip(self, text, ip):
+        """Test the first IPv4 address is extracted, with or without a marker."""
+        assert AuthLogParser()._extract_ip(text) == ip
+
+    @pytest.mark.parametrize(
+        ("text", "user"),
+        [
+            ("pam_unix(cron:session): session opened for user root by (uid=0)", "root"),
+            ("authentication failure; user=alice", "alice"),
+            ("FAILED su for bob by carol", "bob"),
+            ("nothing relevant", None),
+        ],
+    )
+    def test_extract_user(self, text, user):
+        """Test user extraction keeps the precedence of the user patterns."""
+        assert AuthLogParser()._extract_user(text) == user
+
+    def test_parse_unmatched_ssh_message(self):
+        """Test SSH messages without a known event keep only the service."""
+        entry = AuthLogParser().parse_line("Oct  5 10:15:30 bastion sshd[1]: Server listening")
+
+        assert entry is not None
+        assert entry.metadata == {"service": "ssh", "pid": "1"}
+        assert entry.host == "bastion"
+
+
+class TestDockerParser:
+    """Test cases for DockerParser."""
+
+    def test_parse_json_with_escapes(self):
+        """Test JSON log records are decoded, including escaped quotes."""
+        line = r'{"log":"say \"hi\"\n","stream":"stderr","time":"2024-01-15T10:30:45.123456789Z"}'
+        entry = DockerParser().parse_line(line)
+
+        assert entry is not None
+        assert entry.message == 'say "hi"'
+        assert entry.level == "ERROR"
+        assert entry.timestamp == datetime(2024, 1, 15, 10, 30, 45, 123456)
+
+    def test_parse_invalid_json_falls_back_to_plain(self):
+        """Test malformed JSON is kept as a plain log line."""
+        entry = DockerParser().parse_line('{"log": unterminated')
+
+        assert entry is not None
+        assert entry.message == '{"log": unterminated'
+        assert entry.metadata == {}
+
+    @pytest.mark.parametrize(
+        ("line", "metadata"),
+        [
+            ("web-1  | GET /health 200", {"container": "web-1"}),
+            (
+                "2024-01-15T10:30:45.123456789Z 0123456789ab started",
+                {"container_id": "0123456789ab"},
+            ),
+            ("Listening on port 8080", {}),
+        ],
+    )
+    def test_parse_text_formats(self, line, metadata):
+        """Test compose, CLI and plain lines each land in their own format."""
+        entry = DockerParser().parse_line(line)
+
+        assert entry is not None
+        assert entry.metadata == metadata
+
+    def test_batch_reuses_clock_reading(self):
+        """Test entries without timestamps in one batch share a clock reading."""
+        parser = DockerParser()
+        entries = parser.parse_lines(["web | started", "db | ready"])
+
+        assert entries[0].timestamp == entries[1].timestamp
+        assert parser._batch_now is None
+
+
+class TestJSONParser:
+    """Test cases for JSONParser."""
+
+    def test_parse_record(self):
+        """Test common fields are extracted and the rest kept as metadata."""
+        entry = JSONParser().parse_line(
+            '{"ts": "2024-01-15T10:30:45.123456Z", "msg": "login failed", "level": "warn", '
+            '"host": "web-1", "user": "bob", "service": "auth", "attempt": 3}'
+        )
+
+        assert entry is not None
+        assert entry.timestamp == datetime(2024, 1, 15, 10, 30, 45, 123456, tzinfo=timezone.utc)
+        assert entry.message == "login failed"
+        assert entry.level == "WARNING"
+        assert (entry.host, entry.user, entry.process) == ("web-1", "bob", "auth")
+        assert entry.metadata["attempt"] == 3
+        assert "msg" not in entry.metadata
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (
+                '"2024-01-15T10:30:45+02:00"',
+                datetime(2024, 1, 15, 8, 30, 45, tzinfo=timezone.utc),
+            ),
+            ('"2024-01-15 10:30:45"', datetime(2024, 1, 15, 10, 30, 45)),
+            ('"2024/01/15 10:30:45"', datetime(2024, 1, 15, 10, 30, 45)),
+        ],
+    )
+    def test_parse_timestamp_formats(self, value, expected):
+        """Test ISO 8601 and the other supported string timestamps are parsed."""
+        entry = JSONParser().parse_line(f'{{"time": {value}, "message": "m"}}')
+
+        assert entry is not None
+        assert entry.timestamp == expected
+
+    def test_parse_non_finite_numbers(self):
+        """Test NaN, which only the standard library decoder accepts, still parses."""
+        entry = JSONParser().parse_line('{"message": "gauge", "value": NaN}')
+
+        assert entry is not None
+        assert entry.message == "gauge"
+
+    @pytest.mark.parametrize("line", ['{"message": ', "[1, 2]"])
+    def test_rejects_invalid_records(self, line):
+        """Test malformed JSON and non-object documents are skipped."""
+        assert JSONParser().parse_line(line) is None
+
+
+HAPROXY_PREFIX = "Jan 15 10:30:45 lb haproxy[1234]: 10.0.0.1:56789 [15/Jan/2024:10:30:45.123] "
+
+
+class TestHAProxyParser:
+    """Test cases for HAProxyParser."""
+
+    def test_parse_http(self):
+        """Test HTTP log lines capture timers, status and request."""
+        entry = HAProxyParser().parse_line(
+            HAPROXY_PREFIX + "web~ app/srv1 10/0/30/69/109 503 2750 - - ---- 1/1/0/0/0 0/0 "
+            '"GET /index.html HTTP/1.1"'
+        )
+
+        assert entry is not None
+        assert entry.level == "ERROR"
+        assert entry.message == "GET /index.html HTTP/1.1 -> 503"
+        assert entry.metadata["log_type"] == "http"
+        assert entry.metadata["timers"] == {"tq": 10, "tw": 0, "tc": 30, "tr": 69, "tt": 109}
+        assert entry.timestamp == datetime(datetime.now().year, 1, 15, 10, 30, 45)
+
+    def test_parse_tcp(self):
+        """Test TCP log lines are recognized after the HTTP format misses."""
+        entry = HAProxyParser().parse_line(
+            HAPROXY_PREFIX + "db-in db/pg1 0/0/5012 212 -- 0/0/0/0/0 0/0"
+        )
+
+        assert entry is not None
+        assert entry.message == "TCP connection: 10.0.0.1 -> db/pg1"
+        assert entry.metadata["bytes_read"] == 212
+        assert entry.metadata["log_type"] == "tcp"
+
+    def test_unrecognized_line(self):
+        """Test lines in neither format are skipped."""
+        assert HAProxyParser().parse_line("Proxy web started.") is None
+
+
+class TestKubernetesParser:
+    """Test cases for KubernetesParser."""
+
+    @pytest.mark.parametrize(
+        ("line", "log_type", "level", "message"),
+        [
+            (
+                "2024-01-15T10:30:45.123Z INFO Starting application",
+                "application",
+                "INFO",
+                "Starting application",
+            ),
+            (
+                "5m Warning BackOff pod/web-1 Back-off restarting failed container",
+                "event",
+                "WARNING",
+                "Back-off restarting failed container",
+            ),
+            (
+                "2024-01-15T10:30:45.123456789Z stderr F panic: boom",
+                "container",
+                "ERROR",
+                "panic: boom",
+            ),
+        ],
+    )
+    def test_parse_formats(self, line, log_type, level, message):
+        """Test each Kubernetes format is told apart and parsed."""
+        entry = KubernetesParser().parse_line(line)
+
+        assert entry is not None
+        assert entry.metadata["log_type"] == log_type
+        assert entry.level == level
+        assert entry.message == message
+
+    @pytest.mark.parametrize(
+        ("timestamp", "expected"),
+        [
+            ("2024-01-15T10:30:45.123Z", datetime(2024, 1, 15, 10, 30, 45, 123000)),
+            ("2024-01-15T10:30:45Z", datetime(2024, 1, 15, 10, 30, 45)),
+        ],
+    )
+    def test_parse_kubectl_timestamps(self, timestamp, expected):
+        """Test kubectl timestamps parse with or without a fraction."""
+        entry = KubernetesParser().parse_line(f"{timestamp} INFO ready")
+
+        assert entry is not None
+        assert entry.timestamp == expected
+
+    def test_events_share_batch_time(self):
+        """Test events, which carry no timestamp, take the batch clock reading."""
+        entries = KubernetesParser().parse_lines(
+            ["5m Warning BackOff pod/web-1 Back-off", "2m Normal Pulled pod/web-1 Pulled"]
+        )
+
+        assert len(entries) == 2
+        assert entries[0].timestamp == entries[1].timestamp
+
+    def test_formats_are_anchored(self):
+        """Test a format appearing mid-line is not mistaken for the line's format."""
+        assert KubernetesParser().parse_line("retrying in 5m Warning BackOff pod/web-1 x") is None
+
+
+class TestMySQLParser:
+    """Test cases for MySQLParser."""
+
+    def test_fields_are_ascii(self):
+        """Test digit classes match ASCII digits only."""
+        assert MySQLParser().parse_line("２０２４-01-15T10:30:45.123456Z 1 [ERROR] x") is None
+
+    def test_repeated_timestamps_are_memoized(self):
+        """Test legacy lines sharing a timestamp reuse the shared strptime cache."""
+        _strptime.cache_clear()
+        parser = MySQLParser()
+
+        first = parser.parse_line("240115 10:30:45 [Note] a")
+        second = parser.parse_line("240115 10:30:45 [Note] b")
+
+        assert first.timestamp == second.timestamp == datetime(2024, 1, 15, 10, 30, 45)
+        assert _strptime.cache_info().hits == 1
+
+    @pytest.mark.parametrize(
+        ("line", "timestamp", "level", "metadata"),
+        [
+            (
+                "2024-01-15T10:30:45.123456Z 12 [ERROR] Access denied for user 'root'@'localhost'",
+                datetime(2024, 1, 15, 10, 30, 45, 123456),
+                "ERROR",
+                {"thread_id": "12"},
+            ),
+            (
+                "240115 10:30:45 [Warning] Aborted connection",
+                datetime(2024, 1, 15, 10, 30, 45),
+                "WARNING",
+                {},
+            ),
+            (
+                "# Time: 2024-01-15T10:30:45.123456Z",
+                datetime(2024, 1, 15, 10, 30, 45, 123456),
+                "WARNING",
+                {"type": "slow_query"},
+            ),
+        ],
+    )
+    def test_parse_formats(self, line, timestamp, level, metadata):
+        """Test standard, legacy and slow query lines are parsed."""
+        entry = MySQLParser().parse_line(line)
+
+        assert entry is not None
+        assert entry.timestamp == timestamp
+        assert entry.level == level
+        assert entry.metadata == metadata
+
+
+class TestNginxParser:
+    """Test cases for NginxParser."""
+
+    def test_parse_access_log(self):
+        """Test combined access log lines are parsed."""
+        entry = NginxParser().parse_line(COMBINED_LINE)
+
+        assert entry is not None
+        assert entry.host == "127.0.0.1"
+        assert entry.message == "GET /apache_pb.gif HTTP/1.0 - 200"
+        assert entry.metadata["body_bytes_sent"] == 2326
+        assert entry.timestamp == datetime(
+            2000, 10, 10, 13, 55, 36, tzinfo=timezone(timedelta(hours=-7))
+        )
+
+    def test_parse_error_log(self):
+        """Test error log lines are parsed with a normalized level."""
+        entry = NginxParser().parse_line(
+            "2023/10/05 10:15:30 [crit] 1234#0: *5 open() failed, client: 10.0.0.1"
+        )
+
+        assert entry is not None
+        assert entry.timestamp == datetime(2023, 10, 5, 10, 15, 30)
+        assert entry.level == "CRITICAL"
+        assert entry.metadata == {"pid": "1234", "tid": "0", "connection_id": "5"}
+
+    def test_parse_error_log_with_quotes(self):
+        """Test error lines quoting a path are not mistaken for access lines."""
+        entry = NginxParser().parse_line(
+            '2023/10/05 10:15:30 [error] 1234#0: open() "/srv/x" failed (2: No such file)'
+        )
+
+        assert entry is not None
+        assert entry.level == "ERROR"
+        assert entry.process == "nginx[1234]"
+
+    def test_fields_are_ascii(self):
+        """Test digit classes match ASCII digits only."""
+        assert NginxParser().parse_line("２０２３/10/05 10:15:30 [error] 1#0: x") is None
+
+    def test_error_log_client_address(self):
+        """Test the address after "client: " wins over earlier dotted quads."""
+        entry = NginxParser().parse_line(
+            '2023/10/05 10:15:30 [error] 1234#0: *5 open() "/srv/v1.2.3.4/x.html" failed '
+            '(2: No such file), client: 10.0.0.1, server: example.com, request: "GET / HTTP/1.1"'
+        )
+
+        assert entry is not None
+        assert entry.host == "10.0.0.1"
+
+    @pytest.mark.parametrize("line", ["plain text", '10.0.0.1 - - "GET /" 200 1'])
+    def test_rejects_other_lines(self, line):
+        """Test lines in neither format are skipped."""
+        assert NginxParser().parse_line(line) is None
+
+
+class TestPostgreSQLParser:
+    """Test cases for PostgreSQLParser."""
+
+    @pytest.mark.parametrize(
+        ("line", "level", "metadata"),
+        [
+            (
+                "2024-01-15 10:30:45.123 UTC [4242] LOG:  statement: SELECT 1",
+                "INFO",
+                {"pid": "4242", "type": "query"},
+            ),
+            (
+                "2024-01-15 10:30:45 [4242] ERROR:  relation does not exist",
+                "ERROR",
+                {"pid": "4242", "type": "error"},
+            ),
+            ("2024-01-15 10:30:45.123 UTC,postgres,db,4242,ERROR,x", "ERROR", {"type": "error"}),
+        ],
+    )
+    def test_parse_formats(self, line, level, metadata):
+        """Test stderr and CSV log lines are parsed."""
+        entry = PostgreSQLParser().parse_line(line)
+
+        assert entry is not None
+        assert entry.timestamp.replace(microsecond=0) == datetime(2024, 1, 15, 10, 30, 45)
+        assert entry.level == level
+        assert entry.metadata == metadata
+
+    def test_repeated_timestamps_are_memoized(self):
+        """Test lines sharing a timestamp reuse the parsed value."""
+        _parse_ymd_time.cache_clear()
+        parser = PostgreSQLParser()
+
+        parser.parse_line("2024-01-15 10:30:45 [1] LOG:  a")
+        parser.parse_line("2024-01-15 10:30:45 [2] LOG:  b")
+
+        assert _parse_ymd_time.cache_info().hits == 1
+
+    def test_parse_zone_names(self):
+        """Test timestamps keep their wall-clock time whatever the zone name."""
+        entry = PostgreSQLParser().parse_line("2024-01-15 10:30:45.123 CEST [1] LOG:  x")
+
+        assert entry is not None
+        assert entry.timestamp == datetime(2024, 1, 15, 10, 30, 45, 123000)
+
+    @pytest.mark.parametrize(
+        "line",
+        ["database system is ready", "retry of 2024-01-15 10:30:45 [1] LOG:  x"],
+    )
+    def test_rejects_other_lines(self, line):
+        """Test lines not starting with either format are skipped."""
+        assert PostgreSQLParser().parse_line(line) is None
+
+
+class TestRedisParser:
+    """Test cases for RedisParser."""
+
+    def test_parse_line(self):
+        """Test Redis log lines are parsed with role and event."""
+        entry = RedisParser().parse_line(
+            "1234:M 15 Jan 2024 10:30:45.123 * Ready to accept connections"
+        )
+
+        assert entry is not None
+        assert entry.timestamp == datetime(2024, 1, 15, 10, 30, 45, 123000)
+        assert entry.level == "INFO"
+        assert entry.metadata["role"] == "master"
+        assert entry.metadata["event"] == "startup"
+
+    @pytest.mark.parametrize(
+        ("message", "event", "level"),
+        [
+            ("Connecting to MASTER 10.0.0.1:6379 before starting sync", "startup", "INFO"),
+            ("Background saving started by pid 42", "persistence", "INFO"),
+            ("WARNING overcommit_memory is set to 0!", None, "WARNING"),
+        ],
+    )
+    def test_event_keywords(self, message, event, level):
+        """Test events follow keyword priority and unmatched warnings raise the level."""
+        entry = RedisParser().parse_line(f"1234:S 15 Jan 2024 10:30:45.123 * {message}")
+
+        assert entry is not None
+        assert entry.metadata.get("event") == event
+        assert entry.level == level
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "15 Jan 2024 10:30:45.123 * Ready",
+            "replayed: 1234:M 15 Jan 2024 10:30:45.123 * Ready",
+        ],
+    )
+    def test_rejects_other_lines(self, line):
+        """Test lines not starting with a pid:role prefix are skipped."""
+        assert RedisParser().parse_line(line) is None
+
+
+class TestValidate:
+    """Test cases for parser validate() sample checks."""
+
+    @pytest.mark.parametrize(
+        ("parser_class", "sample"),
+        [
+            (HAProxyParser, HAPROXY_PREFIX + "fe be/srv 0/0/5 120 -- 1/1/0/0/0 0/0"),
+            (KubernetesParser, "2024-01-15T10:30:45.123Z INFO Starting application"),
+            (MySQLParser, "240115 10:30:45 [Warning] Aborted connection"),
+            (MySQLParser, "# Time: 2024-01-15T10:30:45.123456Z"),
+            (KubernetesParser, "3m Normal Pulled web-1 Image pulled"),
+        ],
+    )
+    def test_accepts_own_format(self, parser_class, sample):
+        """Test each parser recognises a sample of its own format."""
+        assert parser_class().validate(sample)
+
+    @pytest.mark.parametrize(
+        ("parser_class", "sample"),
+        [
+            (KubernetesParser, "Scaled Deployment/web to 3 replicas"),
+            (MySQLParser, "[MYSQLD]\nport = 3306"),
+        ],
+    )
+    def test_accepts_keywords(self, parser_class, sample):
+        """Test format keywords are found regardless of case."""
+        assert parser_class().validate(sample)
+
+    @pytest.mark.parametrize("parser_class", [HAProxyParser, KubernetesParser, MySQLParser])
+    def test_rejects_other_format(self, parser_class):
+        """Test an unrelated syslog sample is not claimed."""
+        assert not parser_class().validate("Oct  5 10:15:30 host cron[1]: job started")
+
+
+class TestLogParserFactory:
+    """Test cases for LogParserFactory format detection."""
+
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            ("/var/log/auth.log", "auth"),
+            ("/srv/logs/nginx-access.log", "nginx"),
+            # Earlier formats in the registry win when several patterns match
+            ("/data/docker/mysql.log", "mysql"),
+            # Extensions and well-known names decide before any pattern
+            ("/srv/app/events.json", "json"),
+            ("/var/log/nginx/export.XML", "windows"),
+            ("/home/ops/secure", "auth"),
+        ],
+    )
+    def test_detect_format_from_path(self, path, expected):
+        """Test formats are detected from the path without reading the file."""
+        assert LogParserFactory._detect_format(Path(path)) == expected
+
+    @pytest.mark.parametrize(
+        ("format_type", "parser_class"),
+        [("JSON", JSONParser), ("k8s", KubernetesParser), ("MariaDB", MySQLParser)],
+    )
+    def test_create_parser_by_name(self, format_type, parser_class):
+        """Test formats are looked up case-insensitively, aliases included."""
+        assert type(LogParserFactory.create_parser(format_type)) is parser_class
+
+    @pytest.mark.parametrize("format_type", sorted(LogParserFactory._parsers))
+    def test_parsers_have_no_instance_dict(self, format_type):
+        """Test every built-in parser keeps its state in __slots__."""
+        assert not hasattr(LogParserFactory._parsers[format_type](), "__dict__")
+
+    def test_create_parser_unknown_format(self):
+        """Test an unknown format name is rejected."""
+        with pytest.raises(ValueError, match="Unknown format"):
+            LogParserFactory.create_parser("nosuchformat")
+
+    def test_detect_format_from_file_head(self, tmp_path):
+        """Test files with no path hints are sniffed from their first lines."""
+        log_file = tmp_path / "app.log"
+        log_file.write_text("\n\n" + COMBINED_LINE + "\n" + "x" * 10000 + "\n")
+
+        assert LogParserFactory._detect_format(log_file) == "nginx"
+
+    @pytest.mark.parametrize(
+        ("lines", "expected"),
+        [
+            (['{"msg": "a"}', '{"msg": "b"}'], "json"),
+            ([COMBINED_LINE], "nginx"),
+            (["Oct  5 10:15:30 host sshd[1]: Accepted password for bob"], "auth"),
+            (["Oct  5 10:15:30 host cron[1]: job started"], "syslog"),
+            ([], None),
+        ],
+    )
+    def test_detect_format_from_content(self, lines, expected):
+        """Test sample lines are sniffed to the right format."""
+        assert LogParserFactory._detect_format_from_content(lines) == expected
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
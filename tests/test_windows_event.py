@@ -1,5 +1,7 @@
 """Tests for Windows Event Log parser"""
 
+from datetime import datetime
+
 import pytest
 
 from loggem.parsers.windows_event import WindowsEventLogParser
@@ -114,6 +116,64 @@ def test_minimal_xml_event(parser):
     assert entry is None
 
 
+def test_text_event_labels(parser):
+    """Test every colon line becomes metadata, including indented and empty fields"""
+    text_event = """Log Name: Security
+Source: Microsoft-Windows-Security-Auditing
+Date: 10/5/2025 2:30:45 PM
+Event ID: 4624
+User:
+Description: An account was successfully logged on.
+
+Subject:
+\tAccount Name:\t\tSERVER01$"""
+
+    entry = parser.parse_line(text_event)
+
+    assert entry is not None
+    assert entry.timestamp == datetime(2025, 10, 5, 14, 30, 45)
+    assert entry.metadata["channel"] == "Security"
+    assert entry.metadata["provider"] == "Microsoft-Windows-Security-Auditing"
+    assert entry.metadata["user"] == ""
+    assert entry.metadata["account_name"] == "SERVER01$"
+
+
+SCANNED_EVENT = """<Event xmlns='http://schemas.microsoft.com/win/2004/08/events/event'>
+    <System>
+        <Provider Name='Microsoft-Windows-Security-Auditing' Guid='{54849625}'/>
+        <EventID Qualifiers='0'>4625</EventID>
+        <Level>0</Level>
+        <TimeCreated SystemTime="2025-10-05T14:30:45.123456Z"/>
+        <Computer>SERVER01</Computer>
+        <Channel>Security</Channel>
+    </System>
+    <EventData>
+        <Data Name='TargetUserName'>USER01</Data>
+        <Data Name='Empty'/>
+        <Data>unnamed</Data>
+    </EventData>
+</Event>"""
+
+
+@pytest.mark.parametrize(
+    "xml_event",
+    [
+        SCANNED_EVENT,
+        SCANNED_EVENT.replace("USER01", "R&amp;D"),
+        SCANNED_EVENT.replace("<EventData>", "<EventData><!-- note -->"),
+    ],
+)
+def test_xml_fast_path_matches_elementtree(parser, xml_event):
+    """Test the regex fast path extracts the same fields as ElementTree"""
+    entry = parser.parse_line(xml_event)
+
+    assert entry is not None
+    assert entry.timestamp is not None
+    assert entry.metadata["event_data"] == parser._read_xml_event(xml_event)[6]
+    assert entry.metadata["provider"] == "Microsoft-Windows-Security-Auditing"
+    assert entry.metadata["event_description"] == "Account Logon Failed"
+
+
 def test_application_event_description(parser):
     """Test application event descriptions"""
     desc = parser._get_event_description(1000, "Application")
@@ -127,3 +187,19 @@ def test_unknown_event_id(parser):
     """Test handling of unknown event IDs"""
     desc = parser._get_event_description(99999, "Security")
     assert desc is None
+
+
+@pytest.mark.parametrize(
+    ("timestamp", "expected"),
+    [
+        ("10/5/2025 2:30:45 PM", datetime(2025, 10, 5, 14, 30, 45)),
+        ("10/5/2025 12:05:00 am", datetime(2025, 10, 5, 0, 5, 0)),
+        ("10/5/2025 14:30:45", datetime(2025, 10, 5, 14, 30, 45)),
+        ("2025-10-05 14:30:45", datetime(2025, 10, 5, 14, 30, 45)),
+        ("10/5/2025 13:30:45 PM", None),
+        ("yesterday", None),
+    ],
+)
+def test_text_timestamp_formats(parser, timestamp, expected):
+    """Test text event timestamps in each supported layout"""
+    assert parser._parse_text_timestamp(timestamp) == expected